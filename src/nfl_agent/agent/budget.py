@@ -0,0 +1,114 @@
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langgraph.constants import START
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_STEPS = 6
+DEFAULT_MAX_LLM_CALLS = 12
+
+
+class LLMBudgetExceeded(Exception):
+    pass
+
+
+@dataclass
+class TurnMetrics:
+    steps: int
+    nodes: List[str]
+    llm_calls: int
+    seconds: float
+    complete: bool = True
+    budget_exceeded: bool = False
+
+
+class TurnBudget(BaseCallbackHandler):
+    """Callback handler for one turn: counts graph steps and the nodes run
+    in them, and refuses LLM calls beyond ``max_llm_calls``.
+
+    The refusal is raised from the LLM call itself, so the assistant making
+    it fails the way it would on an API error and the turn carries on with
+    what it has.
+    """
+
+    raise_error = True
+    run_inline = True
+
+    def __init__(self, max_llm_calls: int = DEFAULT_MAX_LLM_CALLS):
+        self.max_llm_calls = max_llm_calls
+        self.llm_calls = 0
+        self.budget_exceeded = False
+        self._node_runs: Set[Tuple[int, str]] = set()
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def _llm_start(self) -> None:
+        with self._lock:
+            if self.llm_calls >= self.max_llm_calls:
+                self.budget_exceeded = True
+                raise LLMBudgetExceeded(
+                    f"LLM call budget of {self.max_llm_calls} per turn used up"
+                )
+            self.llm_calls += 1
+
+    def on_chat_model_start(self, *args: Any, **kwargs: Any) -> None:
+        self._llm_start()
+
+    def on_llm_start(self, *args: Any, **kwargs: Any) -> None:
+        self._llm_start()
+
+    def on_chain_start(
+        self, *args: Any, metadata: Optional[Dict] = None, **kwargs: Any
+    ) -> None:
+        # Graph input is written in a step of its own, which is not a node
+        if metadata and metadata.get("langgraph_node", START) != START:
+            with self._lock:
+                self._node_runs.add(
+                    (metadata.get("langgraph_step", 0), metadata["langgraph_node"])
+                )
+
+    def metrics(self, complete: bool = True) -> TurnMetrics:
+        runs = sorted(self._node_runs)
+        return TurnMetrics(
+            steps=len({step for step, _ in runs}),
+            nodes=[node for _, node in runs],
+            llm_calls=self.llm_calls,
+            seconds=time.perf_counter() - self._started,
+            complete=complete,
+            budget_exceeded=self.budget_exceeded,
+        )
+
+
+class TurnStats:
+    """Metrics of the most recent ``max_turns`` turns."""
+
+    def __init__(self, max_turns: int = 1000):
+        self.history: Deque[TurnMetrics] = deque(maxlen=max_turns)
+
+    def record(self, metrics: TurnMetrics) -> None:
+        self.history.append(metrics)
+        logger.info(
+            f"Turn took {metrics.steps} steps ({', '.join(metrics.nodes)}), "
+            f"{metrics.llm_calls} LLM calls, {metrics.seconds:.2f}s"
+        )
+
+    def summary(self) -> Dict[str, float]:
+        turns = list(self.history)
+        if not turns:
+            return {"turns": 0}
+        return {
+            "turns": len(turns),
+            "mean_steps": sum(t.steps for t in turns) / len(turns),
+            "max_steps": max(t.steps for t in turns),
+            "mean_llm_calls": sum(t.llm_calls for t in turns) / len(turns),
+            "max_llm_calls": max(t.llm_calls for t in turns),
+            "max_seconds": max(t.seconds for t in turns),
+            "incomplete": sum(not t.complete for t in turns),
+            "over_budget": sum(t.budget_exceeded for t in turns),
+        }
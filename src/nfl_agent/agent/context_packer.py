@@ -0,0 +1,182 @@
+import json
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_BUDGET = 1500
+DEFAULT_TOP_ROWS = 10
+# Columns listed in a table before the rest are left to the aggregates
+MAX_TABLE_COLUMNS = 12
+# Newest rows first when a table has these
+RECENCY_COLUMNS = ["season", "week"]
+
+
+def estimate_tokens(text: str) -> int:
+    """About four characters per token for English and CSV, close enough
+    to budget with and needing no tokenizer download."""
+    return math.ceil(len(text) / 4)
+
+
+@dataclass
+class PackedContext:
+    text: str
+    tokens: int
+    raw_tokens: int
+
+    @property
+    def saved(self) -> int:
+        return max(self.raw_tokens - self.tokens, 0)
+
+
+def _value(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:.4g}"
+    return str(value)
+
+
+def _rank(frame: pd.DataFrame) -> pd.DataFrame:
+    recency = [c for c in RECENCY_COLUMNS if c in frame.columns]
+    if recency:
+        return frame.sort_values(recency, ascending=False, kind="stable")
+    return frame
+
+
+def _table(name: str, page: Dict[str, Any], rows: int, max_columns: int) -> str:
+    """A ``records`` page as a compact CSV table of its top ``rows`` rows,
+    with constant columns stated once and per-column aggregates for the
+    numeric columns."""
+    frame = _rank(pd.DataFrame(page["records"]))
+    frame = frame.dropna(axis=1, how="all")
+    total = page.get("total", len(frame))
+    lines = [f"## {name}: {len(frame)} of {total} rows"]
+    constant = [
+        c
+        for c in frame.columns
+        if len(frame) > 1 and frame[c].astype(str).nunique() == 1
+    ]
+    if constant:
+        same = ", ".join(
+            f"{c}={_value(frame[c].iloc[0])}" for c in constant[:max_columns]
+        )
+        lines.append(f"same in every row: {same}")
+    varying = frame[[c for c in frame.columns if c not in constant]]
+    numeric = varying.select_dtypes(include="number").iloc[:, :max_columns]
+    if rows > 0 and not varying.empty:
+        shown = varying.iloc[:rows, :max_columns]
+        lines.append(",".join(map(str, shown.columns)))
+        lines.extend(
+            ",".join(_value(v) for v in record)
+            for record in shown.itertuples(index=False)
+        )
+        if len(varying) > rows:
+            lines.append(f"... {len(varying) - rows} more rows")
+    if len(frame) > rows and not numeric.empty:
+        aggregates = numeric.agg(["mean", "min", "max", "sum"])
+        lines.append("column: mean/min/max/sum")
+        lines.extend(
+            f"{c}: " + "/".join(_value(v) for v in aggregates[c])
+            for c in numeric.columns
+        )
+    for key, value in page.items():
+        if key not in ("records", "total", "offset") and value is not None:
+            lines.append(f"{key}: {json.dumps(value, default=str)}")
+    return "\n".join(lines)
+
+
+def _is_page(value: Any) -> bool:
+    return isinstance(value, dict) and isinstance(value.get("records"), list)
+
+
+class ContextPacker:
+    """Fits tool output into ``budget`` tokens before it reaches the LLM.
+
+    Result pages (``{"records": [...]}``, alone or per dataset) become
+    compact tables: newest rows first, constant columns stated once,
+    per-column aggregates for what is left out. Rows are halved, then
+    columns, until the whole response fits; anything else is serialized
+    as JSON and cut at the budget. Tokens before and after are recorded per
+    call.
+    """
+
+    def __init__(
+        self,
+        budget: int = DEFAULT_TOKEN_BUDGET,
+        top_rows: int = DEFAULT_TOP_ROWS,
+        count_tokens: Callable[[str], int] = estimate_tokens,
+    ):
+        self.budget = budget
+        self.top_rows = top_rows
+        self.count_tokens = count_tokens
+        self.calls = 0
+        self.raw_tokens = 0
+        self.packed_tokens = 0
+
+    def pack(self, output: Any, name: str = "tool") -> PackedContext:
+        raw = output if isinstance(output, str) else json.dumps(output, default=str)
+        raw_tokens = self.count_tokens(raw)
+        if raw_tokens <= self.budget:
+            text = raw
+        else:
+            text = self._fit(output, raw)
+        packed = PackedContext(text, self.count_tokens(text), raw_tokens)
+        self.calls += 1
+        self.raw_tokens += packed.raw_tokens
+        self.packed_tokens += packed.tokens
+        logger.info(
+            f"{name} output: {packed.raw_tokens} -> {packed.tokens} tokens "
+            f"({packed.saved} saved)"
+        )
+        return packed
+
+    def _pages(self, output: Any) -> Optional[Tuple[List[Tuple[str, Any]], Dict]]:
+        if _is_page(output):
+            return [("result", output)], {}
+        if isinstance(output, dict) and any(_is_page(v) for v in output.values()):
+            pages = [(k, v) for k, v in output.items() if _is_page(v)]
+            rest = {k: v for k, v in output.items() if not _is_page(v)}
+            return pages, rest
+        return None
+
+    def _fit(self, output: Any, raw: str) -> str:
+        split = self._pages(output)
+        if split is None:
+            return self._truncate(raw)
+        pages, rest = split
+        header = json.dumps(rest, default=str) if rest else ""
+        rows, columns = self.top_rows, MAX_TABLE_COLUMNS
+        while True:
+            sections = [header] if header else []
+            sections += [_table(name, page, rows, columns) for name, page in pages]
+            text = "\n\n".join(sections)
+            if self.count_tokens(text) <= self.budget:
+                return text
+            # Fewer rows, then fewer columns, then aggregates alone
+            if rows > 1:
+                rows //= 2
+            elif columns > 3:
+                columns //= 2
+            elif rows:
+                rows = 0
+            else:
+                return self._truncate(text)
+
+    def _truncate(self, text: str) -> str:
+        marker = "\n[truncated]"
+        # Shrink by the overshoot until the estimate fits
+        while self.count_tokens(text) > self.budget and text:
+            over = self.count_tokens(text) - self.budget + self.count_tokens(marker)
+            text = text[: max(len(text) - over * 4, 0)]
+        return text + marker
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "raw_tokens": self.raw_tokens,
+            "packed_tokens": self.packed_tokens,
+            "saved_tokens": max(self.raw_tokens - self.packed_tokens, 0),
+        }
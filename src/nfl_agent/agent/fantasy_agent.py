@@ -1,13 +1,47 @@
 import logging
 import os
+import sqlite3
 import uuid
-from typing import Annotated, Literal, Optional
-
+from collections.abc import AsyncIterator, Iterator
+from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple
+
+import aiosqlite
+from agent.budget import DEFAULT_MAX_LLM_CALLS, DEFAULT_MAX_STEPS, TurnBudget, TurnStats
+from agent.context_packer import DEFAULT_TOKEN_BUDGET, ContextPacker
+from agent.history import (
+    DEFAULT_HISTORY_TURNS,
+    context_messages,
+    expired,
+    fallback_summary,
+    fingerprint,
+    removals,
+    summary_prompt,
+)
+from agent.intent_classifier import IntentClassifier, default_classifier
+from agent.response_cache import ResponseCache
+from agent.routing import (
+    BRANCH_NAMES,
+    INTENT_NODES,
+    MERGE_NODE,
+    MERGED_NAME,
+    ROUTER_NAME,
+    detect_intents,
+    last_human_index,
+    merge_results,
+    named_intents,
+)
+from agent.streaming import RESPONSE, STREAM_MODES, agraph_events, graph_events
 from dotenv import find_dotenv, load_dotenv
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.tools import Tool
+from langchain_core.runnables import RunnableLambda
+from langchain_core.tools import BaseTool, StructuredTool
 from langchain_openai import ChatOpenAI
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from langgraph.constants import TAG_NOSTREAM
+from langgraph.errors import GraphRecursionError
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.message import AnyMessage, add_messages
 from tools.stats_retriever import StatsRetriever
@@ -35,6 +69,12 @@ def update_dialog_stack(left: list[str], right: Optional[str]) -> list[str]:
 class State(TypedDict):
     messages: Annotated[list[AnyMessage], add_messages]
     user_info: str
+    # Specialists the router picked for the latest human message
+    intents: List[str]
+    # Set once the turn has its answer; the graph ends there
+    turn_complete: bool
+    # Turns that fell out of the history window, summarized
+    summary: str
     dialog_state: Annotated[  # noqa: F841
         list[Literal["main_assistant", "stats", "news", "trade", "waiver", "team"]],
         update_dialog_stack,
@@ -52,32 +92,39 @@ team_manager = TeamManager(
     password=os.getenv("CBS_PASSWORD"),
 )
 
-# Define tools using Tool class
+# Define tools with argument schemas taken from the function signatures, so
+# the model can call them with structured arguments
 tools = [
-    Tool(
+    StructuredTool.from_function(
         name="GetStats",
         func=stats_retriever.get_stats,
-        description="Retrieve various statistics for players, teams, drafts, officials, schedules, injuries, and snap counts.",
+        description=(
+            "Retrieve various statistics for players, teams, drafts, officials, "
+            "schedules, injuries, and snap counts. `query` uses the GetStats query "
+            "syntax, e.g. 'player Travis Kelce, weeks 3-8, receiving columns only'."
+        ),
     ),
-    Tool(
+    StructuredTool.from_function(
         name="SearchNews",
         func=web_search.search,
+        coroutine=web_search.asearch,
         description="Search for latest player news",
     ),
-    Tool(
+    StructuredTool.from_function(
         name="EvaluateTrade",
         func=trade_evaluator.evaluate_trade,
-        description="Evaluate potential trades",
+        description="Evaluate potential trades: the player names offered and requested",
     ),
-    Tool(
+    StructuredTool.from_function(
         name="CheckWaiverWire",
         func=waiver_wire.check_waiver_wire,
         description="Check the waiver wire for hot players",
     ),
-    Tool(
+    StructuredTool.from_function(
         name="ManageTeam",
         func=team_manager.manage_team,
-        description="Manage your fantasy team roster",
+        coroutine=team_manager.amanage_team,
+        description="Manage your fantasy team roster: action 'get_roster', or 'update_roster' with a player_id and an action_type such as 'add' or 'drop'",
     ),
 ]
 
@@ -88,6 +135,18 @@ llm = ChatOpenAI(
     model="gpt-3.5-turbo",
 )
 
+# Conversations are checkpointed per thread; the last HISTORY_TURNS turns
+# are sent to the LLMs as they were, older ones as a summary
+HISTORY_TURNS = int(os.getenv("NFL_AGENT_HISTORY_TURNS", DEFAULT_HISTORY_TURNS))
+# Tool output beyond this many tokens is packed into tables and aggregates
+context_packer = ContextPacker(
+    budget=int(os.getenv("NFL_AGENT_TOOL_TOKENS", DEFAULT_TOKEN_BUDGET))
+)
+CHECKPOINT_PATH = os.getenv(
+    "NFL_AGENT_CHECKPOINTS",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".nfl_sessions.sqlite"),
+)
+
 # Prompt templates
 main_assistant_prompt = ChatPromptTemplate.from_messages(
     [
@@ -141,6 +200,11 @@ Example queries for the GetStats tool:
 - GetStats: schedules season [year]
 - GetStats: injuries team [team abbreviation]
 - GetStats: snap counts season [year]
+- GetStats: player [player name], weeks [first]-[last], receiving columns only
+- GetStats: player [player name] last [n] weeks
+- GetStats: pbp player [player name] redzone columns only (red-zone targets, goal-line carries, air yards and EPA from play-by-play)
+Results are paged (25 rows by default). Append "limit [n]", "columns [a,b,...]", "cursor [next_cursor]" or "summary" to any query to bound, project, page or aggregate the result.
+Results carry a "freshness" field (age of the data, whether it is stale and being refreshed); mention it when the data is stale.
 
 Remember to interpret and analyze the statistics, don't just list them. Provide insights that would be valuable for fantasy football managers.""",
         ),
@@ -228,223 +292,577 @@ When assisting with team management:
 )
 
 
+def _for_model(messages: List[AnyMessage]) -> List[AnyMessage]:
+    # Names are display names used to merge branches; OpenAI rejects names
+    # with whitespace, so they are not sent
+    return [m.model_copy(update={"name": None}) for m in messages]
+
+
 class Assistant:
     def __init__(
         self,
         prompt_template: ChatPromptTemplate,
-        tool: Optional[Tool] = None,
+        tool: Optional[BaseTool] = None,
         name: str = "Unnamed",
     ):
         self.prompt_template = prompt_template
         self.tool = tool
         self.name = name
 
-    def __call__(self, state: State) -> State:
+    @property
+    def llm(self):
+        # One call decides whether to use the tool and fills in its arguments
+        return llm.bind_tools([self.tool]) if self.tool else llm
+
+    def _task(self, state: State) -> List[AnyMessage]:
+        messages = state["messages"]
+        system_message = self.prompt_template.messages[0]
+        # The latest human message, even after the router has replied to it
+        human = last_human_index(messages)
+        user_input = messages[human].content if human >= 0 else ""
+        logger.info(f"{self.name} received input: {user_input}")
+        return [
+            SystemMessage(content=system_message.prompt.template),
+            *context_messages(messages, state.get("summary", ""), HISTORY_TURNS),
+            HumanMessage(content=user_input),
+        ]
+
+    def _decision(self, response: AIMessage) -> AIMessage:
+        logger.info(f"{self.name} response: {response.content or response.tool_calls}")
+        return AIMessage(
+            content=response.content, tool_calls=response.tool_calls, name=self.name
+        )
+
+    def _tool_message(self, tool_call: dict, tool_response) -> ToolMessage:
+        logger.info(
+            f"{self.name} used tool {self.tool.name}. Response: {tool_response}"
+        )
+        if tool_response is None:
+            tool_response = f"{self.tool.name} failed."
+        return ToolMessage(
+            content=context_packer.pack(tool_response, name=self.tool.name).text,
+            tool_call_id=tool_call["id"],
+            name=self.tool.name,
+        )
+
+    def _answer(self, content: str) -> AIMessage:
+        logger.info(f"{self.name} interpretation of tool response: {content}")
+        return AIMessage(content=content, name=self.name)
+
+    def __call__(self, state: State) -> dict:
+        # Only the new messages are returned, so specialists running in
+        # parallel branches each add their own without overwriting the others
+        new_messages = []
         try:
-            messages = state["messages"]
-            system_message = self.prompt_template.messages[0]
-            task_description = system_message.prompt.template
-            user_input = (
-                messages[-1].content if isinstance(messages[-1], HumanMessage) else ""
-            )
-            prompt = f"{task_description}\n{user_input}"
-
-            logger.info(f"{self.name} received input: {user_input}")
-
+            prompt = self._task(state)
             try:
-                response = llm.invoke([{"role": "user", "content": prompt}])
+                response = self.llm.invoke(prompt)
             except Exception as e:
                 logger.error(
                     f"Error invoking LLM in {self.name}: {str(e)}", exc_info=False
                 )
-                return state
-            if isinstance(response, AIMessage):
-                ai_content = response.content
-            else:
-                ai_content = str(response)
-
-            logger.info(f"{self.name} response: {ai_content}")
-
-            messages.append(AIMessage(content=ai_content))
-
-            if self.tool and self.should_use_tool(ai_content):
-                tool_response = self.use_tool(user_input)
-                if tool_response:
-                    logger.info(
-                        f"{self.name} used tool {self.tool.name}. Response: {tool_response}"
-                    )
-                    messages.append(
-                        AIMessage(content=f"Tool response: {tool_response}")
-                    )
-                    interpretation_prompt = f"{task_description}\nTool response: {tool_response}\nPlease interpret this data and provide insights for the user."
-                    interpretation = llm.invoke(
-                        [{"role": "user", "content": interpretation_prompt}]
-                    )
-                    if isinstance(interpretation, AIMessage):
-                        interpretation_content = interpretation.content
-                    else:
-                        interpretation_content = str(interpretation)
-
-                    logger.info(
-                        f"{self.name} interpretation of tool response: {interpretation_content}"
-                    )
-                    messages.append(AIMessage(content=interpretation_content))
+                return {"messages": new_messages}
+            new_messages.append(self._decision(response))
+
+            if self.tool and response.tool_calls:
+                for tool_call in response.tool_calls:
+                    tool_response = self.use_tool(tool_call["args"])
+                    new_messages.append(self._tool_message(tool_call, tool_response))
+                # The answer is streamed from the tool result, token by token
+                content = "".join(
+                    chunk.content
+                    for chunk in llm.stream(_for_model(prompt + new_messages))
+                )
+                new_messages.append(self._answer(content))
 
             # Log the dialog state to make its usage explicit
             logger.info(f"Current dialog state: {state['dialog_state']}")
 
-            state["messages"] = messages
-            return state
+            return {"messages": new_messages}
         except Exception as e:
             logger.error(f"Error in {self.name}: {str(e)}", exc_info=True)
-            return state
+            return {"messages": new_messages}
 
-    def use_tool(self, user_input: str) -> Optional[str]:
+    async def acall(self, state: State) -> dict:
+        """Async twin of ``__call__``: the LLM and the tool are awaited, so
+        one event loop can serve many sessions at once."""
+        new_messages = []
+        try:
+            prompt = self._task(state)
+            try:
+                response = await self.llm.ainvoke(prompt)
+            except Exception as e:
+                logger.error(
+                    f"Error invoking LLM in {self.name}: {str(e)}", exc_info=False
+                )
+                return {"messages": new_messages}
+            new_messages.append(self._decision(response))
+
+            if self.tool and response.tool_calls:
+                for tool_call in response.tool_calls:
+                    tool_response = await self.ause_tool(tool_call["args"])
+                    new_messages.append(self._tool_message(tool_call, tool_response))
+                chunks = [
+                    chunk.content
+                    async for chunk in llm.astream(_for_model(prompt + new_messages))
+                ]
+                new_messages.append(self._answer("".join(chunks)))
+
+            return {"messages": new_messages}
+        except Exception as e:
+            logger.error(f"Error in {self.name}: {str(e)}", exc_info=True)
+            return {"messages": new_messages}
+
+    def use_tool(self, tool_input: Dict[str, Any]) -> Optional[Any]:
         if self.tool:
             try:
-                return self.tool.func(user_input)
+                return self.tool.invoke(tool_input)
             except Exception as e:
                 logger.error(
                     f"Error using tool {self.tool.name} in {self.name}: {str(e)}"
                 )
         return None
 
-    def should_use_tool(self, response: str) -> bool:
-        return self.tool is not None and self.tool.name.lower() in response.lower()
+    async def ause_tool(self, tool_input: Dict[str, Any]) -> Optional[Any]:
+        if self.tool:
+            try:
+                # Tools without a coroutine run in a worker thread
+                return await self.tool.ainvoke(tool_input)
+            except Exception as e:
+                logger.error(
+                    f"Error using tool {self.tool.name} in {self.name}: {str(e)}"
+                )
+        return None
 
 
 # Specialized assistant definitions
-main_assistant = Assistant(prompt_template=main_assistant_prompt, name="Main Assistant")
+main_assistant = Assistant(prompt_template=main_assistant_prompt, name=ROUTER_NAME)
 stats_assistant = Assistant(
-    prompt_template=stats_assistant_prompt, tool=tools[0], name="Stats Assistant"
+    prompt_template=stats_assistant_prompt, tool=tools[0], name=BRANCH_NAMES["stats"]
 )
 news_assistant = Assistant(
-    prompt_template=news_assistant_prompt, tool=tools[1], name="News Assistant"
+    prompt_template=news_assistant_prompt, tool=tools[1], name=BRANCH_NAMES["news"]
 )
 trade_assistant = Assistant(
-    prompt_template=trade_assistant_prompt, tool=tools[2], name="Trade Assistant"
+    prompt_template=trade_assistant_prompt, tool=tools[2], name=BRANCH_NAMES["trade"]
 )
 waiver_assistant = Assistant(
-    prompt_template=waiver_assistant_prompt, tool=tools[3], name="Waiver Assistant"
+    prompt_template=waiver_assistant_prompt, tool=tools[3], name=BRANCH_NAMES["waiver"]
 )
 team_management_assistant = Assistant(
     prompt_template=team_management_prompt,
     tool=tools[4],
-    name="Team Management Assistant",
+    name=BRANCH_NAMES["team"],
 )
+
+
+class Router:
+    """First node of every turn. The local intent classifier picks the
+    specialists; only turns it cannot call confidently (greetings, vague
+    follow-ups) cost a call to the main assistant's LLM."""
+
+    def __init__(self, assistant: Assistant, classifier: IntentClassifier):
+        self.assistant = assistant
+        self.classifier = classifier
+        self.name = assistant.name
+        self.local_routes = 0
+        self.llm_routes = 0
+
+    def _classify(self, state: State) -> Optional[dict]:
+        messages = state["messages"]
+        human = last_human_index(messages)
+        if human < 0:
+            return {"intents": [], "turn_complete": True}
+        prediction = self.classifier.predict(messages[human].content)
+        if not prediction.confident:
+            logger.info(f"Intent unclear ({prediction.probabilities}), asking the LLM")
+            return None
+        self.local_routes += 1
+        logger.info(f"Routed locally to {prediction.intents}")
+        return {"intents": prediction.intents}
+
+    def _from_reply(self, state: State, update: dict) -> dict:
+        self.llm_routes += 1
+        messages = state["messages"]
+        reply = update["messages"][-1].content if update["messages"] else ""
+        intents = named_intents(reply) or detect_intents(
+            messages[last_human_index(messages)].content
+        )
+        # Without a specialist to hand over to, the reply is the answer
+        return {**update, "intents": intents, "turn_complete": not intents}
+
+    def __call__(self, state: State) -> dict:
+        routed = self._classify(state)
+        if routed is not None:
+            return routed
+        return self._from_reply(state, self.assistant(state))
+
+    async def acall(self, state: State) -> dict:
+        routed = self._classify(state)
+        if routed is not None:
+            return routed
+        return self._from_reply(state, await self.assistant.acall(state))
+
+    def stats(self) -> Dict[str, int]:
+        return {"local_routes": self.local_routes, "llm_routes": self.llm_routes}
+
+
+router = Router(main_assistant, default_classifier())
+
+
+def finish_turn(state: State) -> dict:
+    return {**merge_results(state), "turn_complete": True}
+
+
+def _summary_llm():
+    # The summary is internal, so its tokens are not streamed to the user
+    return llm.with_config(tags=[TAG_NOSTREAM])
+
+
+def compact_history(state: State) -> dict:
+    """Fold turns that left the history window into the summary and drop
+    their messages from the checkpoint."""
+    old = expired(state["messages"], HISTORY_TURNS)
+    if not old:
+        return {}
+    summary = state.get("summary", "")
+    try:
+        summary = _summary_llm().invoke(summary_prompt(summary, old)).content
+    except Exception as e:
+        logger.error(f"Error summarizing the conversation: {str(e)}")
+        summary = fallback_summary(summary, old)
+    logger.info(f"Summarized {len(old)} messages of earlier turns")
+    return {"summary": summary, "messages": removals(old)}
+
+
+async def acompact_history(state: State) -> dict:
+    old = expired(state["messages"], HISTORY_TURNS)
+    if not old:
+        return {}
+    summary = state.get("summary", "")
+    try:
+        prompt = summary_prompt(summary, old)
+        summary = (await _summary_llm().ainvoke(prompt)).content
+    except Exception as e:
+        logger.error(f"Error summarizing the conversation: {str(e)}")
+        summary = fallback_summary(summary, old)
+    logger.info(f"Summarized {len(old)} messages of earlier turns")
+    return {"summary": summary, "messages": removals(old)}
+
+
+def _node(assistant: Assistant) -> RunnableLambda:
+    # Graph nodes with both paths: invoke() runs __call__, ainvoke() acall
+    return RunnableLambda(assistant, afunc=assistant.acall, name=assistant.name)
+
+
 # Graph definition
 graph = StateGraph(State)
 
 # Add nodes
-graph.add_node("main_assistant", main_assistant)
-graph.add_node("stats_assistant", stats_assistant)
-graph.add_node("news_assistant", news_assistant)
-graph.add_node("trade_assistant", trade_assistant)
-graph.add_node("waiver_assistant", waiver_assistant)
-graph.add_node("team_management_assistant", team_management_assistant)
+graph.add_node(
+    "compact_history",
+    RunnableLambda(compact_history, afunc=acompact_history, name="compact_history"),
+)
+graph.add_node("main_assistant", _node(router))
+graph.add_node("stats_assistant", _node(stats_assistant))
+graph.add_node("news_assistant", _node(news_assistant))
+graph.add_node("trade_assistant", _node(trade_assistant))
+graph.add_node("waiver_assistant", _node(waiver_assistant))
+graph.add_node("team_management_assistant", _node(team_management_assistant))
+graph.add_node(MERGE_NODE, finish_turn)
 
 # Add edges
-graph.add_edge(START, "main_assistant")
+graph.add_edge(START, "compact_history")
+graph.add_edge("compact_history", "main_assistant")
 
 
 def route_intent(state: State):
-    last_message = state["messages"][-1]
-    if isinstance(last_message, HumanMessage):
-        content = last_message.content.lower()
-        if any(
-            keyword in content
-            for keyword in ["statistics", "stats", "numbers", "performance"]
-        ):
-            state["dialog_state"].append("stats")
-            logger.info(f"Dialog state updated: {state['dialog_state']}")
-            return "stats_assistant"
-        elif any(
-            keyword in content for keyword in ["news", "update", "latest", "injury"]
-        ):
-            state["dialog_state"].append("news")
-            logger.info(f"Dialog state updated: {state['dialog_state']}")
-            return "news_assistant"
-        elif any(keyword in content for keyword in ["trade", "exchange", "deal"]):
-            state["dialog_state"].append("trade")
-            logger.info(f"Dialog state updated: {state['dialog_state']}")
-            return "trade_assistant"
-        elif any(keyword in content for keyword in ["waiver", "free agent", "pickup"]):
-            state["dialog_state"].append("waiver")
-            logger.info(f"Dialog state updated: {state['dialog_state']}")
-            return "waiver_assistant"
-        elif any(
-            keyword in content for keyword in ["manage", "roster", "lineup", "team"]
-        ):
-            state["dialog_state"].append("team")
-            logger.info(f"Dialog state updated: {state['dialog_state']}")
-            return "team_management_assistant"
-    return END
+    """Every specialist the router picked; LangGraph runs them as parallel
+    branches, so a compound question costs its slowest branch."""
+    intents = state.get("intents") or []
+    if state.get("turn_complete") or not intents:
+        return END
+    logger.info(f"Dialog state updated: {state['dialog_state'] + intents}")
+    return [INTENT_NODES[intent] for intent in intents]
 
 
 graph.add_conditional_edges(
     "main_assistant",
     route_intent,
-    {
-        "stats_assistant": "stats_assistant",
-        "news_assistant": "news_assistant",
-        "trade_assistant": "trade_assistant",
-        "waiver_assistant": "waiver_assistant",
-        "team_management_assistant": "team_management_assistant",
-        END: END,
-    },
+    {**{node: node for node in INTENT_NODES.values()}, END: END},
 )
 
-# Add edges from specialized assistants back to main assistant
-for assistant in [
-    "stats_assistant",
-    "news_assistant",
-    "trade_assistant",
-    "waiver_assistant",
-    "team_management_assistant",
-]:
-    graph.add_edge(assistant, "main_assistant")
+# Parallel branches join in the merge node, which ends the turn: the graph
+# is acyclic, so a turn is at most router -> specialists -> merge
+for assistant in INTENT_NODES.values():
+    graph.add_edge(assistant, MERGE_NODE)
+graph.add_edge(MERGE_NODE, END)
 
-# Compile the graph
-app = graph.compile()
+NO_RESPONSE = "I apologize, but I couldn't generate a proper response."
+
+# Intents whose answers only read stats, keyed on the registry's data
+# version; roster changes must run every time and news is not versioned
+CACHEABLE_INTENTS = {"stats"}
+
+
+def _cacheable(state: State) -> bool:
+    intents = state.get("intents") or []
+    return bool(intents) and set(intents) <= CACHEABLE_INTENTS
+
+
+def _response_cache() -> ResponseCache:
+    """Answers live no longer than the freshest dataset behind them and are
+    keyed on the registry's data version, so a refresh retires them."""
+    data_frames = stats_retriever.data_frames
+    if not hasattr(data_frames, "data_version"):
+        return ResponseCache()
+    ttl = min(data_frames.policy(name).ttl for name in data_frames)
+    return ResponseCache(ttl=ttl, version=data_frames.data_version)
 
 
 class FantasyFootballAgent:
-    def __init__(self):
-        self.app = app
+    """Conversations are checkpointed per ``thread_id`` (in SQLite at
+    ``NFL_AGENT_CHECKPOINTS`` unless a ``checkpointer`` is given), so a
+    thread resumes with its history, even after a restart. Calls without a
+    ``thread_id`` start a new thread.
+
+    Every turn is bounded: at most ``max_steps`` graph steps (LangGraph's
+    recursion limit) and ``max_llm_calls`` LLM calls. Per-turn metrics are
+    kept in ``turns``, tokens saved on tool output in ``context_packer``."""
+
+    def __init__(
+        self,
+        cache: Optional[ResponseCache] = None,
+        max_steps: Optional[int] = None,
+        max_llm_calls: Optional[int] = None,
+        checkpointer: Optional[BaseCheckpointSaver] = None,
+    ):
+        self.checkpointer = checkpointer or SqliteSaver(
+            sqlite3.connect(CHECKPOINT_PATH, check_same_thread=False)
+        )
+        self.app = graph.compile(checkpointer=self.checkpointer)
+        self._async_saver: Optional[AsyncSqliteSaver] = None
+        self._async_graph = None
+        self.router = router
+        self.context_packer = context_packer
+        self.cache = _response_cache() if cache is None else cache
+        self.max_steps = max_steps or int(
+            os.getenv("NFL_AGENT_MAX_STEPS", DEFAULT_MAX_STEPS)
+        )
+        self.max_llm_calls = max_llm_calls or int(
+            os.getenv("NFL_AGENT_MAX_LLM_CALLS", DEFAULT_MAX_LLM_CALLS)
+        )
+        self.turns = TurnStats()
+
+    def _async_app(self):
+        """The graph for async turns. SqliteSaver is sync only, so they get an
+        AsyncSqliteSaver on the same file (both use WAL), opened and compiled
+        once on first use; ``aclose`` closes its connection."""
+        if not isinstance(self.checkpointer, SqliteSaver):
+            return self.app
+        if self._async_graph is None:
+            database = self.checkpointer.conn.execute("PRAGMA database_list")
+            path = database.fetchone()[2] or CHECKPOINT_PATH
+            self._async_saver = AsyncSqliteSaver(aiosqlite.connect(path))
+            self._async_graph = graph.compile(checkpointer=self._async_saver)
+        return self._async_graph
+
+    async def aclose(self):
+        if self._async_saver is not None:
+            await self._async_saver.conn.close()
+            self._async_saver = None
+            self._async_graph = None
 
     def run(
         self, user_input: str, thread_id: Optional[str] = None, user_info: str = "User"
     ) -> str:
         try:
-            if thread_id is None:
-                thread_id = str(uuid.uuid4())
-            state_input = {
-                "messages": [HumanMessage(content=user_input)],
-                "user_info": user_info,
-                "dialog_state": ["main_assistant"],
-            }
-            logger.info(f"Processing input: {user_input}")
-
-            final_state = self.app.invoke(state_input)
-            messages = final_state["messages"]
-
-            # Extract all AI responses
-            ai_responses = [
-                msg.content for msg in messages if isinstance(msg, AIMessage)
-            ]
-
-            if ai_responses:
-                response = "\n".join(ai_responses)
-                logger.info(f"Assistant response: {response}")
-                logger.info(f"Dialog state: {final_state['dialog_state']}")
-                return response
-            else:
-                logger.warning("Couldn't generate a proper response")
-                return "I apologize, but I couldn't generate a proper response."
+            budget, config = self._turn(thread_id)
+            values = self.app.get_state(config).values
+            context, cached = self._cached_turn(user_input, values)
+            if cached is not None:
+                self.app.update_state(config, *self._record_turn(user_input, cached))
+                return cached
+            state_input = self._state_input(user_input, user_info, values)
+            try:
+                final_state = self.app.invoke(state_input, config)
+            except GraphRecursionError:
+                final_state = None
+            return self._finish(user_input, context, budget, final_state)
         except Exception as e:
             logger.error(f"Error in FantasyFootballAgent: {str(e)}", exc_info=True)
             raise  # Re-raise the exception to be caught in the main loop
 
+    async def arun(
+        self, user_input: str, thread_id: Optional[str] = None, user_info: str = "User"
+    ) -> str:
+        """Async ``run``: LLM and HTTP calls are awaited, so many sessions
+        can share one event loop."""
+        try:
+            app = self._async_app()
+            budget, config = self._turn(thread_id)
+            values = (await app.aget_state(config)).values
+            context, cached = self._cached_turn(user_input, values)
+            if cached is not None:
+                await app.aupdate_state(config, *self._record_turn(user_input, cached))
+                return cached
+            state_input = self._state_input(user_input, user_info, values)
+            try:
+                final_state = await app.ainvoke(state_input, config)
+            except GraphRecursionError:
+                final_state = None
+            return self._finish(user_input, context, budget, final_state)
+        except Exception as e:
+            logger.error(f"Error in FantasyFootballAgent: {str(e)}", exc_info=True)
+            raise
+
+    def stream(
+        self, user_input: str, thread_id: Optional[str] = None, user_info: str = "User"
+    ) -> Iterator[Dict[str, Any]]:
+        """``run`` as it happens: yields ``token`` events while the LLMs
+        generate, ``node`` events as graph nodes finish, and finally a
+        ``response`` event with what ``run`` would have returned."""
+        try:
+            budget, config = self._turn(thread_id)
+            values = self.app.get_state(config).values
+            context, cached = self._cached_turn(user_input, values)
+            if cached is not None:
+                self.app.update_state(config, *self._record_turn(user_input, cached))
+                yield {"event": RESPONSE, "content": cached}
+                return
+            state_input = self._state_input(user_input, user_info, values)
+            chunks = self.app.stream(state_input, config, stream_mode=STREAM_MODES)
+            try:
+                yield from graph_events(
+                    chunks,
+                    lambda state: self._finish(user_input, context, budget, state),
+                )
+            except GraphRecursionError:
+                content = self._finish(user_input, context, budget, None)
+                yield {"event": RESPONSE, "content": content}
+        except Exception as e:
+            logger.error(f"Error in FantasyFootballAgent: {str(e)}", exc_info=True)
+            raise
+
+    async def astream(
+        self, user_input: str, thread_id: Optional[str] = None, user_info: str = "User"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Async ``stream``."""
+        try:
+            app = self._async_app()
+            budget, config = self._turn(thread_id)
+            values = (await app.aget_state(config)).values
+            context, cached = self._cached_turn(user_input, values)
+            if cached is not None:
+                await app.aupdate_state(config, *self._record_turn(user_input, cached))
+                yield {"event": RESPONSE, "content": cached}
+                return
+            state_input = self._state_input(user_input, user_info, values)
+            chunks = app.astream(state_input, config, stream_mode=STREAM_MODES)
+            try:
+                async for event in agraph_events(
+                    chunks,
+                    lambda state: self._finish(user_input, context, budget, state),
+                ):
+                    yield event
+            except GraphRecursionError:
+                content = self._finish(user_input, context, budget, None)
+                yield {"event": RESPONSE, "content": content}
+        except Exception as e:
+            logger.error(f"Error in FantasyFootballAgent: {str(e)}", exc_info=True)
+            raise
+
+    def _turn(self, thread_id: Optional[str]) -> Tuple[TurnBudget, Dict[str, Any]]:
+        if thread_id is None:
+            thread_id = str(uuid.uuid4())
+        budget = TurnBudget(self.max_llm_calls)
+        return budget, {
+            "configurable": {"thread_id": thread_id},
+            "recursion_limit": self.max_steps,
+            "callbacks": [budget],
+        }
+
+    def _cached_turn(
+        self, user_input: str, values: Dict[str, Any]
+    ) -> Tuple[str, Optional[str]]:
+        """The fingerprint of the thread's recent history, which answers are
+        cached under, and the cached answer to ``user_input`` if any."""
+        context = fingerprint(
+            values.get("messages", []), values.get("summary", ""), HISTORY_TURNS
+        )
+        return context, self.cache.get(user_input, context)
+
+    @staticmethod
+    def _record_turn(user_input: str, response: str) -> Tuple[dict, str]:
+        """``update_state`` arguments that add a cached answer to the thread's
+        history, as if the turn had run."""
+        messages = [
+            HumanMessage(content=user_input),
+            AIMessage(content=response, name=MERGED_NAME),
+        ]
+        return {"messages": messages, "turn_complete": True}, MERGE_NODE
+
+    def _finish(
+        self,
+        user_input: str,
+        context: str,
+        budget: TurnBudget,
+        final_state: Optional[State],
+    ) -> str:
+        if final_state is None:
+            logger.warning(f"Turn stopped after {self.max_steps} graph steps")
+        complete = bool(final_state and final_state.get("turn_complete"))
+        metrics = budget.metrics(complete)
+        self.turns.record(metrics)
+        if final_state is None:
+            return NO_RESPONSE
+        response = self._response(final_state)
+        # Answers cut short by a budget are not worth reusing
+        reusable = complete and not metrics.budget_exceeded
+        if reusable and _cacheable(final_state) and response != NO_RESPONSE:
+            self.cache.put(user_input, response, context)
+        return response
+
+    @staticmethod
+    def _state_input(user_input: str, user_info: str, values: Dict[str, Any]) -> State:
+        logger.info(f"Processing input: {user_input}")
+        state_input = {
+            "messages": [HumanMessage(content=user_input)],
+            "user_info": user_info,
+            "intents": [],
+            "turn_complete": False,
+        }
+        # The dialog stack accumulates, so it is only seeded for a new thread
+        if not values:
+            state_input["dialog_state"] = ["main_assistant"]
+        return state_input
+
+    @staticmethod
+    def _response(final_state: State) -> str:
+        # Earlier turns of the thread are in the state too
+        messages = final_state["messages"]
+        messages = messages[last_human_index(messages) + 1 :]
+
+        # Extract all AI responses; answers of parallel specialists are
+        # replaced by their merged form
+        ai_responses = [
+            msg.content
+            for msg in messages
+            if isinstance(msg, AIMessage) and msg.content
+        ]
+        merged = [m for m in messages if getattr(m, "name", None) == MERGED_NAME]
+        if merged:
+            ai_responses = [merged[-1].content]
+
+        if ai_responses:
+            response = "\n".join(ai_responses)
+            logger.info(f"Assistant response: {response}")
+            logger.info(f"Dialog state: {final_state['dialog_state']}")
+            return response
+        else:
+            logger.warning("Couldn't generate a proper response")
+            return NO_RESPONSE
+
 
 if __name__ == "__main__":
     agent = FantasyFootballAgent()
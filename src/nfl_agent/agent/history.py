@@ -0,0 +1,118 @@
+import hashlib
+import logging
+from typing import List, Sequence
+
+from agent.routing import MERGED_NAME
+from langchain_core.messages import (
+    AIMessage,
+    AnyMessage,
+    HumanMessage,
+    RemoveMessage,
+    SystemMessage,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_TURNS = 4
+
+SUMMARY_PROMPT = """\
+Summarize this fantasy football conversation for an assistant that will
+continue it. Keep the players, teams, weeks and numbers discussed, the user's
+roster decisions and open questions. At most 120 words."""
+
+
+def split_turns(messages: Sequence[AnyMessage]) -> List[List[AnyMessage]]:
+    """Messages grouped per turn, each turn starting at a human message."""
+    turns: List[List[AnyMessage]] = []
+    for message in messages:
+        if isinstance(message, HumanMessage) or not turns:
+            turns.append([])
+        turns[-1].append(message)
+    return turns
+
+
+def _answer(turn: Sequence[AnyMessage]) -> str:
+    """What the user was shown: the merged answer if branches ran in
+    parallel, else every non-empty AI reply."""
+    replies = [m for m in turn if isinstance(m, AIMessage) and m.content]
+    merged = [m for m in replies if m.name == MERGED_NAME]
+    if merged:
+        return merged[-1].content
+    return "\n".join(m.content for m in replies)
+
+
+def context_messages(
+    messages: Sequence[AnyMessage],
+    summary: str = "",
+    turns: int = DEFAULT_HISTORY_TURNS,
+) -> List[AnyMessage]:
+    """Earlier turns as an LLM sees them: the summary of old turns, then the
+    last ``turns`` questions with their answers. Tool calls and tool output
+    are left out; the latest human message is not included."""
+    return _context(split_turns(messages)[:-1], summary, turns)
+
+
+def _context(
+    previous: List[List[AnyMessage]], summary: str, turns: int
+) -> List[AnyMessage]:
+    previous = previous[-turns:] if turns > 0 else []
+    context: List[AnyMessage] = []
+    if summary:
+        context.append(SystemMessage(content=f"Conversation so far: {summary}"))
+    for turn in previous:
+        if isinstance(turn[0], HumanMessage):
+            context.append(HumanMessage(content=turn[0].content))
+        answer = _answer(turn)
+        if answer:
+            context.append(AIMessage(content=answer))
+    return context
+
+
+def expired(
+    messages: Sequence[AnyMessage], turns: int = DEFAULT_HISTORY_TURNS
+) -> List[AnyMessage]:
+    """Messages of turns outside the window, once there are ``turns`` of
+    them, so old turns are summarized in batches rather than every turn."""
+    previous = split_turns(messages)[:-1]
+    if len(previous) < 2 * turns:
+        return []
+    return [m for turn in previous[:-turns] for m in turn]
+
+
+def summary_prompt(summary: str, old: Sequence[AnyMessage]) -> List[AnyMessage]:
+    lines = [f"Earlier summary: {summary}"] if summary else []
+    for turn in split_turns(old):
+        if isinstance(turn[0], HumanMessage):
+            lines.append(f"User: {turn[0].content}")
+        lines.append(f"Assistant: {_answer(turn)}")
+    return [
+        SystemMessage(content=SUMMARY_PROMPT),
+        HumanMessage(content="\n".join(lines)),
+    ]
+
+
+def fallback_summary(summary: str, old: Sequence[AnyMessage], limit: int = 1000) -> str:
+    """The questions asked, when the LLM cannot summarize."""
+    questions = [m.content for m in old if isinstance(m, HumanMessage)]
+    text = "; ".join(([summary] if summary else []) + questions)
+    return text[-limit:]
+
+
+def removals(old: Sequence[AnyMessage]) -> List[RemoveMessage]:
+    return [RemoveMessage(id=m.id) for m in old if m.id is not None]
+
+
+def fingerprint(
+    messages: Sequence[AnyMessage],
+    summary: str = "",
+    turns: int = DEFAULT_HISTORY_TURNS,
+) -> str:
+    """Identifies the context the next question in a conversation is asked
+    in, from the messages before it; empty for a new conversation."""
+    context = _context(split_turns(messages), summary, turns)
+    if not context:
+        return ""
+    digest = hashlib.blake2b(digest_size=8)
+    for message in context:
+        digest.update(f"{message.type}:{message.content}\n".encode())
+    return digest.hexdigest()
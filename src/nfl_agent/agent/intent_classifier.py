@@ -0,0 +1,140 @@
+import logging
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from agent.intent_examples import EXAMPLES
+from agent.routing import INTENT_KEYWORDS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD = 0.75
+
+_TOKEN = re.compile(r"[a-z]+|\d+")
+
+
+def _features(text: str) -> List[str]:
+    content = text.lower()
+    words = ["<num>" if w.isdigit() else w for w in _TOKEN.findall(content)]
+    # Word stems ("injur" for injury/injured/injuries) and the routing
+    # keywords help with phrasings the training queries do not cover
+    stems = [f"{w[:5]}~" for w in words if len(w) > 5]
+    keywords = [
+        f"<{intent}>"
+        for intent, words_ in INTENT_KEYWORDS.items()
+        for keyword in words_
+        if keyword in content
+    ]
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])] + stems + keywords
+
+
+@dataclass
+class IntentPrediction:
+    intents: List[str]
+    probabilities: Dict[str, float]
+    # False when any intent is too close to call; the caller should ask the LLM
+    confident: bool
+
+
+class IntentClassifier:
+    """TF-IDF over word unigrams and bigrams, with one logistic regression
+    per intent so a compound question can carry several intents.
+
+    A prediction is ``confident`` when at least one intent is predicted and
+    every intent's probability is at least ``threshold`` or at most
+    ``1 - threshold``.
+    """
+
+    def __init__(
+        self,
+        intents: Sequence[str] = tuple(INTENT_KEYWORDS),
+        threshold: float = DEFAULT_THRESHOLD,
+        l2: float = 1e-5,
+        epochs: int = 2000,
+        learning_rate: float = 4.0,
+    ):
+        self.intents = list(intents)
+        self.threshold = threshold
+        self.l2 = l2
+        self.epochs = epochs
+        self.learning_rate = learning_rate
+        self.vocabulary: Dict[str, int] = {}
+        self.idf: Optional[np.ndarray] = None
+        self.weights: Optional[np.ndarray] = None
+        self.bias: Optional[np.ndarray] = None
+
+    def _transform(self, texts: Sequence[str]) -> np.ndarray:
+        matrix = np.zeros((len(texts), len(self.vocabulary)), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, count in Counter(_features(text)).items():
+                column = self.vocabulary.get(feature)
+                if column is not None:
+                    matrix[row, column] = 1.0 + math.log(count)
+        matrix *= self.idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1.0, norms)
+
+    def fit(self, examples: Sequence[Tuple[str, Sequence[str]]]) -> "IntentClassifier":
+        texts = [text for text, _ in examples]
+        document_frequency = Counter(
+            feature for text in texts for feature in set(_features(text))
+        )
+        self.vocabulary = {
+            feature: i for i, feature in enumerate(sorted(document_frequency))
+        }
+        self.idf = np.array(
+            [
+                math.log((1 + len(texts)) / (1 + document_frequency[f])) + 1.0
+                for f in self.vocabulary
+            ],
+            dtype=np.float32,
+        )
+        x = self._transform(texts)
+        y = np.array(
+            [[intent in labels for intent in self.intents] for _, labels in examples],
+            dtype=np.float32,
+        )
+        # Full-batch gradient descent on the L2-regularized logistic loss;
+        # the training set is small, so this takes milliseconds
+        self.weights = np.zeros((x.shape[1], len(self.intents)), dtype=np.float32)
+        self.bias = np.zeros(len(self.intents), dtype=np.float32)
+        for _ in range(self.epochs):
+            error = self._sigmoid(x @ self.weights + self.bias) - y
+            self.weights -= self.learning_rate * (
+                x.T @ error / len(texts) + self.l2 * self.weights
+            )
+            self.bias -= self.learning_rate * error.mean(axis=0)
+        logger.info(
+            f"Intent classifier trained on {len(texts)} queries, "
+            f"{len(self.vocabulary)} features"
+        )
+        return self
+
+    @staticmethod
+    def _sigmoid(z: np.ndarray) -> np.ndarray:
+        return 1.0 / (1.0 + np.exp(-z))
+
+    def predict(self, text: str) -> IntentPrediction:
+        if self.weights is None:
+            raise ValueError("IntentClassifier.fit must be called before predict")
+        scores = self._sigmoid(self._transform([text]) @ self.weights + self.bias)[0]
+        probabilities = {i: float(p) for i, p in zip(self.intents, scores)}
+        intents = [i for i, p in probabilities.items() if p >= 0.5]
+        low = 1.0 - self.threshold
+        confident = bool(intents) and all(
+            p >= self.threshold or p <= low for p in probabilities.values()
+        )
+        return IntentPrediction(intents, probabilities, confident)
+
+
+@lru_cache(maxsize=1)
+def default_classifier() -> IntentClassifier:
+    """The classifier trained on ``intent_examples.EXAMPLES``, with the
+    threshold from ``NFL_INTENT_THRESHOLD``."""
+    threshold = float(os.getenv("NFL_INTENT_THRESHOLD", DEFAULT_THRESHOLD))
+    return IntentClassifier(threshold=threshold).fit(EXAMPLES)
@@ -0,0 +1,148 @@
+# Labeled queries the intent classifier is trained on. Player names are
+# varied on purpose so the model keys on the request, not on who is named.
+EXAMPLES = [
+    # stats
+    ("Patrick Mahomes stats", ["stats"]),
+    ("Travis Kelce receiving yards last 4 weeks", ["stats"]),
+    ("How many targets did Garrett Wilson get in week 6?", ["stats"]),
+    ("Show me the Bills' rushing stats", ["stats"]),
+    ("What are Bijan Robinson's stats this season?", ["stats"]),
+    ("How did Jalen Hurts do last week?", ["stats"]),
+    ("Fantasy points for Derrick Henry in 2023", ["stats"]),
+    ("Top receivers by yards per route run", ["stats"]),
+    ("How many receiving yards does Travis Kelce have this season?", ["stats"]),
+    ("Show me Patrick Mahomes passing stats", ["stats"]),
+    ("What are Josh Allen's numbers over the last 3 weeks?", ["stats"]),
+    ("player Justin Jefferson, weeks 3-8, receiving columns only", ["stats"]),
+    ("How many touchdowns did Derrick Henry score last year?", ["stats"]),
+    ("Compare the rushing yards of Saquon Barkley and Bijan Robinson", ["stats"]),
+    ("What is CeeDee Lamb's target share?", ["stats"]),
+    ("Give me the snap counts for the Chiefs tight ends", ["stats"]),
+    ("Who leads the league in red zone targets?", ["stats"]),
+    ("KC team stats for 2023", ["stats"]),
+    ("What was Lamar Jackson's completion percentage in week 5?", ["stats"]),
+    ("Average fantasy points per game for Tyreek Hill", ["stats"]),
+    ("How did Breece Hall perform against the Bills?", ["stats"]),
+    ("career statistics for Davante Adams", ["stats"]),
+    ("How many carries did Jonathan Taylor get in the red zone?", ["stats"]),
+    ("Show the depth chart for the Eagles", ["stats"]),
+    ("What is Puka Nacua's air yards and EPA?", ["stats"]),
+    ("Which quarterbacks threw the most interceptions?", ["stats"]),
+    ("Jalen Hurts rushing attempts per game", ["stats"]),
+    ("What were the Ravens' points per game last season?", ["stats"]),
+    # news
+    ("Is Patrick Mahomes injured?", ["news"]),
+    ("Latest news on the Cowboys", ["news"]),
+    ("Any injury updates on Nick Chubb?", ["news"]),
+    ("Is Justin Jefferson out this week?", ["news"]),
+    ("What is the status of Tua's concussion?", ["news"]),
+    ("News about Bijan Robinson", ["news"]),
+    ("Did Joe Burrow practice today?", ["news"]),
+    ("Is Travis Etienne expected to play?", ["news"]),
+    ("Any news on Christian McCaffrey?", ["news"]),
+    ("What's the latest on Ja'Marr Chase's injury?", ["news"]),
+    ("Is Cooper Kupp playing on Sunday?", ["news"]),
+    ("Latest updates about Aaron Rodgers", ["news"]),
+    ("Was Stefon Diggs ruled out for this week?", ["news"]),
+    ("Injury report for the 49ers", ["news"]),
+    ("Did the Jets sign a new kicker?", ["news"]),
+    ("Is Kyler Murray questionable?", ["news"]),
+    ("What happened at Bears practice today?", ["news"]),
+    ("Recent headlines about Deebo Samuel", ["news"]),
+    ("Has Mike Evans returned from his hamstring injury?", ["news"]),
+    ("Is Amon-Ra St. Brown healthy?", ["news"]),
+    ("Who is the Broncos' starting quarterback now after the benching?", ["news"]),
+    ("Any rumors about Davante Adams being released?", ["news"]),
+    ("What did the coach say about Rhamondre Stevenson's role?", ["news"]),
+    # trade
+    ("Should I trade Patrick Mahomes for Josh Allen?", ["trade"]),
+    ("Trade Kelce for Andrews?", ["trade"]),
+    ("Is trading Saquon Barkley for two receivers smart?", ["trade"]),
+    ("Evaluate a trade of Mike Evans for Chris Olave", ["trade"]),
+    ("Would you do Nick Chubb for Rashee Rice?", ["trade"]),
+    ("Is this trade fair for me?", ["trade"]),
+    ("Should I trade Travis Kelce for Mark Andrews?", ["trade"]),
+    ("Is Tyreek Hill for Garrett Wilson and Kenneth Walker a fair deal?", ["trade"]),
+    ("Evaluate this trade: Bijan Robinson for Justin Jefferson", ["trade"]),
+    ("Would you accept Josh Jacobs for DK Metcalf?", ["trade"]),
+    ("Someone offered me Jaylen Waddle for my Breece Hall, accept?", ["trade"]),
+    ("Who wins this exchange: Mahomes for Burrow and Pitts?", ["trade"]),
+    ("Should I give up Derrick Henry to get Amon-Ra St. Brown?", ["trade"]),
+    ("Trade Deebo Samuel and Tony Pollard for Stefon Diggs?", ["trade"]),
+    ("Is it worth swapping Kyle Pitts for Sam LaPorta?", ["trade"]),
+    ("I want to send Josh Allen away for two running backs, good idea?", ["trade"]),
+    ("Rate my trade offer for CeeDee Lamb", ["trade"]),
+    ("Do I win the deal if I get Chase for Waddle and Etienne?", ["trade"]),
+    # waiver
+    ("Who is available on waivers?", ["waiver"]),
+    ("Check the waiver wire", ["waiver"]),
+    ("Best pickups this week", ["waiver"]),
+    ("Who should I claim off the wire at running back?", ["waiver"]),
+    ("Any free agents I should grab?", ["waiver"]),
+    ("Waiver targets for week 12", ["waiver"]),
+    ("Who should I pick up off waivers this week?", ["waiver"]),
+    ("Best free agent running backs available?", ["waiver"]),
+    ("Any waiver wire sleepers at tight end?", ["waiver"]),
+    ("Is Jaxon Smith-Njigba worth a waiver claim?", ["waiver"]),
+    ("Which unrostered wide receivers are trending up?", ["waiver"]),
+    ("Who are the hot pickups for week 10?", ["waiver"]),
+    ("How much FAAB should I spend on Tank Dell?", ["waiver"]),
+    ("Streaming defense options on the wire", ["waiver"]),
+    ("Should I add Jaylen Warren from free agency?", ["waiver"]),
+    ("Top waiver adds before the playoffs", ["waiver"]),
+    ("Which backup running backs are available to grab?", ["waiver"]),
+    ("Any quarterbacks on the waiver wire worth streaming?", ["waiver"]),
+    # team
+    ("Show my team", ["team"]),
+    ("Start Kelce or Andrews this week?", ["team"]),
+    ("Who should I start at flex?", ["team"]),
+    ("Drop Mike Williams and add Jayden Reed", ["team"]),
+    ("Update my roster", ["team"]),
+    ("Is my lineup set?", ["team"]),
+    ("Who on my roster should I bench?", ["team"]),
+    ("Show me my roster", ["team"]),
+    ("Drop Kadarius Toney from my team", ["team"]),
+    ("Set my lineup for this week", ["team"]),
+    ("Who should I start, Rachaad White or James Cook?", ["team"]),
+    ("Bench Kyle Pitts and start Dalton Kincaid", ["team"]),
+    ("Add player 2345 to my roster", ["team"]),
+    ("Manage my team for the bye weeks", ["team"]),
+    ("Who should I sit this week on my roster?", ["team"]),
+    ("Move Chris Olave to the flex spot", ["team"]),
+    ("Which players on my team have byes in week 9?", ["team"]),
+    ("Optimize my starting lineup", ["team"]),
+    ("Put Jordan Love on injured reserve", ["team"]),
+    # compound
+    ("Stats and latest news on Travis Kelce", ["stats", "news"]),
+    ("How has Jonathan Taylor played and is he injured?", ["stats", "news"]),
+    ("Give me Mahomes' numbers and any injury updates", ["stats", "news"]),
+    (
+        "Compare their stats and tell me if I should trade Adams for Hill",
+        ["stats", "trade"],
+    ),
+    (
+        "Should I trade for Puka Nacua or pick someone up off waivers?",
+        ["trade", "waiver"],
+    ),
+    (
+        "Latest injury news on Chase and should I start him in my lineup?",
+        ["news", "team"],
+    ),
+    ("Any free agents worth adding, and drop who from my roster?", ["waiver", "team"]),
+    # none of the specialists
+    ("Thank you", []),
+    ("Hey", []),
+    ("Bye", []),
+    ("Never mind", []),
+    ("What about him?", []),
+    ("What do you think?", []),
+    ("Can you explain that?", []),
+    ("Hello", []),
+    ("Hi there!", []),
+    ("Thanks, that helps", []),
+    ("What can you do?", []),
+    ("Good morning", []),
+    ("Who are you?", []),
+    ("Okay", []),
+    ("Tell me a joke", []),
+]
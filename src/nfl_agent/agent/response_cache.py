@@ -0,0 +1,207 @@
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+from agent.routing import detect_intents
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 60 * 60
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_SIMILARITY = 0.9
+_DIMENSIONS = 1024
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_NUMBER = re.compile(r"\d+")
+# Filler that does not change what is being asked
+_FILLER = {
+    "a",
+    "an",
+    "the",
+    "is",
+    "are",
+    "was",
+    "be",
+    "me",
+    "my",
+    "i",
+    "please",
+    "can",
+    "could",
+    "you",
+    "tell",
+    "show",
+    "give",
+    "about",
+    "on",
+    "for",
+    "of",
+    "what",
+    "whats",
+    "hows",
+    "how",
+    "doing",
+}
+
+
+def normalize_prompt(text: str) -> str:
+    """``"How's Mahomes doing?"`` -> ``"mahomes"``: lowercase, no
+    punctuation or filler words, single spaces."""
+    words = _PUNCTUATION.sub("", text.lower()).split()
+    kept = [w for w in words if w not in _FILLER]
+    return " ".join(kept or words)
+
+
+def embed_text(text: str) -> np.ndarray:
+    """Local embedding: hashed character trigrams of the normalized text,
+    L2-normalized, so near-identical phrasings have a cosine close to 1."""
+    vector = np.zeros(_DIMENSIONS, dtype=np.float32)
+    padded = f"  {text} "
+    for i in range(len(padded) - 2):
+        digest = hashlib.blake2b(padded[i : i + 3].encode(), digest_size=4).digest()
+        vector[int.from_bytes(digest, "little") % _DIMENSIONS] += 1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+@dataclass
+class _Entry:
+    response: str
+    version: str
+    intents: Tuple[str, ...]
+    numbers: Tuple[str, ...]
+    vector: np.ndarray
+    expires_at: float
+
+
+class ResponseCache:
+    """Answers keyed by normalized prompt, data version and conversation
+    context (a fingerprint of the earlier turns; empty for a new
+    conversation, so first questions are shared across sessions).
+
+    Exact matches are looked up directly. Otherwise the most similar cached
+    prompt with the same intents and numbers (so neither "Mahomes news" nor
+    "Mahomes stats week 4" answers "Mahomes stats week 3") is used when its
+    cosine similarity reaches ``similarity``.
+    Entries expire after ``ttl`` seconds and the least recently used are
+    evicted beyond ``max_entries``. ``embed`` replaces the local trigram
+    embedding; ``similarity=None`` disables the similarity lookup.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        similarity: Optional[float] = DEFAULT_SIMILARITY,
+        version: Optional[Callable[[], str]] = None,
+        embed: Optional[Callable[[str], Sequence[float]]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.similarity = similarity
+        self._version = version or (lambda: "")
+        self._embed = embed or embed_text
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, str, str], _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, prompt: str, context: str = "") -> Optional[str]:
+        normalized = normalize_prompt(prompt)
+        key = (normalized, self._version(), context)
+        now = self._clock()
+        with self._lock:
+            self._expire(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.response
+        if self.similarity is not None:
+            key = self._similar(*key)
+            if key is not None:
+                with self._lock:
+                    entry = self._entries.get(key)
+                    if entry is not None:
+                        self._entries.move_to_end(key)
+                        self.hits += 1
+                        self.semantic_hits += 1
+                        logger.info(f"Cache hit for {prompt!r} via {key[0]!r}")
+                        return entry.response
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _similar(
+        self, normalized: str, version: str, context: str
+    ) -> Optional[Tuple[str, str, str]]:
+        intents = tuple(detect_intents(normalized))
+        numbers = tuple(_NUMBER.findall(normalized))
+        wanted = (version, context, intents, numbers)
+        vector = np.asarray(self._embed(normalized), dtype=np.float32)
+        best, best_score = None, self.similarity
+        with self._lock:
+            candidates = [
+                (key, entry)
+                for key, entry in self._entries.items()
+                if (entry.version, key[2], entry.intents, entry.numbers) == wanted
+            ]
+        for key, entry in candidates:
+            score = float(np.dot(vector, entry.vector))
+            if score >= best_score:
+                best, best_score = key, score
+        return best
+
+    def put(self, prompt: str, response: str, context: str = "") -> None:
+        normalized = normalize_prompt(prompt)
+        version = self._version()
+        key = (normalized, version, context)
+        entry = _Entry(
+            response=response,
+            version=version,
+            intents=tuple(detect_intents(normalized)),
+            numbers=tuple(_NUMBER.findall(normalized)),
+            vector=np.asarray(self._embed(normalized), dtype=np.float32),
+            expires_at=self._clock() + self.ttl,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _expire(self, now: float) -> None:
+        for key in [k for k, e in self._entries.items() if e.expires_at <= now]:
+            del self._entries[key]
+            self.expirations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,102 @@
+import logging
+from typing import Dict, List, Sequence
+
+from langchain_core.messages import AIMessage, AnyMessage, HumanMessage
+
+logger = logging.getLogger(__name__)
+
+# Intent -> keywords, in the order the specialists are listed to the user
+INTENT_KEYWORDS = {
+    "stats": ["statistics", "stats", "numbers", "performance"],
+    "news": ["news", "update", "latest", "injury"],
+    "trade": ["trade", "exchange", "deal"],
+    "waiver": ["waiver", "free agent", "pickup"],
+    "team": ["manage", "roster", "lineup", "team"],
+}
+
+# Keywords too generic to add a second specialist on their own ("team
+# stats for KC" is a stats question, not roster management)
+WEAK_KEYWORDS = {"team", "update"}
+
+INTENT_NODES = {
+    "stats": "stats_assistant",
+    "news": "news_assistant",
+    "trade": "trade_assistant",
+    "waiver": "waiver_assistant",
+    "team": "team_management_assistant",
+}
+
+# Display names the specialists sign their messages with
+BRANCH_NAMES = {
+    "stats": "Stats Assistant",
+    "news": "News Assistant",
+    "trade": "Trade Assistant",
+    "waiver": "Waiver Assistant",
+    "team": "Team Management Assistant",
+}
+
+MERGE_NODE = "merge_results"
+ROUTER_NAME = "Main Assistant"
+MERGED_NAME = "merged"
+
+
+def detect_intents(text: str) -> List[str]:
+    """Every intent a message expresses, e.g. ``["stats", "news"]`` for
+    "stats and latest news on Kelce"."""
+    content = text.lower()
+    strong, weak = [], []
+    for intent, keywords in INTENT_KEYWORDS.items():
+        matched = {k for k in keywords if k in content}
+        if matched - WEAK_KEYWORDS:
+            strong.append(intent)
+        elif matched:
+            weak.append(intent)
+    return strong or weak
+
+
+def named_intents(text: str) -> List[str]:
+    """Intents whose specialist ``text`` names, e.g. "Routing to the Stats
+    Assistant" -> ``["stats"]``."""
+    content = text.lower()
+    return [i for i, name in BRANCH_NAMES.items() if name.lower() in content]
+
+
+def last_human_index(messages: Sequence[AnyMessage]) -> int:
+    for i in range(len(messages) - 1, -1, -1):
+        if isinstance(messages[i], HumanMessage):
+            return i
+    return -1
+
+
+_NOT_BRANCHES = {None, ROUTER_NAME, MERGED_NAME}
+
+
+def branch_answers(messages: Sequence[AnyMessage]) -> Dict[str, str]:
+    """Each assistant's final answer to the latest human message."""
+    answers: Dict[str, str] = {}
+    for message in messages[last_human_index(messages) + 1 :]:
+        if not isinstance(message, AIMessage) or message.name in _NOT_BRANCHES:
+            continue
+        # Empty content is a tool call, or an assistant that gave up
+        if message.content:
+            answers[message.name] = message.content
+    return answers
+
+
+def merge_results(state) -> dict:
+    """Join the answers of specialists that ran in parallel into one
+    message."""
+    answers = branch_answers(state["messages"])
+    if len(answers) < 2:
+        return {"messages": []}
+    # Branches finish in any order; answers follow the specialists' order
+    order = list(BRANCH_NAMES.values())
+    answers = dict(
+        sorted(
+            answers.items(),
+            key=lambda a: order.index(a[0]) if a[0] in order else len(order),
+        )
+    )
+    logger.info(f"Merging answers from {', '.join(answers)}")
+    sections = [f"{name}:\n{content}" for name, content in answers.items()]
+    return {"messages": [AIMessage(content="\n\n".join(sections), name=MERGED_NAME)]}
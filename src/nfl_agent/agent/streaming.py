@@ -0,0 +1,116 @@
+import logging
+import sys
+from typing import Any, AsyncIterable, Callable, Dict, Iterable, Iterator, List, TextIO
+
+from langchain_core.messages import AIMessageChunk
+
+logger = logging.getLogger(__name__)
+
+# What the graph is asked to stream: LLM tokens, each node's update and the
+# state after every step (the last one is the final state)
+STREAM_MODES = ["messages", "updates", "values"]
+
+TOKEN = "token"
+NODE = "node"
+RESPONSE = "response"
+
+
+def _events(mode: str, payload: Any) -> List[Dict[str, Any]]:
+    if mode == "messages":
+        message, metadata = payload
+        # Whole messages returned by nodes are not tokens, and tool-call
+        # chunks carry no text
+        if isinstance(message, AIMessageChunk) and isinstance(message.content, str):
+            if message.content:
+                node = metadata.get("langgraph_node")
+                return [{"event": TOKEN, "node": node, "content": message.content}]
+    elif mode == "updates":
+        return [{"event": NODE, "node": node} for node in payload]
+    return []
+
+
+def graph_events(
+    chunks: Iterable[Any], respond: Callable[[Dict[str, Any]], str]
+) -> Iterator[Dict[str, Any]]:
+    """Turn ``stream_mode=STREAM_MODES`` chunks into agent events: a
+    ``token`` for each piece of generated text, a ``node`` when a node
+    finishes and a closing ``response`` built by ``respond`` from the final
+    state."""
+    state = None
+    for mode, payload in chunks:
+        if mode == "values":
+            state = payload
+        yield from _events(mode, payload)
+    if state is not None:
+        yield {"event": RESPONSE, "content": respond(state)}
+
+
+async def agraph_events(
+    chunks: AsyncIterable[Any], respond: Callable[[Dict[str, Any]], str]
+):
+    """Async ``graph_events``, for ``astream`` chunks."""
+    state = None
+    async for mode, payload in chunks:
+        if mode == "values":
+            state = payload
+        for event in _events(mode, payload):
+            yield event
+    if state is not None:
+        yield {"event": RESPONSE, "content": respond(state)}
+
+
+def render_stream(events: Iterable[Dict[str, Any]], out: TextIO = sys.stdout) -> str:
+    """Write tokens to ``out`` as they arrive and return the final response.
+
+    Parallel branches stream at the same time; one is written live and the
+    others are held back, then written whole once the live one finishes.
+    If nothing was streamed (a cached answer) the response is written.
+    """
+    live = None
+    pending: Dict[str, List[str]] = {}
+    finished = set()
+    written = False
+    response = ""
+
+    def write(text: str) -> None:
+        out.write(text)
+        out.flush()
+
+    def start(node: str) -> None:
+        nonlocal live, written
+        if written:
+            write("\n\n")
+        live = node
+        write("".join(pending.pop(node, [])))
+        written = True
+
+    for event in events:
+        if event["event"] == TOKEN:
+            node = event["node"]
+            if node in finished and node not in pending:
+                # The node is running again, e.g. the router after a merge
+                finished.discard(node)
+            if live is None:
+                start(node)
+            if node == live:
+                write(event["content"])
+            else:
+                pending.setdefault(node, []).append(event["content"])
+        elif event["event"] == NODE:
+            finished.add(event["node"])
+            if event["node"] != live:
+                continue
+            live = None
+            # Branches that finished meanwhile first, then one still running
+            for node in sorted(pending, key=lambda n: n not in finished):
+                start(node)
+                if node not in finished:
+                    break
+                live = None
+        elif event["event"] == RESPONSE:
+            response = event["content"]
+    for node in list(pending):
+        start(node)
+    if not written and response:
+        write(response)
+    return response
@@ -0,0 +1,194 @@
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# The season report's column specs (prototyping/report_stats.py): counting
+# stats are summed, share/ratio stats are averaged over the games played
+SUM_COLUMNS = [
+    "completions",
+    "attempts",
+    "passing_yards",
+    "passing_tds",
+    "interceptions",
+    "sacks",
+    "carries",
+    "rushing_yards",
+    "rushing_tds",
+    "receptions",
+    "targets",
+    "receiving_yards",
+    "receiving_tds",
+    "fantasy_points",
+    "fantasy_points_ppr",
+]
+MEAN_COLUMNS = ["target_share", "air_yards_share", "wopr"]
+
+
+class _SeasonCumulative:
+    """Cumulative per-player sums for one season.
+
+    ``sums[p, w, c]`` is player ``p``'s total of column ``c`` over weeks
+    ``1..w`` (week 0 is all zeros), so the total over weeks ``a..b`` is
+    ``sums[p, b] - sums[p, a - 1]``.
+    """
+
+    def __init__(self, frame: pd.DataFrame, player_column: str, columns: List[str]):
+        codes, players = pd.factorize(frame[player_column])
+        weeks = frame["week"].to_numpy(dtype=np.int64)
+        valid = codes >= 0
+        codes, weeks = codes[valid], weeks[valid]
+        values = frame[columns].to_numpy(dtype=np.float64)[valid]
+
+        self.players = pd.Index(players)
+        self.last_week = int(weeks.max()) if len(weeks) else 0
+        shape = (len(players), self.last_week + 1)
+        self.sums = np.zeros(shape + (len(columns),))
+        self.counts = np.zeros(shape + (len(columns),), dtype=np.int32)
+        self.games = np.zeros(shape, dtype=np.int32)
+        present = ~np.isnan(values)
+        np.add.at(self.sums, (codes, weeks), np.where(present, values, 0.0))
+        np.add.at(self.counts, (codes, weeks), present)
+        np.add.at(self.games, (codes, weeks), 1)
+        np.cumsum(self.sums, axis=1, out=self.sums)
+        np.cumsum(self.counts, axis=1, out=self.counts)
+        np.cumsum(self.games, axis=1, out=self.games)
+
+    def clip(self, first: int, last: int):
+        last = min(max(last, 0), self.last_week)
+        first = min(max(first, 1), last + 1)
+        return first, last
+
+
+class WeeklyAggregates:
+    """Week-range totals and means from precomputed prefix sums.
+
+    Built once per load of the weekly frame; any range (weeks 1-N, the last
+    four weeks, a rolling window) is then a difference of two rows instead of
+    a merge and ``groupby`` per report.
+    """
+
+    def __init__(
+        self,
+        weekly: pd.DataFrame,
+        player_column: str = "player_id",
+        columns: Optional[Sequence[str]] = None,
+    ):
+        wanted = SUM_COLUMNS + MEAN_COLUMNS if columns is None else list(columns)
+        self.columns = [c for c in wanted if c in weekly.columns]
+        self.mean_columns = [c for c in self.columns if c in MEAN_COLUMNS]
+        self.player_column = player_column
+        self._seasons: Dict[int, _SeasonCumulative] = {}
+        if weekly.empty or player_column not in weekly.columns:
+            return
+        self.update(weekly)
+
+    def update(self, weekly: pd.DataFrame, seasons: Optional[Sequence[int]] = None):
+        """Rebuild the prefix sums of ``seasons`` (default: all in ``weekly``)
+        from the full weekly frame; other seasons are kept as they are."""
+        weekly = weekly[weekly["week"].notna()]
+        if "season" not in weekly.columns:
+            self._seasons[0] = _SeasonCumulative(
+                weekly, self.player_column, self.columns
+            )
+            return
+        if seasons is not None:
+            weekly = weekly[weekly["season"].isin(list(seasons))]
+        for season, frame in weekly.groupby("season", sort=True):
+            self._seasons[int(season)] = _SeasonCumulative(
+                frame, self.player_column, self.columns
+            )
+
+    @property
+    def seasons(self) -> List[int]:
+        return sorted(self._seasons)
+
+    def latest_week(self, season: Optional[int] = None) -> int:
+        cumulative = self._season(season)
+        return cumulative.last_week if cumulative else 0
+
+    def _season(self, season: Optional[int]) -> Optional[_SeasonCumulative]:
+        if season is None:
+            season = max(self._seasons, default=None)
+        return self._seasons.get(season)
+
+    def _values(self, cumulative, p, first: int, last: int) -> np.ndarray:
+        # Works for one player (int p) or all players (slice p)
+        sums = cumulative.sums[p, last] - cumulative.sums[p, first - 1]
+        counts = cumulative.counts[p, last] - cumulative.counts[p, first - 1]
+        return self._apply_means(sums, counts)
+
+    def _apply_means(self, sums: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        values = sums.copy()
+        for i, column in enumerate(self.columns):
+            if column in self.mean_columns:
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    values[..., i] = np.where(
+                        counts[..., i] > 0, sums[..., i] / counts[..., i], np.nan
+                    )
+        return values
+
+    def window(
+        self,
+        player_id: str,
+        first: int,
+        last: int,
+        season: Optional[int] = None,
+    ) -> Optional[Dict[str, float]]:
+        """Totals (and means of share columns) over weeks ``first..last``."""
+        cumulative = self._season(season)
+        if cumulative is None or player_id not in cumulative.players:
+            return None
+        p = cumulative.players.get_loc(player_id)
+        first, last = cumulative.clip(first, last)
+        values = self._values(cumulative, p, first, last)
+        row = {"first_week": first, "last_week": last}
+        row["games"] = int(cumulative.games[p, last] - cumulative.games[p, first - 1])
+        for column, value in zip(self.columns, values.tolist()):
+            row[column] = None if np.isnan(value) else round(value, 6)
+        return row
+
+    def last_n(
+        self, player_id: str, weeks: int, season: Optional[int] = None
+    ) -> Optional[Dict[str, float]]:
+        """The ``weeks`` most recent weeks of the season, played or not."""
+        last = self.latest_week(season)
+        return self.window(player_id, last - weeks + 1, last, season)
+
+    def rolling(
+        self, player_id: str, weeks: int, season: Optional[int] = None
+    ) -> pd.DataFrame:
+        """Rolling ``weeks``-week totals ending at each week of the season."""
+        cumulative = self._season(season)
+        if cumulative is None or player_id not in cumulative.players:
+            return pd.DataFrame(columns=["week"] + self.columns)
+        p = cumulative.players.get_loc(player_id)
+        ends = np.arange(1, cumulative.last_week + 1)
+        starts = np.maximum(ends - weeks, 0)
+        totals = cumulative.sums[p, ends] - cumulative.sums[p, starts]
+        counts = cumulative.counts[p, ends] - cumulative.counts[p, starts]
+        frame = pd.DataFrame(self._apply_means(totals, counts), columns=self.columns)
+        frame.insert(0, "week", ends)
+        return frame
+
+    def totals(
+        self,
+        first: int = 1,
+        last: Optional[int] = None,
+        season: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Every player's totals over weeks ``first..last`` (the season
+        rollup when both are left at their defaults)."""
+        cumulative = self._season(season)
+        if cumulative is None:
+            return pd.DataFrame(columns=[self.player_column, "games"] + self.columns)
+        first, last = cumulative.clip(
+            first, cumulative.last_week if last is None else last
+        )
+        values = self._values(cumulative, slice(None), first, last)
+        frame = pd.DataFrame(values, columns=self.columns)
+        frame.insert(
+            0, "games", cumulative.games[:, last] - cumulative.games[:, first - 1]
+        )
+        frame.insert(0, self.player_column, cumulative.players)
+        return frame[frame["games"] > 0].reset_index(drop=True)
@@ -0,0 +1,148 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Identifier and code columns repeated across many rows: always stored as
+# categoricals, so each distinct value is kept once (interned)
+CATEGORY_COLUMNS = {
+    "player_id",
+    "gsis_id",
+    "pfr_id",
+    "pfr_player_id",
+    "pfr_game_id",
+    "player_gsis_id",
+    "game_id",
+    "old_game_id",
+    "nflverse_game_id",
+    "team",
+    "recent_team",
+    "opponent_team",
+    "away_team",
+    "home_team",
+    "club_code",
+    "team_abbr",
+    "position",
+    "position_group",
+    "depth_team",
+    "game_type",
+    "season_type",
+    "status",
+    "report_status",
+    "practice_status",
+}
+
+# Other string columns become categoricals when they repeat this much
+MAX_CATEGORY_RATIO = 0.5
+
+# Largest relative error accepted when storing floats as float32
+FLOAT32_RTOL = 1e-6
+
+
+@dataclass
+class CompactionReport:
+    dataset: str
+    bytes_before: int
+    bytes_after: int
+    columns: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+    def summary(self) -> str:
+        ratio = self.bytes_after / self.bytes_before if self.bytes_before else 1.0
+        return (
+            f"{self.dataset}: {self.bytes_before / 1e6:.1f} MB -> "
+            f"{self.bytes_after / 1e6:.1f} MB ({ratio:.0%}), "
+            f"{len(self.columns)} columns changed"
+        )
+
+
+def _compact_ints(series: pd.Series) -> pd.Series:
+    # Never below int32, so arithmetic on counting stats cannot overflow
+    downcast = pd.to_numeric(series, downcast="integer")
+    if downcast.dtype.itemsize < np.dtype(np.int32).itemsize:
+        return series.astype(np.int32)
+    return downcast
+
+
+def _compact_floats(series: pd.Series) -> pd.Series:
+    values = series.to_numpy()
+    missing = np.isnan(values)
+    finite = values[~missing]
+    integral = bool(np.all(finite == np.round(finite)))
+    if len(values) and integral and not missing.any():
+        return _compact_ints(series)
+    if len(finite) and np.abs(finite).max() > np.finfo(np.float32).max:
+        return series
+    # Integral values (IDs stored as floats) must round-trip exactly
+    rtol = 0.0 if integral else FLOAT32_RTOL
+    as_float32 = values.astype(np.float32)
+    if np.allclose(as_float32, values, rtol=rtol, atol=0.0, equal_nan=True):
+        return series.astype(np.float32)
+    return series
+
+
+def compact_column(
+    series: pd.Series, kind: Optional[str] = None, ratio: float = MAX_CATEGORY_RATIO
+) -> pd.Series:
+    """Smallest lossless dtype for one column; ``kind`` ("category",
+    "numeric" or "keep") overrides the inferred treatment."""
+    if kind == "keep":
+        return series
+    if kind == "numeric" and series.dtype == object:
+        series = pd.to_numeric(series, errors="coerce")
+    dtype = series.dtype
+    if kind == "category" or (kind is None and series.name in CATEGORY_COLUMNS):
+        if dtype == object or pd.api.types.is_string_dtype(dtype):
+            return series.astype("category")
+        return series
+    if pd.api.types.is_bool_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+        return series
+    if pd.api.types.is_integer_dtype(dtype):
+        return _compact_ints(series) if isinstance(dtype, np.dtype) else series
+    if pd.api.types.is_float_dtype(dtype) and dtype == np.float64:
+        return _compact_floats(series)
+    if dtype == object:
+        if pd.api.types.infer_dtype(series, skipna=True) != "string":
+            return series
+        if series.nunique(dropna=True) <= ratio * max(len(series), 1):
+            return series.astype("category")
+    return series
+
+
+def compact_frame(
+    frame: pd.DataFrame,
+    schema: Optional[Mapping[str, str]] = None,
+    name: str = "",
+    ratio: float = MAX_CATEGORY_RATIO,
+) -> Tuple[pd.DataFrame, CompactionReport]:
+    """Convert repeated strings to categoricals and downcast numerics.
+
+    ``schema`` maps column names to a kind ("category", "numeric", "keep")
+    for columns the defaults get wrong. Returns the compacted frame and a
+    report of the bytes saved.
+    """
+    schema = schema or {}
+    before = frame.memory_usage(deep=True)
+    compacted = {}
+    changes = {}
+    for column in frame.columns:
+        series = frame[column]
+        if isinstance(series, pd.DataFrame):  # duplicated column names
+            continue
+        new = compact_column(series, schema.get(column), ratio)
+        if new.dtype != series.dtype:
+            compacted[column] = new
+            changes[column] = (str(series.dtype), str(new.dtype))
+    if compacted:
+        frame = frame.assign(**compacted)
+    after = frame.memory_usage(deep=True)
+    report = CompactionReport(name, int(before.sum()), int(after.sum()), changes)
+    logger.info(f"Compacted {report.summary()}")
+    return frame, report
@@ -0,0 +1,252 @@
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import pandas as pd
+from data.store import Filters, ParquetStore
+
+logger = logging.getLogger(__name__)
+
+
+class DatasetKey(NamedTuple):
+    dataset: str
+    variant: str
+
+    @property
+    def digest(self) -> str:
+        return hashlib.sha1(self.variant.encode("utf-8")).hexdigest()[:16]
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items())}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_canonical(v) for v in value]
+        try:
+            # Argument lists such as ``years`` are order-insensitive
+            return sorted(set(items))
+        except TypeError:
+            return items
+    if hasattr(value, "item"):  # numpy scalars
+        return value.item()
+    return value
+
+
+def dataset_key(func: Callable[..., Any], kwargs: Dict[str, Any]) -> DatasetKey:
+    """Key a fetch by function name plus its canonicalized arguments.
+
+    ``years`` is not part of the variant: seasons are stored as partitions of
+    the same dataset variant.
+    """
+    dataset = func.__name__
+    if dataset.startswith("import_"):
+        dataset = dataset[len("import_") :]
+    args = {k: v for k, v in kwargs.items() if v is not None and k != "years"}
+    variant = json.dumps(_canonical(args), sort_keys=True, separators=(",", ":"))
+    return DatasetKey(dataset, variant)
+
+
+def _years(kwargs: Dict[str, Any]) -> Optional[List[int]]:
+    years = kwargs.get("years")
+    if years is None:
+        return None
+    return sorted({int(y) for y in years})
+
+
+def high_water(frame: pd.DataFrame) -> Optional[Dict[str, int]]:
+    """Latest ``(season, week)`` present in ``frame``, if it has both."""
+    if frame.empty or not {"season", "week"} <= set(frame.columns):
+        return None
+    marks = frame[["season", "week"]].dropna()
+    if marks.empty:
+        return None
+    season = int(marks["season"].max())
+    week = int(marks.loc[marks["season"] == season, "week"].max())
+    return {"season": season, "week": week}
+
+
+def _later(mark: Optional[Dict[str, int]], other: Optional[Dict[str, int]]):
+    if mark is None or other is None:
+        return mark or other
+    return max(mark, other, key=lambda m: (m["season"], m["week"]))
+
+
+class DatasetCache:
+    """Dataset cache with one entry per (function, arguments) variant.
+
+    Unlike ``joblib.Memory.clear`` which drops every call of a function, each
+    variant (e.g. NGS passing vs. rushing) is stored and invalidated on its own.
+    Frames are persisted column-wise in a ``ParquetStore`` partitioned by
+    season, so a request for new seasons only fetches those seasons and reads
+    only load the columns and rows asked for.
+    """
+
+    def __init__(self, cache_dir: str, store: Optional[ParquetStore] = None):
+        self.cache_dir = cache_dir
+        self.store = store or ParquetStore(cache_dir)
+        self._locks: Dict[DatasetKey, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock(self, key: DatasetKey) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def contains(self, key: DatasetKey, seasons: Optional[List[int]] = None) -> bool:
+        missing = self._missing(key, seasons)
+        return missing is not None and not missing
+
+    def _missing(self, key: DatasetKey, years: Optional[List[int]]):
+        """Seasons to fetch for ``key``; ``None`` means fetch everything and
+        an empty list means the store already covers the request."""
+        manifest = self.store.manifest(key)
+        if manifest is None:
+            return None
+        if manifest["partitioned"]:
+            if years is None:
+                return []
+            return [y for y in years if str(y) not in manifest["partitions"]]
+        stored = manifest.get("years")
+        if years is None or (stored is not None and set(years) <= set(stored)):
+            return []
+        return None
+
+    def get(
+        self,
+        func: Callable[..., pd.DataFrame],
+        kwargs: Dict[str, Any],
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[Filters] = None,
+    ) -> pd.DataFrame:
+        key = dataset_key(func, kwargs)
+        years = _years(kwargs)
+        missing = self._missing(key, years)
+        # Stored seasons are read without the lock, so they are served even
+        # while the variant is being refetched
+        if missing is None or missing:
+            # Concurrent requests for the same variant share a single fetch
+            with self._lock(key):
+                missing = self._missing(key, years)
+                if missing is None:
+                    manifest = self.store.manifest(key)
+                    if manifest is not None and years is not None:
+                        # Unpartitioned frame keyed by years: widen, don't thrash
+                        years = sorted(set(years) | set(manifest.get("years") or []))
+                        kwargs = {**kwargs, "years": years}
+                    self._fetch_and_store(key, func, kwargs, years)
+                elif missing:
+                    self._fetch_and_store(
+                        key, func, {**kwargs, "years": missing}, missing
+                    )
+        return self.store.read(key, seasons=years, columns=columns, filters=filters)
+
+    def _fetch_and_store(self, key, func, kwargs, years) -> None:
+        self._store(key, func(**kwargs), years)
+
+    def _store(self, key, frame, years) -> None:
+        manifest = self.store.manifest(key) or {}
+        mark = _later(manifest.get("high_water"), high_water(frame))
+        extra = {"years": years, "high_water": mark}
+        self.store.write(key, frame, seasons=years, extra=extra)
+
+    def refetch(self, func: Callable[..., Any], kwargs: Dict[str, Any]) -> None:
+        """Fetch the configured seasons again from the source, replacing the
+        stored partitions.
+
+        The download runs outside the variant's lock and only the write is
+        done under it; each file is swapped in whole, so readers see either
+        the old copy or the new one.
+        """
+        key = dataset_key(func, kwargs)
+        frame = func(**kwargs)
+        with self._lock(key):
+            self._store(key, frame, _years(kwargs))
+
+    def fetched_at(
+        self, func: Callable[..., Any], kwargs: Dict[str, Any]
+    ) -> Optional[float]:
+        """When the oldest stored partition of the configured seasons was
+        fetched from the source."""
+        manifest = self.store.manifest(dataset_key(func, kwargs))
+        if manifest is None:
+            return None
+        partitions = manifest["partitions"]
+        years = _years(kwargs)
+        if manifest["partitioned"] and years is not None:
+            partitions = {s: p for s, p in partitions.items() if int(s) in years}
+        times = [p["stored_at"] for p in partitions.values()]
+        return min(times) if times else None
+
+    def high_water(
+        self, func: Callable[..., Any], kwargs: Dict[str, Any]
+    ) -> Optional[Dict[str, int]]:
+        manifest = self.store.manifest(dataset_key(func, kwargs))
+        return None if manifest is None else manifest.get("high_water")
+
+    def update(
+        self, func: Callable[..., Any], kwargs: Dict[str, Any], season: int
+    ) -> pd.DataFrame:
+        """Fetch ``season`` and store the weeks from the stored high-water
+        mark on; returns those rows.
+
+        The high-water week itself is replaced rather than skipped, since
+        injuries and depth charts are republished within a week and stat
+        corrections arrive after it. nflverse publishes whole-season files,
+        so the season is still downloaded, but earlier weeks are neither
+        rewritten nor re-indexed.
+        """
+        key = dataset_key(func, kwargs)
+        with self._lock(key):
+            frame = func(**{**kwargs, "years": [season]})
+            manifest = self.store.manifest(key)
+            mark = None if manifest is None else manifest.get("high_water")
+            partitioned = manifest is not None and manifest["partitioned"]
+            stored = partitioned and str(season) in manifest["partitions"]
+            if not (stored and mark is not None and "week" in frame.columns):
+                # Nothing to append to: store the season as a fresh partition
+                self._store_season(key, frame, season, manifest)
+                return frame
+            if season < mark["season"]:
+                return frame.iloc[0:0]
+            replace_week = None
+            if season == mark["season"]:
+                frame = frame[frame["week"] >= mark["week"]]
+                replace_week = mark["week"]
+            if frame.empty:
+                return frame
+            extra = {"high_water": _later(mark, high_water(frame))}
+            self.store.append(
+                key, frame, season, extra=extra, replace_week=replace_week
+            )
+        return frame
+
+    def _store_season(self, key, frame, season, manifest) -> None:
+        years = sorted(set((manifest or {}).get("years") or []) | {season})
+        mark = _later((manifest or {}).get("high_water"), high_water(frame))
+        extra = {"years": years, "high_water": mark}
+        self.store.write(key, frame, seasons=[season], extra=extra)
+
+    def invalidate(
+        self,
+        func: Callable[..., Any],
+        kwargs: Dict[str, Any],
+        seasons: Optional[List[int]] = None,
+    ) -> bool:
+        return self.invalidate_key(dataset_key(func, kwargs), seasons)
+
+    def invalidate_key(
+        self, key: DatasetKey, seasons: Optional[List[int]] = None
+    ) -> bool:
+        with self._lock(key):
+            return self.store.delete(key, seasons)
+
+    def columns(
+        self, func: Callable[..., Any], kwargs: Dict[str, Any]
+    ) -> Optional[List[str]]:
+        """Stored column names, read from the manifest without loading data."""
+        manifest = self.store.manifest(dataset_key(func, kwargs))
+        return None if manifest is None else manifest.get("columns")
+
+    def keys(self) -> List[DatasetKey]:
+        return [DatasetKey(m["dataset"], m["variant"]) for m in self.store.manifests()]
@@ -0,0 +1,49 @@
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+
+@dataclass(frozen=True)
+class FreshnessPolicy:
+    """How long a dataset stays fresh, and what happens once it expires.
+
+    With ``stale_while_revalidate`` the cached copy keeps being served while
+    a background worker refetches it; otherwise the next access blocks on
+    the refetch.
+    """
+
+    ttl: float
+    stale_while_revalidate: bool = True
+    # Minimum gap between revalidation attempts after a failed one
+    retry_after: float = 5 * MINUTE
+
+    def is_stale(self, fetched_at: float, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        return now - fetched_at > self.ttl
+
+
+DEFAULT_POLICY = FreshnessPolicy(ttl=DAY)
+
+
+def describe_freshness(
+    fetched_at: float,
+    policy: FreshnessPolicy,
+    revalidating: bool = False,
+    now: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Freshness summary attached to responses."""
+    now = time.time() if now is None else now
+    return {
+        "fetched_at": datetime.fromtimestamp(fetched_at, timezone.utc).isoformat(
+            timespec="seconds"
+        ),
+        "age_seconds": int(now - fetched_at),
+        "ttl_seconds": int(policy.ttl),
+        "stale": policy.is_stale(fetched_at, now),
+        "revalidating": revalidating,
+    }
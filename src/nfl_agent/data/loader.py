@@ -0,0 +1,134 @@
+import logging
+import time
+from concurrent import futures
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from tqdm import tqdm
+
+logger = logging.getLogger(__name__)
+
+Task = Tuple[Callable[..., Any], Dict[str, Any]]
+
+_POLL_SECONDS = 0.1
+
+
+@dataclass
+class TaskTiming:
+    name: str
+    seconds: float
+    status: str  # "ok", "timeout" or "error"
+    error: Optional[str] = None
+
+
+@dataclass
+class LoadReport:
+    timings: List[TaskTiming] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def failed(self) -> List[TaskTiming]:
+        return [t for t in self.timings if t.status != "ok"]
+
+    @property
+    def slowest(self) -> Optional[TaskTiming]:
+        if not self.timings:
+            return None
+        return max(self.timings, key=lambda t: t.seconds)
+
+    def summary(self) -> str:
+        total = sum(t.seconds for t in self.timings)
+        header = (
+            f"Loaded {len(self.timings) - len(self.failed)}/{len(self.timings)} "
+            f"datasets in {self.wall_seconds:.2f}s (sequential sum {total:.2f}s"
+        )
+        slowest = self.slowest
+        if slowest is not None:
+            header += f", slowest {slowest.name} {slowest.seconds:.2f}s"
+        lines = [header + ")"]
+        for t in sorted(self.timings, key=lambda t: t.seconds, reverse=True):
+            line = f"  {t.name:<28} {t.seconds:8.2f}s  {t.status}"
+            if t.error:
+                line += f" ({t.error})"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+def _timed_call(func: Callable[..., Any], kwargs: Dict[str, Any]):
+    start = time.perf_counter()
+    result = func(**kwargs)
+    return result, time.perf_counter() - start
+
+
+def load_concurrently(
+    tasks: Sequence[Task],
+    names: Optional[Sequence[str]] = None,
+    max_workers: int = 8,
+    timeout: Optional[float] = None,
+    use_processes: bool = False,
+    progress: bool = True,
+    desc: str = "Fetching NFL data",
+) -> Tuple[List[Any], LoadReport]:
+    """Run ``func(**kwargs)`` for every task in a bounded pool.
+
+    Results are returned in task order; a task that fails or runs longer than
+    ``timeout`` seconds yields ``None`` and is recorded in the report.
+    """
+    if names is None:
+        names = [func.__name__ for func, _ in tasks]
+    results: List[Any] = [None] * len(tasks)
+    report = LoadReport()
+
+    executor_cls = (
+        futures.ProcessPoolExecutor if use_processes else futures.ThreadPoolExecutor
+    )
+    executor = executor_cls(max_workers=max(1, min(max_workers, len(tasks) or 1)))
+    wall_start = time.perf_counter()
+    try:
+        pending = {}
+        started: Dict[Any, Optional[float]] = {}
+        for i, (func, kwargs) in enumerate(tasks):
+            future = executor.submit(_timed_call, func, kwargs)
+            pending[future] = i
+            started[future] = None
+
+        with tqdm(total=len(tasks), desc=desc, disable=not progress) as bar:
+            while pending:
+                # Poll while a timeout is in force so queued tasks are only
+                # timed from the moment a worker picks them up.
+                wait_for = _POLL_SECONDS if timeout is not None else None
+                done, _ = futures.wait(
+                    pending, timeout=wait_for, return_when=futures.FIRST_COMPLETED
+                )
+
+                now = time.perf_counter()
+                for future in list(pending):
+                    i = pending[future]
+                    if started[future] is None and (future.running() or future.done()):
+                        started[future] = now
+                    elapsed = now - (started[future] or now)
+                    if future in done:
+                        try:
+                            results[i], seconds = future.result()
+                            report.timings.append(TaskTiming(names[i], seconds, "ok"))
+                        except Exception as e:
+                            logger.error(f"Error loading {names[i]}: {str(e)}")
+                            report.timings.append(
+                                TaskTiming(names[i], elapsed, "error", str(e))
+                            )
+                    elif timeout is not None and elapsed >= timeout:
+                        # Running workers cannot be interrupted; the result is
+                        # abandoned and the pool is not waited on at shutdown.
+                        future.cancel()
+                        logger.warning(f"Timed out loading {names[i]} after {timeout}s")
+                        report.timings.append(TaskTiming(names[i], elapsed, "timeout"))
+                    else:
+                        continue
+                    del pending[future]
+                    bar.update(1)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        report.wall_seconds = time.perf_counter() - wall_start
+
+    logger.info(report.summary())
+    return results, report
@@ -0,0 +1,126 @@
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, List, Mapping, NamedTuple, Optional
+
+import numpy as np
+from data.player_index import normalize_name
+
+
+class NameMatch(NamedTuple):
+    name: str  # normalized key, usable with PlayerIndex
+    display_name: str
+    score: float
+    activity: float
+
+
+def _trigrams(key: str) -> List[str]:
+    padded = f"  {key} "
+    return sorted({padded[i : i + 3] for i in range(len(padded) - 2)})
+
+
+class NameSearch:
+    """Typo-tolerant player name search over a trigram index.
+
+    Names are normalized once at build time; a query only touches the posting
+    lists of its own trigrams, and candidates are ranked by similarity with
+    recent activity (e.g. games played this season) breaking near-ties.
+
+    ``aliases`` maps other names of a player ("tkelce") to the key the player
+    is listed under ("travis kelce"); a match on any of them is reported once,
+    as that entry.
+    """
+
+    def __init__(
+        self,
+        names: Mapping[str, str],
+        activity: Optional[Mapping[str, float]] = None,
+        min_score: float = 0.6,
+        aliases: Optional[Mapping[str, str]] = None,
+    ):
+        # names: normalized key -> display name
+        activity = activity or {}
+        aliases = aliases or {}
+        self.keys = list(names)
+        self.display = [names[k] for k in self.keys]
+        self.min_score = min_score
+        self._position = {key: i for i, key in enumerate(self.keys)}
+        # Position of the entry each key is reported as
+        self._entry = np.array(
+            [self._position.get(aliases.get(k, k), i) for i, k in enumerate(self.keys)],
+            dtype=np.int32,
+        )
+
+        raw_activity = np.array(
+            [activity.get(self.keys[e], 0.0) for e in self._entry], dtype=float
+        )
+        top = np.log1p(raw_activity.max()) if len(raw_activity) else 0.0
+        self.activity = raw_activity
+        self._activity_weight = (
+            np.log1p(raw_activity) / top if top else raw_activity * 0
+        )
+
+        postings = defaultdict(list)
+        self._gram_counts = np.zeros(len(self.keys), dtype=np.int32)
+        for i, key in enumerate(self.keys):
+            grams = _trigrams(key)
+            self._gram_counts[i] = len(grams)
+            for gram in grams:
+                postings[gram].append(i)
+        self._postings: Dict[str, np.ndarray] = {
+            gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def search(self, query: str, limit: int = 5) -> List[NameMatch]:
+        key = normalize_name(query)
+        if not key or not self.keys:
+            return []
+        exact = self._position.get(key)
+        if exact is not None:
+            return [self._match(exact, 1.0)]
+
+        grams = _trigrams(key)
+        lists = [self._postings[g] for g in grams if g in self._postings]
+        if not lists:
+            return []
+        shared = np.bincount(np.concatenate(lists), minlength=len(self.keys))
+        # Dice coefficient, or containment for partial queries ("mahomes")
+        dice = 2.0 * shared / (len(grams) + self._gram_counts)
+        containment = 0.9 * shared / len(grams)
+        similarity = np.maximum(dice, containment)
+
+        candidates = min(len(self.keys), max(limit * 4, 20))
+        top = np.argpartition(-similarity, candidates - 1)[:candidates]
+        matches = []
+        for i in top:
+            if similarity[i] < self.min_score * 0.75:
+                continue
+            ratio = SequenceMatcher(None, key, self.keys[i]).ratio()
+            score = max(ratio, float(containment[i]))
+            if score >= self.min_score:
+                matches.append(self._match(i, score))
+        # Similarity first; among close scores, the more active player wins
+        matches.sort(
+            key=lambda m: (
+                round(m.score, 1) + 0.1 * self._activity_weight[self._position[m.name]],
+                m.score,
+            ),
+            reverse=True,
+        )
+        # Aliases of a player are reported once, at their best score
+        unique = {}
+        for match in matches:
+            unique.setdefault(match.name, match)
+        return list(unique.values())[:limit]
+
+    def best(self, query: str) -> Optional[NameMatch]:
+        matches = self.search(query, limit=1)
+        return matches[0] if matches else None
+
+    def _match(self, i: int, score: float) -> NameMatch:
+        i = self._entry[i]
+        return NameMatch(
+            self.keys[i], self.display[i], round(score, 3), float(self.activity[i])
+        )
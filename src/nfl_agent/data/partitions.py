@@ -0,0 +1,100 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def parse_seasons(text: str) -> List[int]:
+    """``"2014-2024"``, ``"2022,2024"`` or ``"2020-2022,2024"`` -> seasons."""
+    seasons = set()
+    for part in text.replace(" ", "").split(","):
+        if not part:
+            continue
+        if "-" in part:
+            first, last = sorted(int(p) for p in part.split("-", 1))
+            seasons.update(range(first, last + 1))
+        else:
+            seasons.add(int(part))
+    return sorted(seasons)
+
+
+class SeasonPartitions:
+    """Per-season frames loaded on demand and kept under a memory cap.
+
+    Each ``(dataset, season)`` partition is loaded the first time it is
+    needed; once the cached partitions exceed ``max_bytes`` the least
+    recently used ones are evicted (and simply reloaded from the on-disk
+    store if needed again).
+    """
+
+    def __init__(
+        self,
+        load: Callable[[str, int], pd.DataFrame],
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self._load = load
+        self.max_bytes = max_bytes
+        self._frames: "OrderedDict[Tuple[str, int], pd.DataFrame]" = OrderedDict()
+        self._sizes: Dict[Tuple[str, int], int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def bytes(self) -> int:
+        return sum(self._sizes.values())
+
+    def keys(self) -> List[Tuple[str, int]]:
+        return list(self._frames)
+
+    def get(self, name: str, season: int) -> pd.DataFrame:
+        key = (name, int(season))
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is not None:
+                self._frames.move_to_end(key)
+                self.hits += 1
+                return frame
+        frame = self._load(name, int(season))
+        size = int(frame.memory_usage(deep=True).sum())
+        with self._lock:
+            self.misses += 1
+            self._frames[key] = frame
+            self._sizes[key] = size
+            self._evict_over_cap(keep=key)
+        return frame
+
+    def _evict_over_cap(self, keep: Tuple[str, int]) -> None:
+        # The partition just loaded stays even if it alone exceeds the cap
+        while self.bytes > self.max_bytes and len(self._frames) > 1:
+            key = next(iter(self._frames))
+            if key == keep:
+                break
+            self._frames.pop(key)
+            self._sizes.pop(key)
+            self.evictions += 1
+            logger.info(f"Evicted {key[0]} season {key[1]} from memory")
+
+    def evict(self, name: Optional[str] = None) -> None:
+        """Drop every cached partition of ``name`` (default: all)."""
+        with self._lock:
+            for key in [k for k in self._frames if name is None or k[0] == name]:
+                self._frames.pop(key)
+                self._sizes.pop(key)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "partitions": len(self._frames),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
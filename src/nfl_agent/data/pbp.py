@@ -0,0 +1,225 @@
+import logging
+import os
+import tempfile
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import fastparquet
+import pandas as pd
+import requests
+
+logger = logging.getLogger(__name__)
+
+PBP_URL = "https://github.com/nflverse/nflverse-data/releases/download/pbp/play_by_play_{season}.parquet"
+
+# The only play-by-play columns read; the full file has close to 400
+PBP_COLUMNS = [
+    "season",
+    "week",
+    "play_type",
+    "posteam",
+    "yardline_100",
+    "air_yards",
+    "epa",
+    "passer_player_id",
+    "passer_player_name",
+    "receiver_player_id",
+    "receiver_player_name",
+    "rusher_player_id",
+    "rusher_player_name",
+]
+
+KEY_COLUMNS = ["season", "week", "player_id"]
+LABEL_COLUMNS = ["player_name", "team"]
+METRIC_COLUMNS = [
+    "targets",
+    "red_zone_targets",
+    "air_yards",
+    "receiving_epa",
+    "carries",
+    "red_zone_carries",
+    "goal_line_carries",
+    "rushing_epa",
+    "dropbacks",
+    "passing_air_yards",
+    "passing_epa",
+]
+
+RED_ZONE_YARDS = 20
+GOAL_LINE_YARDS = 5
+
+DEFAULT_BATCH_ROWS = 50_000
+_DOWNLOAD_CHUNK_BYTES = 1 << 20
+
+
+def _role_rows(
+    plays: pd.DataFrame, role: str, play_type: str
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    # One row per play credited to ``role``, plus the plays themselves
+    rows = plays[plays[f"{role}_player_id"].notna() & (plays["play_type"] == play_type)]
+    return (
+        pd.DataFrame(
+            {
+                "season": rows["season"].to_numpy(),
+                "week": rows["week"].to_numpy(),
+                "player_id": rows[f"{role}_player_id"].to_numpy(),
+                "player_name": rows[f"{role}_player_name"].to_numpy(),
+                "team": rows["posteam"].to_numpy(),
+            }
+        ),
+        rows,
+    )
+
+
+def derive_player_stats(plays: pd.DataFrame) -> pd.DataFrame:
+    """Per player and week: targets, carries and dropbacks with their
+    red-zone / goal-line counts, air yards and EPA, from a batch of plays."""
+    yardline = "yardline_100"
+    parts = []
+
+    targets, rows = _role_rows(plays, "receiver", "pass")
+    targets["targets"] = 1
+    targets["red_zone_targets"] = (rows[yardline] <= RED_ZONE_YARDS).to_numpy(int)
+    targets["air_yards"] = rows["air_yards"].fillna(0).to_numpy()
+    targets["receiving_epa"] = rows["epa"].fillna(0).to_numpy()
+    parts.append(targets)
+
+    carries, rows = _role_rows(plays, "rusher", "run")
+    carries["carries"] = 1
+    carries["red_zone_carries"] = (rows[yardline] <= RED_ZONE_YARDS).to_numpy(int)
+    carries["goal_line_carries"] = (rows[yardline] <= GOAL_LINE_YARDS).to_numpy(int)
+    carries["rushing_epa"] = rows["epa"].fillna(0).to_numpy()
+    parts.append(carries)
+
+    dropbacks, rows = _role_rows(plays, "passer", "pass")
+    dropbacks["dropbacks"] = 1
+    dropbacks["passing_air_yards"] = rows["air_yards"].fillna(0).to_numpy()
+    dropbacks["passing_epa"] = rows["epa"].fillna(0).to_numpy()
+    parts.append(dropbacks)
+
+    events = pd.concat(parts, ignore_index=True)
+    return _combine(events)
+
+
+def _combine(frame: pd.DataFrame) -> pd.DataFrame:
+    aggregations = {c: "first" for c in LABEL_COLUMNS}
+    aggregations.update({c: "sum" for c in METRIC_COLUMNS})
+    frame = frame.reindex(columns=KEY_COLUMNS + LABEL_COLUMNS + METRIC_COLUMNS)
+    frame[METRIC_COLUMNS] = frame[METRIC_COLUMNS].fillna(0)
+    combined = frame.groupby(KEY_COLUMNS, sort=True).agg(aggregations).reset_index()
+    for column in METRIC_COLUMNS:
+        if not column.endswith(("_epa", "air_yards")):
+            combined[column] = combined[column].astype(int)
+    return combined
+
+
+class PlayerStatsAccumulator:
+    """Running per-player weekly totals, fed one batch of plays at a time.
+
+    Each batch is reduced to its per-player totals right away, and the
+    partial totals are folded together every ``fold_every`` batches, so
+    memory depends on the number of players and weeks, not on plays.
+    """
+
+    def __init__(self, fold_every: int = 8):
+        self.fold_every = fold_every
+        self.plays = 0
+        self._partials: List[pd.DataFrame] = []
+
+    def add(self, plays: pd.DataFrame) -> None:
+        self.plays += len(plays)
+        self._partials.append(derive_player_stats(plays))
+        if len(self._partials) >= self.fold_every:
+            self._partials = [_combine(pd.concat(self._partials, ignore_index=True))]
+
+    def result(self) -> pd.DataFrame:
+        if not self._partials:
+            return _combine(pd.DataFrame(columns=KEY_COLUMNS))
+        result = _combine(pd.concat(self._partials, ignore_index=True))
+        # Rounded only once, so batch boundaries do not change the totals
+        floats = [c for c in METRIC_COLUMNS if c.endswith(("_epa", "air_yards"))]
+        result[floats] = result[floats].astype(float).round(4)
+        return result
+
+
+def _largest_row_group(
+    parquet: fastparquet.ParquetFile, columns: List[str]
+) -> Tuple[int, int]:
+    # Rows and uncompressed bytes of ``columns`` in the largest row group
+    largest = (0, 0)
+    for group in parquet.row_groups:
+        size = sum(
+            chunk.meta_data.total_uncompressed_size
+            for chunk in group.columns
+            if chunk.meta_data.path_in_schema[0] in columns
+        )
+        largest = max(largest, (group.num_rows, size))
+    return largest
+
+
+def iter_pbp_batches(
+    path: str,
+    columns: Optional[List[str]] = None,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+) -> Iterator[pd.DataFrame]:
+    """Plays from a pbp parquet file, ``batch_rows`` at a time.
+
+    Only the needed columns are read, one row group at a time. A row group is
+    the smallest unit fastparquet reads, so memory is bounded by the largest
+    row group of those columns (a whole season, about 50k plays, for files
+    written as one group); ``batch_rows`` bounds each reduction step.
+    """
+    parquet = fastparquet.ParquetFile(path)
+    columns = [c for c in (columns or PBP_COLUMNS) if c in parquet.columns]
+    rows, size = _largest_row_group(parquet, columns)
+    if rows > batch_rows:
+        logger.info(
+            f"Reading {os.path.basename(path)} in row groups of up to {rows} plays "
+            f"({size / 1e6:.1f} MB of {len(columns)} columns)"
+        )
+    for group in parquet.iter_row_groups(columns=columns):
+        for start in range(0, len(group), batch_rows):
+            yield group.iloc[start : start + batch_rows]
+
+
+def download_pbp(season: int, directory: str) -> str:
+    """Stream one season's pbp file to disk in chunks; returns its path."""
+    url = PBP_URL.format(season=season)
+    handle, path = tempfile.mkstemp(suffix=".parquet", dir=directory)
+    logger.info(f"Downloading play-by-play {season} from {url}")
+    try:
+        with (
+            os.fdopen(handle, "wb") as out,
+            requests.get(url, stream=True, timeout=60) as response,
+        ):
+            response.raise_for_status()
+            for chunk in response.iter_content(_DOWNLOAD_CHUNK_BYTES):
+                out.write(chunk)
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
+
+def import_pbp_player_stats(
+    years: Iterable[int],
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    directory: Optional[str] = None,
+) -> pd.DataFrame:
+    """Derived per-player weekly pbp stats for ``years``.
+
+    Each season's play-by-play is streamed to a temporary file, reduced
+    batch by batch and deleted; only the aggregates are returned (and
+    stored by the dataset cache).
+    """
+    frames = []
+    for season in years:
+        path = download_pbp(int(season), directory or tempfile.gettempdir())
+        try:
+            accumulator = PlayerStatsAccumulator()
+            for batch in iter_pbp_batches(path, batch_rows=batch_rows):
+                accumulator.add(batch)
+            logger.info(f"Reduced {accumulator.plays} plays of {season}")
+            frames.append(accumulator.result())
+        finally:
+            os.remove(path)
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
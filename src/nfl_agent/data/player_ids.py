@@ -0,0 +1,212 @@
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from data.player_index import id_keys, normalize_name
+
+# Identifier columns of the ``ids`` frame (nfl.import_ids) used for crosswalks
+ID_TYPES = [
+    "gsis_id",
+    "pfr_id",
+    "espn_id",
+    "sleeper_id",
+    "yahoo_id",
+    "sportradar_id",
+    "fantasypros_id",
+    "pff_id",
+    "nfl_id",
+    "mfl_id",
+    "cbs_id",
+]
+
+# Dataset column -> ``ids`` identifier it holds
+COLUMN_ID_TYPES = {
+    "player_id": "gsis_id",
+    "gsis_id": "gsis_id",
+    "player_gsis_id": "gsis_id",
+    "gsis_it_id": "gsis_id",
+    "pfr_id": "pfr_id",
+    "pfr_player_id": "pfr_id",
+    "espn_id": "espn_id",
+    "sleeper_id": "sleeper_id",
+    "yahoo_id": "yahoo_id",
+    "sportradar_id": "sportradar_id",
+    "nfl_id": "nfl_id",
+    "player_name": "name",
+    "player": "name",
+    "full_name": "name",
+    "name_display": "name",
+    "player_display_name": "name",
+    "name": "name",
+}
+
+MISSING = -1
+
+
+class PlayerIdCrosswalk:
+    """Canonical integer player ID over the ``ids`` frame.
+
+    Every player gets the position of their row in ``ids`` as a compact int32
+    key; each external identifier (gsis, pfr, espn, ..., normalized name) maps
+    to that key through a hash index, so datasets can be joined with
+    vectorized integer lookups instead of string merges.
+    """
+
+    def __init__(self, ids: pd.DataFrame):
+        self.size = len(ids)
+        self._values: Dict[str, np.ndarray] = {}
+        self._lookup: Dict[str, Tuple[pd.Index, np.ndarray]] = {}
+        for id_type in ID_TYPES:
+            if id_type in ids.columns:
+                self._add(id_type, id_keys(ids[id_type]))
+        if "name" in ids.columns:
+            names = ids["name"].astype(object).map(normalize_name, na_action="ignore")
+            self._add("name", names, display=ids["name"])
+
+    def _add(
+        self, id_type: str, keys: pd.Series, display: Optional[pd.Series] = None
+    ) -> None:
+        keys = keys.reset_index(drop=True)
+        values = keys if display is None else display.reset_index(drop=True)
+        self._values[id_type] = values.to_numpy(dtype=object)
+        # First row wins for duplicated identifiers (e.g. shared names)
+        present = keys.dropna()
+        present = present[~present.duplicated()]
+        index = pd.Index(present.to_numpy(dtype=object))
+        self._lookup[id_type] = (index, present.index.to_numpy(dtype=np.int32))
+
+    @property
+    def id_types(self) -> List[str]:
+        return list(self._lookup)
+
+    def to_canonical(self, values: Iterable, id_type: str) -> np.ndarray:
+        """Vectorized external ID -> canonical int32 (``-1`` when unknown)."""
+        if id_type == "name":
+            keys = pd.Series(values, dtype=object).map(
+                normalize_name, na_action="ignore"
+            )
+        else:
+            keys = id_keys(pd.Series(values))
+        index, rows = self._lookup[id_type]
+        positions = index.get_indexer(keys.to_numpy(dtype=object))
+        codes = np.full(len(positions), MISSING, dtype=np.int32)
+        found = positions >= 0
+        codes[found] = rows[positions[found]]
+        return codes
+
+    def from_canonical(self, codes: np.ndarray, id_type: str) -> np.ndarray:
+        codes = np.asarray(codes)
+        values = np.empty(len(codes), dtype=object)
+        found = codes >= 0
+        values[found] = self._values[id_type][codes[found]]
+        return values
+
+    def canonical_for_column(self, frame: pd.DataFrame, column: str) -> np.ndarray:
+        if column == "player_name" and "player_display_name" in frame.columns:
+            # Abbreviated ("P.Mahomes") where a full display name exists
+            column = "player_display_name"
+        id_type = COLUMN_ID_TYPES.get(column, column)
+        return self.to_canonical(frame[column], id_type)
+
+    def resolve(self, player: str) -> Dict[str, str]:
+        """Every known identifier for a player name or ID."""
+        code = MISSING
+        for id_type in ["name"] + [t for t in self._lookup if t != "name"]:
+            if id_type not in self._lookup:
+                continue
+            code = self.to_canonical([player], id_type)[0]
+            if code != MISSING:
+                break
+        if code == MISSING:
+            return {}
+        resolved = {}
+        for id_type, values in self._values.items():
+            value = values[code]
+            if value is not None and not pd.isna(value):
+                resolved[id_type] = value
+        return resolved
+
+    def join(
+        self,
+        left: pd.DataFrame,
+        right: pd.DataFrame,
+        left_on: str,
+        right_on: str,
+        on: Optional[Sequence[str]] = None,
+        how: str = "left",
+        suffixes=("", "_right"),
+    ) -> pd.DataFrame:
+        """Join two datasets that identify players differently.
+
+        ``left_on``/``right_on`` may hold different identifiers (e.g.
+        ``player_id`` vs. ``pfr_player_id``); both sides are mapped to the
+        canonical int key and joined on it plus any shared ``on`` columns.
+        """
+        on = list(on or [])
+        left_codes = self.canonical_for_column(left, left_on)
+        right_codes = self.canonical_for_column(right, right_on)
+
+        if not on and how == "left":
+            # One-to-one: scatter right row positions into a dense array
+            # indexed by canonical key and gather them for the left side
+            # (first matching right row wins; -1 reindexes to an all-NaN row)
+            slot = np.full(self.size + 1, MISSING, dtype=np.int64)
+            valid = right_codes >= 0
+            slot[right_codes[valid][::-1]] = np.flatnonzero(valid)[::-1]
+            taken = slot[np.where(left_codes >= 0, left_codes, self.size)]
+            right_part = (
+                right.reset_index(drop=True).reindex(taken).reset_index(drop=True)
+            )
+            overlap = set(left.columns) & set(right_part.columns)
+            right_part = right_part.rename(
+                columns={c: f"{c}{suffixes[1]}" for c in overlap}
+            )
+            return pd.concat([left.reset_index(drop=True), right_part], axis=1)
+
+        left_keyed = left.assign(_player_key=left_codes)
+        right_keyed = right.assign(_player_key=right_codes)
+        right_keyed = right_keyed[right_keyed["_player_key"] >= 0]
+        merged = pd.merge(
+            left_keyed,
+            right_keyed,
+            on=["_player_key"] + on,
+            how=how,
+            suffixes=suffixes,
+        )
+        return merged.drop(columns="_player_key")
+
+
+def player_identities(
+    keys: Iterable[str],
+    name_ids: Mapping[str, Tuple[str, str]],
+    crosswalk: Optional[PlayerIdCrosswalk] = None,
+) -> Dict[str, Hashable]:
+    """Player behind each normalized name key, so aliases of one player
+    ("T.Kelce", "Travis Kelce") can be told apart from namesakes.
+
+    ``name_ids`` is ``PlayerIndex.name_ids()``. A key maps to its canonical
+    ID when the crosswalk knows the player's ID (or, for keys without one,
+    the name), else to the raw ``(id column, id)``, else to itself.
+    """
+    keys = list(keys)
+    identities: Dict[str, Hashable] = {key: name_ids.get(key, key) for key in keys}
+    if crosswalk is None:
+        return identities
+    codes = np.full(len(keys), MISSING, dtype=np.int32)
+    by_column = defaultdict(list)
+    for i, key in enumerate(keys):
+        if key in name_ids:
+            by_column[name_ids[key][0]].append(i)
+    for column, rows in by_column.items():
+        id_type = COLUMN_ID_TYPES.get(column, column)
+        if id_type in crosswalk.id_types:
+            values = [name_ids[keys[i]][1] for i in rows]
+            codes[rows] = crosswalk.to_canonical(values, id_type)
+    unnamed = [i for i, key in enumerate(keys) if key not in name_ids]
+    if unnamed and "name" in crosswalk.id_types:
+        codes[unnamed] = crosswalk.to_canonical([keys[i] for i in unnamed], "name")
+    for key, code in zip(keys, codes):
+        if code != MISSING:
+            identities[key] = int(code)
+    return identities
@@ -0,0 +1,279 @@
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Full names before abbreviated ones: nflverse weekly data has both
+# player_display_name ("Patrick Mahomes") and player_name ("P.Mahomes")
+PLAYER_NAME_COLUMNS = [
+    "player_display_name",
+    "player_name",
+    "player",
+    "full_name",
+    "name_display",
+]
+PLAYER_ID_COLUMNS = [
+    "player_id",
+    "gsis_id",
+    "pfr_id",
+    "pfr_player_id",
+    "player_gsis_id",
+    "espn_id",
+    "sleeper_id",
+]
+
+_PUNCTUATION = re.compile(r"[^\w\s-]")
+_WHITESPACE = re.compile(r"\s+")
+_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, strip punctuation and generational suffixes.
+
+    ``"Patrick Mahomes II"`` and ``"patrick mahomes"`` share a key.
+    """
+    name = _PUNCTUATION.sub("", str(name).lower())
+    parts = _WHITESPACE.split(name.strip())
+    while len(parts) > 1 and parts[-1] in _SUFFIXES:
+        parts.pop()
+    return " ".join(parts)
+
+
+def id_keys(series: pd.Series) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(series):
+        # Float-typed IDs (espn_id, sleeper_id) should match "12345"
+        series = series.round().astype("Int64")
+    return series.astype(str).where(series.notna())
+
+
+class _ColumnIndex:
+    """Key -> row positions for one column, stored as a single sorted
+    position array plus ``(start, stop)`` offsets per key."""
+
+    def __init__(self, keys: pd.Series):
+        codes, uniques = pd.factorize(keys, sort=False)
+        valid = codes >= 0
+        positions = np.flatnonzero(valid)
+        order = np.argsort(codes[valid], kind="stable")
+        self.positions = positions[order]
+        sorted_codes = codes[valid][order]
+        bounds = np.searchsorted(sorted_codes, np.arange(len(uniques) + 1))
+        self.offsets: Dict[str, Tuple[int, int]] = {
+            key: (int(bounds[i]), int(bounds[i + 1])) for i, key in enumerate(uniques)
+        }
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        span = self.offsets.get(key)
+        if span is None:
+            return None
+        return self.positions[span[0] : span[1]]
+
+
+class PlayerIndex:
+    """Prebuilt name/ID -> row position index over every player frame."""
+
+    def __init__(self):
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self._names: Dict[str, _ColumnIndex] = {}
+        self._ids: Dict[str, List[_ColumnIndex]] = {}
+        self._display: Dict[str, Dict[str, str]] = {}
+        self._name_ids: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def name_column(frame: pd.DataFrame) -> Optional[str]:
+        for column in PLAYER_NAME_COLUMNS:
+            if column in frame.columns:
+                return column
+        return None
+
+    def add_frame(self, name: str, frame: Optional[pd.DataFrame]) -> None:
+        """Index ``frame`` (or drop the index when ``frame`` is ``None``)."""
+        if frame is None:
+            self.remove_frame(name)
+            return
+        column = self.name_column(frame)
+        id_columns = [c for c in PLAYER_ID_COLUMNS if c in frame.columns]
+        if column is None and not id_columns:
+            self.remove_frame(name)
+            return
+
+        names = None
+        display = {}
+        name_ids = {}
+        if column is not None:
+            # Normalize each distinct name once rather than every row
+            codes, uniques = pd.factorize(frame[column])
+            normalized = np.array(
+                [normalize_name(u) for u in uniques] + [None], dtype=object
+            )
+            # codes of -1 (missing names) pick the trailing None
+            names = _ColumnIndex(pd.Series(normalized[codes], dtype=object))
+            for key, raw in zip(normalized, uniques):
+                display.setdefault(key, str(raw))
+            if id_columns:
+                keyed = pd.DataFrame(
+                    {"key": normalized[codes], "id": id_keys(frame[id_columns[0]])}
+                ).dropna()
+                keyed = keyed[~keyed["key"].duplicated()]
+                name_ids = {
+                    key: (id_columns[0], value)
+                    for key, value in zip(keyed["key"], keyed["id"])
+                }
+        ids = [_ColumnIndex(id_keys(frame[c])) for c in id_columns]
+
+        with self._lock:
+            self._frames[name] = frame
+            if names is not None:
+                self._names[name] = names
+            else:
+                self._names.pop(name, None)
+            self._ids[name] = ids
+            self._display[name] = display
+            self._name_ids[name] = name_ids
+
+    def remove_frame(self, name: str) -> None:
+        with self._lock:
+            self._frames.pop(name, None)
+            self._names.pop(name, None)
+            self._ids.pop(name, None)
+            self._display.pop(name, None)
+            self._name_ids.pop(name, None)
+
+    def frames(self) -> List[str]:
+        return list(self._frames)
+
+    def names(self) -> Dict[str, str]:
+        """Normalized key -> display name over every indexed frame."""
+        names: Dict[str, str] = {}
+        for display in list(self._display.values()):
+            for key, raw in display.items():
+                names.setdefault(key, raw)
+        return names
+
+    def name_ids(self) -> Dict[str, Tuple[str, str]]:
+        """Normalized key -> ``(id column, id)`` of the player a name belongs
+        to, for frames that carry both."""
+        ids: Dict[str, Tuple[str, str]] = {}
+        for name_ids in list(self._name_ids.values()):
+            for key, player_id in name_ids.items():
+                ids.setdefault(key, player_id)
+        return ids
+
+    def row_counts(self, frame_name: str) -> Dict[str, int]:
+        """Rows per normalized name in one frame (e.g. games played)."""
+        index = self._names.get(frame_name)
+        if index is None:
+            return {}
+        return {key: stop - start for key, (start, stop) in index.offsets.items()}
+
+    def positions(
+        self, player: str, aliases: Iterable[str] = ()
+    ) -> Dict[str, np.ndarray]:
+        """Row positions per frame for a player name or ID.
+
+        ``aliases`` are other identifiers of the same player (see
+        ``PlayerIdCrosswalk.resolve``), tried against the ID columns of
+        frames where the name does not match.
+        """
+        key = normalize_name(player)
+        raw_keys = [str(player).strip()] + [str(a) for a in aliases]
+        found = {}
+        for frame_name in list(self._frames):
+            index = self._names.get(frame_name)
+            hit = index.get(key) if index is not None else None
+            if hit is None:
+                hit = self._id_positions(frame_name, raw_keys)
+            if hit is not None and len(hit):
+                found[frame_name] = hit
+        return found
+
+    def _id_positions(self, frame_name: str, raw_keys: List[str]):
+        for id_index in self._ids.get(frame_name, []):
+            for raw in raw_keys:
+                hit = id_index.get(raw)
+                if hit is not None:
+                    return hit
+        return None
+
+    def lookup(
+        self, player: str, aliases: Iterable[str] = ()
+    ) -> Dict[str, pd.DataFrame]:
+        return {
+            frame_name: self._frames[frame_name].take(rows)
+            for frame_name, rows in self.positions(player, aliases).items()
+        }
+
+
+def player_mask(
+    frame: pd.DataFrame, player: str, aliases: Iterable[str] = ()
+) -> np.ndarray:
+    """Rows of an unindexed frame (e.g. a season partition) matching a player
+    name, or one of its identifiers when the frame has no name match."""
+    column = PlayerIndex.name_column(frame)
+    if column is not None:
+        codes, uniques = pd.factorize(frame[column])
+        key = normalize_name(player)
+        hits = [i for i, u in enumerate(uniques) if normalize_name(u) == key]
+        mask = np.isin(codes, hits)
+        if mask.any():
+            return mask
+    raw_keys = [str(player).strip()] + [str(a) for a in aliases]
+    for id_column in PLAYER_ID_COLUMNS:
+        if id_column in frame.columns:
+            mask = id_keys(frame[id_column]).isin(raw_keys).to_numpy()
+            if mask.any():
+                return mask
+    return np.zeros(len(frame), dtype=bool)
+
+
+def scan_player_rows(
+    frames: Mapping[str, pd.DataFrame], player_name: str
+) -> Dict[str, pd.DataFrame]:
+    """The original full boolean-mask scan, kept as the benchmark baseline."""
+    found = {}
+    for df_name, df in frames.items():
+        column = PlayerIndex.name_column(df)
+        if column is None:
+            continue
+        player_data = df[df[column] == player_name]
+        if not player_data.empty:
+            found[df_name] = player_data
+    return found
+
+
+def benchmark_player_lookup(
+    frames: Mapping[str, pd.DataFrame],
+    player_names: Iterable[str],
+    index: Optional[PlayerIndex] = None,
+    repeat: int = 3,
+) -> Dict[str, float]:
+    """Compare the indexed lookup with the full scan (seconds per lookup)."""
+    frames = dict(frames)
+    player_names = list(player_names)
+    build_start = time.perf_counter()
+    if index is None:
+        index = PlayerIndex()
+        for name, frame in frames.items():
+            index.add_frame(name, frame)
+    build_seconds = time.perf_counter() - build_start
+
+    def _time(func) -> float:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for player in player_names:
+                func(player)
+        return (time.perf_counter() - start) / max(1, repeat * len(player_names))
+
+    scan_seconds = _time(lambda p: scan_player_rows(frames, p))
+    index_seconds = _time(index.lookup)
+    return {
+        "lookups": len(player_names) * repeat,
+        "build_seconds": build_seconds,
+        "scan_seconds": scan_seconds,
+        "index_seconds": index_seconds,
+        "speedup": scan_seconds / index_seconds if index_seconds else float("inf"),
+    }
@@ -0,0 +1,541 @@
+import logging
+import re
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+from data.player_index import player_mask
+from data.results import DEFAULT_LIMIT, ResultSet
+from data.store import filter_frame
+from data.team_index import TeamIndex, normalize_team, team_mask, team_spellings
+
+logger = logging.getLogger(__name__)
+
+# Phrase (as lowercase words) -> dataset name, longest phrases first; "team
+# description NE" keeps "team" so the abbreviation still parses as a team
+DATASET_PHRASES = [
+    (("description",), "team_desc"),
+    (("draft", "picks"), "draft_picks"),
+    (("draft", "values"), "draft_values"),
+    (("snap", "counts"), "snap_counts"),
+    (("depth", "charts"), "depth_charts"),
+    (("win", "totals"), "win_totals"),
+    (("ngs", "passing"), "ngs_passing"),
+    (("ngs", "receiving"), "ngs_receiving"),
+    (("ngs", "rushing"), "ngs_rushing"),
+    (("schedules",), "schedules"),
+    (("schedule",), "schedules"),
+    (("injuries",), "injuries"),
+    (("officials",), "officials"),
+    (("ftn",), "ftn_data"),
+    (("weekly",), "weekly_data"),
+    (("seasonal",), "seasonal_data"),
+    (("qbr",), "qbr_data"),
+    (("combine",), "combine_data"),
+    (("rosters",), "weekly_rosters"),
+    (("pbp",), "pbp_player_stats"),
+    (("play-by-play",), "pbp_player_stats"),
+]
+
+IDENTITY_COLUMNS = [
+    "player_id",
+    "player_display_name",
+    "player_name",
+    "player",
+    "full_name",
+    "season",
+    "week",
+    "team",
+    "recent_team",
+    "opponent_team",
+]
+
+# Named column groups usable as "receiving columns only"
+COLUMN_GROUPS = {
+    "passing": [
+        "completions",
+        "attempts",
+        "passing_yards",
+        "passing_tds",
+        "interceptions",
+        "sacks",
+        "passing_air_yards",
+        "passing_epa",
+        "pacr",
+        "dakota",
+    ],
+    "rushing": [
+        "carries",
+        "rushing_yards",
+        "rushing_tds",
+        "rushing_fumbles",
+        "rushing_first_downs",
+        "rushing_epa",
+    ],
+    "receiving": [
+        "receptions",
+        "targets",
+        "receiving_yards",
+        "receiving_tds",
+        "receiving_air_yards",
+        "receiving_yards_after_catch",
+        "receiving_epa",
+        "target_share",
+        "air_yards_share",
+        "wopr",
+        "racr",
+    ],
+    "fantasy": ["fantasy_points", "fantasy_points_ppr"],
+    "redzone": [
+        "targets",
+        "red_zone_targets",
+        "carries",
+        "red_zone_carries",
+        "goal_line_carries",
+        "air_yards",
+        "receiving_epa",
+        "rushing_epa",
+        "passing_epa",
+    ],
+    "snaps": [
+        "offense_snaps",
+        "offense_pct",
+        "defense_snaps",
+        "defense_pct",
+        "st_snaps",
+        "st_pct",
+    ],
+}
+
+AGGREGATIONS = {"sum", "mean", "min", "max", "count", "median"}
+
+# Per-partition partial aggregates and how partials are combined; a mean is
+# carried as a sum and a count
+_PARTIALS = {"sum": "sum", "min": "min", "max": "max", "count": "sum"}
+# Column of the row count an aggregation falls back to without numeric columns
+ROW_COUNT = "rows"
+
+# Words that end a free-text player name
+_STOP_WORDS = {
+    "season",
+    "seasons",
+    "week",
+    "weeks",
+    "team",
+    "game",
+    "limit",
+    "cursor",
+    "page",
+    "columns",
+    "summary",
+    "group",
+    "only",
+    "explain",
+    "last",
+}
+_STOP_WORDS |= set(COLUMN_GROUPS)
+_FILTER = re.compile(r"^(\w+)(==|!=|>=|<=|=|>|<)(.+)$")
+_RANGE = re.compile(r"^(\d+)-(\d+)$")
+
+
+@dataclass
+class QuerySpec:
+    """Typed description of a stats request."""
+
+    dataset: Optional[str] = None  # None: every frame the player/team is in
+    player: Optional[str] = None
+    team: Optional[str] = None
+    seasons: Optional[List[int]] = None
+    weeks: Optional[Tuple[int, int]] = None
+    last_weeks: Optional[int] = None  # "last 4 weeks" of the latest season
+    filters: List[Tuple[str, str, Any]] = field(default_factory=list)
+    columns: Optional[List[str]] = None
+    group_by: List[str] = field(default_factory=list)
+    aggregations: Dict[str, str] = field(default_factory=dict)
+    limit: Optional[int] = DEFAULT_LIMIT
+    cursor: Optional[str] = None
+    summary: bool = False
+    explain: bool = False
+
+    def all_filters(self) -> List[Tuple[str, str, Any]]:
+        filters = list(self.filters)
+        if self.weeks is not None:
+            first, last = self.weeks
+            if first == last:
+                filters.append(("week", "==", first))
+            else:
+                filters += [("week", ">=", first), ("week", "<=", last)]
+        return filters
+
+
+@dataclass
+class QueryPlan:
+    access: str  # "player_index", "team_index", "store" or "stream"
+    datasets: Optional[List[str]]
+    pushdown_filters: List[Tuple[str, str, Any]]
+    residual_filters: List[Tuple[str, str, Any]]
+    read_columns: Optional[List[str]]
+    seasons: Optional[List[int]]
+
+    def describe(self) -> List[str]:
+        steps = [f"access via {self.access}"]
+        steps.append(
+            f"datasets: {', '.join(self.datasets) if self.datasets else 'all'}"
+        )
+        if self.seasons:
+            verb = "streamed" if self.access == "stream" else "pushed down"
+            steps.append(f"seasons {verb}: {self.seasons}")
+        if self.pushdown_filters:
+            steps.append(f"filters pushed down: {self.pushdown_filters}")
+        if self.residual_filters:
+            steps.append(f"filters applied in memory: {self.residual_filters}")
+        if self.read_columns:
+            steps.append(f"columns read: {self.read_columns}")
+        return steps
+
+
+def _int_list(text: str) -> Optional[List[int]]:
+    match = _RANGE.match(text)
+    if match:
+        first, last = sorted((int(match.group(1)), int(match.group(2))))
+        return list(range(first, last + 1))
+    values = [v for v in text.split(",") if v]
+    if values and all(v.isdigit() for v in values):
+        return [int(v) for v in values]
+    return None
+
+
+def parse_query(query: str) -> QuerySpec:
+    """Parse the GetStats text form, e.g. ``"player Travis Kelce, weeks 3-8,
+    receiving columns only"`` or ``"injuries team NE limit 10"``."""
+    spec = QuerySpec()
+    words = query.replace(",", " , ").split()
+    lowered = [w.lower() for w in words]
+
+    for phrase, dataset in DATASET_PHRASES:
+        size = len(phrase)
+        for i in range(len(lowered) - size + 1):
+            if tuple(lowered[i : i + size]) == phrase:
+                spec.dataset = dataset
+                del words[i : i + size], lowered[i : i + size]
+                break
+        if spec.dataset:
+            break
+
+    columns: List[str] = []
+    i = 0
+    while i < len(words):
+        word, low = words[i], lowered[i]
+        nxt = lowered[i + 1] if i + 1 < len(words) else None
+        if low == "player" and nxt is not None:
+            j = i + 1
+            while j < len(words) and lowered[j] not in _STOP_WORDS and words[j] != ",":
+                # Aggregations end a name but may start one ("player Max Duggan")
+                if lowered[j] in AGGREGATIONS and j > i + 1:
+                    break
+                j += 1
+            spec.player = " ".join(words[i + 1 : j]) or None
+            i = j
+            continue
+        if low == "team" and nxt is not None:
+            spec.team = normalize_team(words[i + 1])
+            i += 2
+            continue
+        if low in ("season", "seasons") and nxt and _int_list(nxt):
+            spec.seasons = _int_list(nxt)
+            i += 2
+            continue
+        if low in ("week", "weeks") and nxt and _int_list(nxt):
+            weeks = _int_list(nxt)
+            spec.weeks = (min(weeks), max(weeks))
+            i += 2
+            continue
+        if low == "last" and nxt and nxt.isdigit():
+            spec.last_weeks = int(nxt)
+            i += 3 if i + 2 < len(words) and lowered[i + 2] in ("week", "weeks") else 2
+            continue
+        if low == "game" and nxt is not None:
+            spec.filters.append(("game_id", "==", words[i + 1]))
+            i += 2
+            continue
+        if low == "limit" and nxt and nxt.isdigit():
+            spec.limit = int(nxt)
+            i += 2
+            continue
+        if low in ("cursor", "page") and nxt is not None:
+            spec.cursor = words[i + 1]
+            i += 2
+            continue
+        if low == "columns" and nxt is not None and nxt != "only":
+            columns += [c for c in words[i + 1].split(",") if c]
+            i += 2
+            continue
+        if low == "group" and nxt == "by" and i + 2 < len(words):
+            spec.group_by += [c for c in words[i + 2].split(",") if c]
+            i += 3
+            continue
+        if low in AGGREGATIONS and nxt is not None:
+            spec.aggregations[words[i + 1]] = low
+            i += 2
+            continue
+        if low in COLUMN_GROUPS:
+            columns += COLUMN_GROUPS[low]
+        elif low == "summary":
+            spec.summary = True
+        elif low == "explain":
+            spec.explain = True
+        else:
+            match = _FILTER.match(word)
+            if match:
+                op = "==" if match.group(2) == "=" else match.group(2)
+                spec.filters.append((match.group(1), op, match.group(3)))
+        i += 1
+
+    if columns:
+        # Keep the identifying columns so rows stay interpretable
+        spec.columns = IDENTITY_COLUMNS + [
+            c for c in columns if c not in IDENTITY_COLUMNS
+        ]
+    return spec
+
+
+class QueryPlanner:
+    """Turns a ``QuerySpec`` into index lookups and store reads.
+
+    Player and team selections go through the prebuilt indexes; everything
+    else is pushed down to the dataset store (seasons, filters, columns) so
+    only the rows and columns the query needs are materialized.
+    """
+
+    def __init__(self, retriever):
+        self.retriever = retriever
+
+    def plan(self, spec: QuerySpec) -> QueryPlan:
+        filters = spec.all_filters()
+        read_columns = None
+        if spec.columns is not None:
+            needed = set(spec.columns) | set(spec.group_by) | set(spec.aggregations)
+            needed |= {f[0] for f in filters}
+            read_columns = sorted(needed)
+
+        team_column = None
+        if spec.team is not None and spec.dataset is not None:
+            team_column = self._team_column(spec.dataset)
+        if spec.player is not None:
+            access = "player_index"
+        elif spec.team is not None and not isinstance(team_column, str):
+            # Home/away (or unknown) team columns need the OR-aware index
+            access = "team_index"
+        else:
+            access = "store"
+            if spec.team is not None:
+                # Seasons from before a relocation use the old abbreviation
+                filters = filters + [(team_column, "in", team_spellings(spec.team))]
+
+        if access != "store" and spec.seasons:
+            dataset = spec.dataset or "weekly_data"
+            in_memory = self.retriever.memory_seasons(dataset)
+            if in_memory is not None and not set(spec.seasons) <= set(in_memory):
+                # The indexes only cover the seasons held in memory; older
+                # seasons are scanned one partition at a time
+                return QueryPlan(
+                    "stream", [dataset], filters, [], read_columns, spec.seasons
+                )
+
+        datasets = [spec.dataset] if spec.dataset else None
+        if access == "store":
+            return QueryPlan(access, datasets, filters, [], read_columns, spec.seasons)
+        # Index paths select rows first; the rest is applied to that slice
+        residual = filters
+        if spec.seasons:
+            residual = residual + [("season", "in", spec.seasons)]
+        return QueryPlan(access, datasets, [], residual, read_columns, None)
+
+    def _team_column(self, dataset: str):
+        columns = self.retriever.dataset_columns(dataset)
+        column = TeamIndex.team_column(pd.DataFrame(columns=columns))
+        if column is None:
+            # Columns that are only ever filtered, never partitioned on
+            for candidate in ("recent_team", "team_abbr"):
+                if candidate in columns:
+                    return candidate
+        return column
+
+    def execute(self, spec: QuerySpec):
+        if spec.last_weeks is not None:
+            if spec.player is not None and spec.dataset in (None, "weekly_data"):
+                # Answered from the weekly prefix sums, no rows are scanned
+                season = spec.seasons[-1] if spec.seasons else None
+                return self.retriever.get_recent_stats(
+                    spec.player, spec.last_weeks, season
+                )
+            latest = self.retriever.aggregates.latest_week()
+            weeks = (max(1, latest - spec.last_weeks + 1), latest)
+            spec = replace(spec, weeks=weeks, last_weeks=None)
+        plan = self.plan(spec)
+        logger.info(f"Query plan: {plan.describe()}")
+
+        matched = None
+        if plan.access == "store":
+            frames = {
+                spec.dataset: self.retriever.read(
+                    spec.dataset,
+                    columns=plan.read_columns,
+                    seasons=plan.seasons,
+                    filters=plan.pushdown_filters,
+                )
+            }
+        elif plan.access == "stream":
+            frames, matched = self._stream(spec, plan)
+        elif plan.access == "player_index":
+            frames, matched = self.retriever.player_rows(spec.player, plan.datasets)
+        else:
+            frames = self.retriever.team_rows(spec.team, plan.datasets)
+
+        results = {}
+        for name, frame in frames.items():
+            meta = self.retriever.response_meta(name)
+            if spec.explain:
+                meta["plan"] = plan.describe()
+            if plan.access == "stream":
+                partitions = self.retriever.partition_stats()
+                if partitions:
+                    meta["partitions"] = partitions
+            frame = filter_frame(frame, filters=plan.residual_filters)
+            if (spec.group_by or spec.aggregations) and plan.access != "stream":
+                frame = self._aggregate(frame, spec)
+            if frame.empty and spec.dataset is None:
+                continue
+            if spec.columns and not spec.aggregations:
+                if not set(spec.columns) - set(IDENTITY_COLUMNS) & set(frame.columns):
+                    continue
+            results[name] = ResultSet(
+                frame,
+                columns=None if spec.aggregations else spec.columns,
+                limit=spec.limit,
+                cursor=spec.cursor,
+                meta=meta,
+                name=name,
+            )
+
+        if spec.dataset is not None:
+            return results.get(spec.dataset, ResultSet(pd.DataFrame()))
+        payload: Dict[str, Any] = {
+            name: result.to_dict(spec.summary) for name, result in results.items()
+        }
+        if payload and matched is not None:
+            payload["matched_player"] = [matched]
+        return payload
+
+    def _stream(self, spec: QuerySpec, plan: QueryPlan):
+        """Scan the plan's seasons one partition at a time, keeping only the
+        matching rows, or only per-season partial aggregates."""
+        name = plan.datasets[0]
+        matched, aliases, player = None, [], spec.player
+        if player is not None:
+            player, aliases, matched = self.retriever.resolve_player(player)
+        # Matched on normalized values, so historical abbreviations (OAK, SD)
+        # still count for the team they became
+        team_columns = self._team_column(name) if spec.team is not None else None
+
+        aggregate = bool(spec.group_by or spec.aggregations)
+        decomposable = all(
+            f in _PARTIALS or f == "mean" for f in spec.aggregations.values()
+        )
+        parts = []
+        for season, part in self.retriever.iter_seasons(
+            name, plan.seasons, filters=plan.pushdown_filters
+        ):
+            if player is not None:
+                part = part[player_mask(part, player, aliases)]
+            if spec.team is not None:
+                part = part[team_mask(part, spec.team, team_columns or ())]
+            if part.empty:
+                continue
+            if aggregate and decomposable:
+                part = self._partial(part, spec)
+            parts.append(part)
+
+        frame = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+        if aggregate and not frame.empty:
+            if decomposable:
+                frame = self._combine(frame, spec)
+            else:
+                frame = self._aggregate(frame, spec)
+        if matched is not None and frame.empty:
+            matched = None
+        return {name: frame}, matched
+
+    @staticmethod
+    def _aggregations(frame: pd.DataFrame, spec: QuerySpec) -> Dict[str, str]:
+        group_by = [c for c in spec.group_by if c in frame.columns]
+        aggregations = {
+            c: f for c, f in spec.aggregations.items() if c in frame.columns
+        }
+        if not aggregations:
+            numeric = frame.select_dtypes(include="number").columns
+            aggregations = {c: "sum" for c in numeric if c not in group_by}
+        return aggregations
+
+    @classmethod
+    def _aggregate(cls, frame: pd.DataFrame, spec: QuerySpec) -> pd.DataFrame:
+        group_by = [c for c in spec.group_by if c in frame.columns]
+        aggregations = cls._aggregations(frame, spec)
+        if not aggregations:
+            # Nothing to aggregate (e.g. injury reports): count rows instead
+            if not group_by:
+                return pd.DataFrame({ROW_COUNT: [len(frame)]})
+            return (
+                frame.groupby(group_by, observed=True, sort=True)
+                .size()
+                .reset_index(name=ROW_COUNT)
+            )
+        if not group_by:
+            return frame.agg(aggregations).to_frame().T
+        return (
+            frame.groupby(group_by, observed=True, sort=True)
+            .agg(aggregations)
+            .reset_index()
+        )
+
+    @classmethod
+    def _partial(cls, frame: pd.DataFrame, spec: QuerySpec) -> pd.DataFrame:
+        # Means become a sum and a count, combined once every season is in
+        partial = {}
+        for column, func in cls._aggregations(frame, spec).items():
+            if func == "mean":
+                partial[f"{column}:sum"] = pd.NamedAgg(column, "sum")
+                partial[f"{column}:count"] = pd.NamedAgg(column, "count")
+            else:
+                partial[f"{column}:{func}"] = pd.NamedAgg(column, func)
+        if not partial:
+            partial[f"{ROW_COUNT}:count"] = pd.NamedAgg(frame.columns[0], "size")
+        group_by = [c for c in spec.group_by if c in frame.columns]
+        if not group_by:
+            return frame.groupby(lambda _: 0).agg(**partial)
+        return (
+            frame.groupby(group_by, observed=True, sort=True)
+            .agg(**partial)
+            .reset_index()
+        )
+
+    @staticmethod
+    def _combine(partials: pd.DataFrame, spec: QuerySpec) -> pd.DataFrame:
+        group_by = [c for c in spec.group_by if c in partials.columns]
+        combine = {}
+        for key in partials.columns:
+            if key not in group_by:
+                combine[key] = _PARTIALS[key.rsplit(":", 1)[1]]
+        if group_by:
+            frame = partials.groupby(group_by, observed=True, sort=True).agg(combine)
+        else:
+            frame = partials.agg(combine).to_frame().T
+        result = pd.DataFrame(index=frame.index)
+        for key in frame.columns:
+            column, func = key.rsplit(":", 1)
+            if f"{column}:sum" in frame and f"{column}:count" in frame:
+                if func == "sum":
+                    result[column] = frame[key] / frame[f"{column}:count"]
+            else:
+                result[column] = frame[key]
+        return result.reset_index() if group_by else result.reset_index(drop=True)
@@ -0,0 +1,491 @@
+import logging
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+import pandas as pd
+from data.compaction import CompactionReport, compact_frame
+from data.dataset_cache import DatasetCache, high_water
+from data.freshness import DEFAULT_POLICY, FreshnessPolicy, describe_freshness
+from data.loader import LoadReport, load_concurrently
+from data.partitions import DEFAULT_MAX_BYTES, SeasonPartitions
+from data.store import Filters, filter_frame
+
+logger = logging.getLogger(__name__)
+
+DatasetSpec = Tuple[Callable[..., pd.DataFrame], Dict[str, Any]]
+
+
+class DatasetRegistry(Mapping):
+    """Named NFL datasets that are only fetched when first accessed.
+
+    ``registry["weekly_data"]`` and ``registry.weekly_data`` both load the
+    frame on demand; ``touched`` records which frames a session actually used.
+    Expired datasets are refetched in the background per their
+    ``FreshnessPolicy`` while the cached copy keeps being served.
+
+    Frames hold the seasons in their spec's ``years``; any other configured
+    season is loaded per partition on demand (``iter_seasons``) and kept in
+    an LRU cache bounded by ``max_partition_bytes``.
+    """
+
+    def __init__(
+        self,
+        specs: Dict[str, DatasetSpec],
+        fetch: Optional[Callable[[Callable[..., Any], Dict[str, Any]], Any]] = None,
+        cache: Optional[DatasetCache] = None,
+        policies: Optional[Dict[str, FreshnessPolicy]] = None,
+        default_policy: FreshnessPolicy = DEFAULT_POLICY,
+        compact: bool = False,
+        schemas: Optional[Dict[str, Dict[str, str]]] = None,
+        seasons: Optional[Sequence[int]] = None,
+        max_partition_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self._specs = dict(specs)
+        if seasons is None:
+            seasons = {
+                y for _, kw in self._specs.values() for y in kw.get("years") or []
+            }
+        self.seasons = sorted(int(s) for s in seasons)
+        self._partitions = SeasonPartitions(self._load_season, max_partition_bytes)
+        self._policies = dict(policies or {})
+        self._default_policy = default_policy
+        self._compact_frames = compact
+        self._schemas = dict(schemas or {})
+        self._compaction: Dict[str, CompactionReport] = {}
+        self._cache = cache
+        if fetch is None:
+            fetch = cache.get if cache else lambda func, kwargs: func(**kwargs)
+        self._fetch = fetch
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self._locks = {name: threading.Lock() for name in self._specs}
+        self._load_seconds: Dict[str, float] = {}
+        self._touched: Set[str] = set()
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._listeners: List[Tuple[Callable, Optional[Callable]]] = []
+        self._version = 0
+        self._served: Set[str] = set()
+        self._fetched_at: Dict[str, float] = {}
+        self._revalidating: Set[str] = set()
+        self._revalidate_failed_at: Dict[str, float] = {}
+        self._revalidate_executor: Optional[ThreadPoolExecutor] = None
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        if name not in self._specs:
+            raise KeyError(name)
+        self._touched.add(name)
+        frame = self._load(name)
+        if self._check_freshness(name):
+            frame = self._frames.get(name, frame)
+        return frame
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._specs
+
+    def __getattr__(self, name: str) -> pd.DataFrame:
+        if name.startswith("_") or name not in self._specs:
+            raise AttributeError(name)
+        return self[name]
+
+    def _load(self, name: str) -> pd.DataFrame:
+        frame = self._frames.get(name)
+        if frame is not None:
+            return frame
+        with self._locks[name]:
+            frame = self._frames.get(name)
+            if frame is not None:
+                return frame
+            func, kwargs = self._specs[name]
+            start = time.perf_counter()
+            try:
+                frame = self._fetch(func, kwargs)
+            except Exception as e:
+                # Not memoized, so the next access retries the fetch
+                logger.error(f"Error loading dataset {name}: {str(e)}")
+                return pd.DataFrame()
+            self._load_seconds[name] = time.perf_counter() - start
+            frame = self._compact(name, frame)
+            self._frames[name] = frame
+            self._fetched_at[name] = self._source_time(name)
+            logger.info(f"Loaded dataset {name} in {self._load_seconds[name]:.2f}s")
+            self._notify(name, frame)
+            return frame
+
+    def _compact(self, name: str, frame: pd.DataFrame) -> pd.DataFrame:
+        if not self._compact_frames or frame.empty:
+            return frame
+        frame, report = compact_frame(frame, self._schemas.get(name), name=name)
+        self._compaction[name] = report
+        return frame
+
+    def compaction_report(self) -> Dict[str, CompactionReport]:
+        """Bytes saved by dtype compaction, per loaded dataset."""
+        return {n: r for n, r in self._compaction.items() if n in self._frames}
+
+    def add_listener(
+        self,
+        callback: Callable[[str, Optional[pd.DataFrame]], None],
+        on_append: Optional[Callable[[str, pd.DataFrame, pd.DataFrame], None]] = None,
+    ) -> None:
+        """Call ``callback(name, frame)`` whenever a frame is loaded, and
+        ``callback(name, None)`` when it is dropped, so derived structures
+        (indexes, aggregates) are built once per load.
+
+        After an incremental refresh ``on_append(name, frame, new_rows)`` is
+        called instead, if given, so only structures that depend on the new
+        rows need updating.
+        """
+        self._listeners.append((callback, on_append))
+
+    def _notify(
+        self,
+        name: str,
+        frame: Optional[pd.DataFrame],
+        new_rows: Optional[pd.DataFrame] = None,
+    ) -> None:
+        # A first load adds data; anything after it changes data already served
+        if name in self._served:
+            self._version += 1
+        self._served.add(name)
+        for callback, on_append in self._listeners:
+            try:
+                if new_rows is not None and on_append is not None:
+                    on_append(name, frame, new_rows)
+                else:
+                    callback(name, frame)
+            except Exception as e:
+                logger.error(f"Error in dataset listener for {name}: {str(e)}")
+
+    def read(
+        self,
+        name: str,
+        columns: Optional[Sequence[str]] = None,
+        seasons: Optional[Iterable[int]] = None,
+        filters: Optional[Filters] = None,
+    ) -> pd.DataFrame:
+        """Return only the ``columns``/``seasons``/rows a query needs.
+
+        A frame that is already in memory is filtered in place; otherwise the
+        projection and filters are pushed down to the on-disk store and the
+        full frame is never materialized.
+        """
+        if name not in self._specs:
+            raise KeyError(name)
+        self._touched.add(name)
+        self._check_freshness(name)
+        filters = list(filters or [])
+        if seasons is not None:
+            filters.append(("season", "in", sorted(int(s) for s in seasons)))
+        frame = self._frames.get(name)
+        if seasons is not None and self._outside_memory(name, seasons):
+            if self._cache is None:
+                parts = [
+                    p for _, p in self.iter_seasons(name, seasons, columns, filters)
+                ]
+                return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+            frame = None
+        if frame is None and self._cache is not None:
+            func, kwargs = self._specs[name]
+            if seasons is not None and "years" in kwargs:
+                kwargs = {**kwargs, "years": sorted(int(s) for s in seasons)}
+            try:
+                return self._cache.get(func, kwargs, columns=columns, filters=filters)
+            except Exception as e:
+                logger.error(f"Error reading dataset {name}: {str(e)}")
+                return pd.DataFrame()
+        if frame is None:
+            frame = self._load(name)
+        return filter_frame(frame, columns=columns, filters=filters)
+
+    def memory_seasons(self, name: str) -> Optional[List[int]]:
+        """Seasons the in-memory frame of ``name`` covers (``None`` for
+        datasets not fetched by season)."""
+        years = self._specs[name][1].get("years")
+        return None if years is None else sorted(int(y) for y in years)
+
+    def _outside_memory(self, name: str, seasons: Iterable[int]) -> bool:
+        in_memory = self.memory_seasons(name)
+        return in_memory is not None and not {int(s) for s in seasons} <= set(in_memory)
+
+    def _load_season(self, name: str, season: int) -> pd.DataFrame:
+        func, kwargs = self._specs[name]
+        if "years" not in kwargs:
+            raise KeyError(f"{name} is not partitioned by season")
+        frame = self._fetch(func, {**kwargs, "years": [season]})
+        if self._compact_frames and not frame.empty:
+            frame, _ = compact_frame(frame, self._schemas.get(name), name=name)
+        return frame
+
+    def iter_seasons(
+        self,
+        name: str,
+        seasons: Optional[Iterable[int]] = None,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[Filters] = None,
+    ) -> Iterator[Tuple[int, pd.DataFrame]]:
+        """Yield ``(season, rows)`` one season at a time, so a query over
+        many seasons never holds more than the partition cache allows."""
+        if name not in self._specs:
+            raise KeyError(name)
+        self._touched.add(name)
+        in_memory = set(self.memory_seasons(name) or [])
+        for season in sorted(int(s) for s in (seasons or self.seasons)):
+            frame = self._frames.get(name)
+            if frame is not None and season in in_memory:
+                part = frame[frame["season"] == season] if "season" in frame else frame
+            else:
+                try:
+                    part = self._partitions.get(name, season)
+                except Exception as e:
+                    logger.error(f"Error loading {name} season {season}: {str(e)}")
+                    continue
+            yield season, filter_frame(part, columns=columns, filters=filters)
+
+    def partition_stats(self) -> Dict[str, int]:
+        return self._partitions.stats()
+
+    def columns(self, name: str) -> List[str]:
+        """Column names of ``name``, from memory or the store's manifest, so
+        queries can be planned before any rows are read."""
+        frame = self._frames.get(name)
+        if frame is None and self._cache is not None:
+            func, kwargs = self._specs[name]
+            columns = self._cache.columns(func, kwargs)
+            if columns is not None:
+                return list(columns)
+        if frame is None:
+            frame = self[name]
+        return list(frame.columns)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._frames
+
+    def unload(self, name: str) -> None:
+        with self._locks[name]:
+            self._fetched_at.pop(name, None)
+            if self._frames.pop(name, None) is not None:
+                self._notify(name, None)
+
+    def invalidate(self, name: str) -> None:
+        """Drop ``name`` from memory and from the cache; other variants of
+        the same function are left alone."""
+        func, kwargs = self._specs[name]
+        with self._locks[name]:
+            self._fetched_at.pop(name, None)
+            self._partitions.evict(name)
+            if self._frames.pop(name, None) is not None:
+                self._notify(name, None)
+            if self._cache is not None:
+                self._cache.invalidate(func, kwargs)
+
+    def data_version(self) -> str:
+        """Changes whenever a dataset is refreshed or revalidated, in memory
+        or in the store, or a loaded one is dropped, so anything derived from
+        the data can be keyed on it."""
+        return str(self._version)
+
+    def policy(self, name: str) -> FreshnessPolicy:
+        return self._policies.get(name, self._default_policy)
+
+    def _source_time(self, name: str) -> float:
+        # Frames served from the store are as old as their stored partitions
+        if self._cache is not None:
+            func, kwargs = self._specs[name]
+            fetched_at = self._cache.fetched_at(func, kwargs)
+            if fetched_at is not None:
+                return fetched_at
+        return time.time()
+
+    def _fetch_time(self, name: str) -> Optional[float]:
+        fetched_at = self._fetched_at.get(name)
+        if fetched_at is None and self._cache is not None:
+            func, kwargs = self._specs[name]
+            fetched_at = self._cache.fetched_at(func, kwargs)
+        return fetched_at
+
+    def freshness(self, name: str) -> Optional[Dict[str, Any]]:
+        """Age of the copy of ``name`` being served, for responses."""
+        fetched_at = self._fetch_time(name)
+        if fetched_at is None:
+            return None
+        return describe_freshness(
+            fetched_at, self.policy(name), name in self._revalidating
+        )
+
+    def _check_freshness(self, name: str) -> bool:
+        """Start revalidating ``name`` if it expired; returns True if it was
+        refetched synchronously (policies without stale-while-revalidate)."""
+        fetched_at = self._fetch_time(name)
+        policy = self.policy(name)
+        if fetched_at is None or not policy.is_stale(fetched_at):
+            return False
+        failed_at = self._revalidate_failed_at.get(name)
+        if failed_at is not None and time.time() - failed_at < policy.retry_after:
+            return False
+        with self._locks[name]:
+            if name in self._revalidating:
+                return False
+            self._revalidating.add(name)
+        if not policy.stale_while_revalidate:
+            self._revalidate(name)
+            return True
+        if self._revalidate_executor is None:
+            self._revalidate_executor = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="dataset-revalidate"
+            )
+        self._revalidate_executor.submit(self._revalidate, name)
+        return False
+
+    def _revalidate(self, name: str) -> None:
+        func, kwargs = self._specs[name]
+        try:
+            if self._cache is not None:
+                self._cache.refetch(func, kwargs)
+                # Stored copies are read directly too, loaded or not
+                self._version += 1
+                frame = self._cache.get(func, kwargs) if self.is_loaded(name) else None
+            else:
+                # Through the configured fetch, like any other load
+                frame = self._fetch(func, kwargs) if self.is_loaded(name) else None
+            with self._locks[name]:
+                self._fetched_at[name] = self._source_time(name)
+                self._partitions.evict(name)
+                self._revalidate_failed_at.pop(name, None)
+                self._revalidating.discard(name)
+                # Swap in the new copy only if the frame is still in use
+                if frame is not None and name in self._frames:
+                    frame = self._compact(name, frame)
+                    self._frames[name] = frame
+                    self._notify(name, frame)
+            logger.info(f"Revalidated dataset {name}")
+        except Exception as e:
+            self._revalidate_failed_at[name] = time.time()
+            logger.error(f"Error revalidating dataset {name}: {str(e)}")
+        finally:
+            self._revalidating.discard(name)
+
+    def refresh(self, name: str, season: Optional[int] = None) -> pd.DataFrame:
+        """Pull the weeks of ``season`` (default: the latest configured one)
+        from the stored high-water mark on and append them, to the store and
+        to the frame in memory if it is loaded. Rows of the high-water week
+        are replaced, so revisions to it are picked up.
+
+        Returns the new rows. Without a cache the frame is only unloaded, so
+        the next access refetches it.
+        """
+        func, kwargs = self._specs[name]
+        if self._cache is None:
+            self.unload(name)
+            return pd.DataFrame()
+        if season is None:
+            years = kwargs.get("years")
+            mark = self._cache.high_water(func, kwargs)
+            season = max(years) if years else (mark or {}).get("season")
+        if season is None:
+            raise ValueError(f"Dataset {name} is not partitioned by season")
+        with self._locks[name]:
+            new_rows = self._cache.update(func, kwargs, int(season))
+            if not new_rows.empty:
+                self._version += 1
+            self._fetched_at[name] = self._source_time(name)
+            self._partitions.evict(name)
+            frame = self._frames.get(name)
+            mark = high_water(frame) if frame is not None else None
+            if mark is not None and not new_rows.empty:
+                # Weeks the frame in memory already holds are replaced
+                weeks = pd.MultiIndex.from_frame(new_rows[["season", "week"]])
+                held = pd.MultiIndex.from_frame(frame[["season", "week"]])
+                frame = frame[~held.isin(weeks)]
+            if frame is not None and not new_rows.empty:
+                frame = pd.concat([frame, new_rows], ignore_index=True)
+                frame = self._compact(name, frame)
+                self._frames[name] = frame
+                self._notify(name, frame, new_rows)
+        logger.info(f"Refreshed {name} season {season}: {len(new_rows)} new rows")
+        return new_rows
+
+    def prefetch(
+        self,
+        names: Optional[Iterable[str]] = None,
+        background: bool = True,
+        max_workers: int = 8,
+        timeout: Optional[float] = None,
+    ):
+        """Load ``names`` (default: all) ahead of use.
+
+        In the background a ``Future`` resolving to the ``LoadReport`` is
+        returned; otherwise the report itself. Prefetched frames are not
+        counted as touched.
+        """
+        names = [n for n in (names or self._specs) if not self.is_loaded(n)]
+        if not background:
+            return self._prefetch(names, max_workers, timeout)
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="dataset-prefetch"
+            )
+        future: Future = self._prefetch_executor.submit(
+            self._prefetch, names, max_workers, timeout
+        )
+        return future
+
+    def _prefetch(
+        self, names: Iterable[str], max_workers: int, timeout: Optional[float]
+    ) -> LoadReport:
+        names = list(names)
+        tasks = [
+            (self._fetch, {"func": self._specs[n][0], "kwargs": self._specs[n][1]})
+            for n in names
+        ]
+        results, report = load_concurrently(
+            tasks,
+            names=names,
+            max_workers=max_workers,
+            timeout=timeout,
+            progress=False,
+            desc="Prefetching NFL data",
+        )
+        timings = {t.name: t.seconds for t in report.timings}
+        for name, frame in zip(names, results):
+            if frame is None:
+                continue
+            with self._locks[name]:
+                if name not in self._frames:
+                    frame = self._compact(name, frame)
+                    self._frames[name] = frame
+                    self._load_seconds[name] = timings.get(name, 0.0)
+                    self._fetched_at[name] = self._source_time(name)
+                    self._notify(name, frame)
+        return report
+
+    @property
+    def touched(self) -> Set[str]:
+        return set(self._touched)
+
+    def usage_report(self) -> Dict[str, Dict[str, Any]]:
+        report = {}
+        for name in self._specs:
+            frame = self._frames.get(name)
+            report[name] = {
+                "touched": name in self._touched,
+                "loaded": frame is not None,
+                "rows": len(frame) if frame is not None else 0,
+                "bytes": (
+                    int(frame.memory_usage(deep=True).sum()) if frame is not None else 0
+                ),
+                "load_seconds": self._load_seconds.get(name),
+                "bytes_saved": (
+                    self._compaction[name].bytes_saved
+                    if frame is not None and name in self._compaction
+                    else 0
+                ),
+            }
+        return report
@@ -0,0 +1,139 @@
+import base64
+import json
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import pandas as pd
+
+# Rows per page handed to the LLM unless a query asks for more
+DEFAULT_LIMIT = 25
+MAX_LIMIT = 500
+TOP_VALUES = 5
+
+
+def encode_cursor(offset: int, dataset: Optional[str] = None) -> str:
+    """Cursor for ``offset``; with ``dataset`` it only pages that dataset."""
+    value = f"o:{offset}" if dataset is None else f"o:{offset}:{dataset}"
+    return base64.urlsafe_b64encode(value.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], dataset: Optional[str] = None) -> int:
+    """Offset of ``cursor``; 0 if it is invalid or was issued for another
+    dataset than ``dataset``, so paging one frame of a multi-dataset payload
+    leaves the others at their first page."""
+    if not cursor:
+        return 0
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        kind, offset, *named = base64.urlsafe_b64decode(padded).decode().split(":", 2)
+        if kind != "o" or (named and named[0] != dataset):
+            return 0
+        return max(0, int(offset))
+    except (ValueError, UnicodeDecodeError):
+        return 0
+
+
+def _records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    # float32 columns (compacted frames) would otherwise print as
+    # 0.10000000149011612
+    narrow = frame.select_dtypes(include="float32").columns
+    if len(narrow):
+        frame = frame.astype({c: "float64" for c in narrow}).round(
+            {c: 6 for c in narrow}
+        )
+    return frame.to_dict("records")
+
+
+class ResultSet:
+    """A lazily-consumed query result.
+
+    Nothing is converted to Python dicts until a page is requested or the
+    result is iterated; ``page()`` returns at most ``limit`` rows with a
+    cursor for the next page, and ``summary()`` aggregates instead of listing.
+    Cursors carry the dataset ``name``, so they only page the result they
+    came from.
+    """
+
+    def __init__(
+        self,
+        frame: pd.DataFrame,
+        columns: Optional[Sequence[str]] = None,
+        limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        meta: Optional[Dict[str, Any]] = None,
+        name: Optional[str] = None,
+    ):
+        if columns:
+            frame = frame[[c for c in columns if c in frame.columns]]
+        self.frame = frame
+        self.name = name
+        self.limit = None if limit is None else max(1, min(int(limit), MAX_LIMIT))
+        self.offset = decode_cursor(cursor, name)
+        self.meta = dict(meta or {})
+
+    @property
+    def total(self) -> int:
+        return len(self.frame)
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.frame.columns)
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __bool__(self) -> bool:
+        return self.total > 0
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.iter_records()
+
+    def iter_records(self, chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Yield every row as a dict, converting one chunk at a time."""
+        for start in range(0, self.total, chunk_size):
+            yield from _records(self.frame.iloc[start : start + chunk_size])
+
+    def page(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        offset = self.offset if cursor is None else decode_cursor(cursor, self.name)
+        limit = self.limit if limit is None else max(1, min(int(limit), MAX_LIMIT))
+        stop = self.total if limit is None else min(self.total, offset + limit)
+        records = _records(self.frame.iloc[offset:stop])
+        page = {
+            "records": records,
+            "total": self.total,
+            "offset": offset,
+            "next_cursor": (
+                encode_cursor(stop, self.name) if stop < self.total else None
+            ),
+        }
+        page.update(self.meta)
+        return page
+
+    def summary(self) -> Dict[str, Any]:
+        summary: Dict[str, Any] = {"total": self.total, "columns": self.columns}
+        numeric = self.frame.select_dtypes(include="number")
+        if not numeric.empty:
+            stats = numeric.agg(["mean", "min", "max", "sum"]).round(3)
+            summary["numeric"] = stats.to_dict()
+        other = [c for c in self.frame.columns if c not in numeric.columns]
+        summary["top_values"] = {
+            column: self.frame[column]
+            .astype(str)
+            .value_counts()
+            .head(TOP_VALUES)
+            .to_dict()
+            for column in other
+            if self.frame[column].nunique(dropna=True) > 0
+        }
+        summary.update(self.meta)
+        return summary
+
+    def to_dict(self, summary: bool = False) -> Dict[str, Any]:
+        return self.summary() if summary else self.page()
+
+    def __str__(self) -> str:
+        return json.dumps(self.to_dict(), default=str)
+
+    def __repr__(self) -> str:
+        return f"ResultSet(total={self.total}, columns={len(self.columns)}, limit={self.limit})"
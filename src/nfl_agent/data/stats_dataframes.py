@@ -1,10 +1,15 @@
+import logging
 import os
 import warnings
 
-from joblib import Memory
-from tqdm import tqdm
-
 import nfl_data_py as nfl
+from data.dataset_cache import DatasetCache
+from data.freshness import DAY, HOUR, FreshnessPolicy
+from data.partitions import parse_seasons
+from data.pbp import import_pbp_player_stats
+from data.registry import DatasetRegistry
+
+logger = logging.getLogger(__name__)
 
 # Suppress specific warnings
 warnings.filterwarnings(
@@ -14,8 +19,12 @@ warnings.filterwarnings(
 )
 warnings.filterwarnings("ignore", category=UserWarning, message="Downcasting floats.")
 
-# Define the years for which you want to fetch data
-years = [2024]  # Adjust as needed
+# Every season queries may reach, e.g. NFL_DATA_SEASONS=2014-2024
+seasons = parse_seasons(os.getenv("NFL_DATA_SEASONS", "2024"))
+
+# The most recent seasons are held in memory and indexed; older ones are
+# loaded per season on demand, under NFL_DATA_PARTITION_MB of memory
+years = seasons[-max(int(os.getenv("NFL_DATA_SEASONS_IN_MEMORY", "1")), 1) :]
 
 # Determine the project root directory
 data_root = os.path.dirname(os.path.abspath(__file__))
@@ -23,75 +32,129 @@ data_root = os.path.dirname(os.path.abspath(__file__))
 # Set up caching directory relative to the project root
 cache_dir = os.path.join(data_root, ".nfl_cache")
 os.makedirs(cache_dir, exist_ok=True)
-memory = Memory(cache_dir, verbose=0)
-
-# List of functions to call and their arguments
-tasks = [
-    (nfl.import_weekly_data, {"years": years}),
-    (nfl.import_seasonal_data, {"years": years, "s_type": "ALL"}),
-    (nfl.import_seasonal_rosters, {"years": years}),
-    (nfl.import_weekly_rosters, {"years": years}),
-    (nfl.import_win_totals, {"years": years}),
-    (nfl.import_sc_lines, {"years": years}),
-    (nfl.import_officials, {"years": years}),
-    (nfl.import_draft_picks, {"years": years}),
-    (nfl.import_draft_values, {}),
-    (nfl.import_team_desc, {}),
-    (nfl.import_schedules, {"years": years}),
-    (nfl.import_combine_data, {"years": years}),
-    (nfl.import_ids, {}),
-    (nfl.import_ngs_data, {"stat_type": "passing", "years": years}),
-    (nfl.import_ngs_data, {"stat_type": "receiving", "years": years}),
-    (nfl.import_ngs_data, {"stat_type": "rushing", "years": years}),
-    (nfl.import_depth_charts, {"years": years}),
-    (nfl.import_injuries, {"years": years}),
-    (nfl.import_qbr, {"years": years, "level": "nfl", "frequency": "season"}),
-    (nfl.import_seasonal_pfr, {"s_type": "pass", "years": years}),
-    (nfl.import_seasonal_pfr, {"s_type": "rush", "years": years}),
-    (nfl.import_seasonal_pfr, {"s_type": "rec", "years": years}),
-    (nfl.import_weekly_pfr, {"s_type": "pass", "years": years}),
-    (nfl.import_weekly_pfr, {"s_type": "rush", "years": years}),
-    (nfl.import_weekly_pfr, {"s_type": "rec", "years": years}),
-    (nfl.import_snap_counts, {"years": years}),
-    (nfl.import_ftn_data, {"years": years}),
+
+# One cache entry per function and canonicalized arguments, so parameterized
+# imports (NGS / PFR variants) are stored and invalidated independently
+dataset_cache = DatasetCache(cache_dir)
+
+# Datasets by the name they are exposed under, with the function and
+# arguments used to fetch them
+datasets = {
+    "weekly_data": (nfl.import_weekly_data, {"years": years}),
+    "seasonal_data": (nfl.import_seasonal_data, {"years": years, "s_type": "ALL"}),
+    "seasonal_rosters": (nfl.import_seasonal_rosters, {"years": years}),
+    "weekly_rosters": (nfl.import_weekly_rosters, {"years": years}),
+    "win_totals": (nfl.import_win_totals, {"years": years}),
+    "sc_lines": (nfl.import_sc_lines, {"years": years}),
+    "officials": (nfl.import_officials, {"years": years}),
+    "draft_picks": (nfl.import_draft_picks, {"years": years}),
+    "draft_values": (nfl.import_draft_values, {}),
+    "team_desc": (nfl.import_team_desc, {}),
+    "schedules": (nfl.import_schedules, {"years": years}),
+    "combine_data": (nfl.import_combine_data, {"years": years}),
+    "ids": (nfl.import_ids, {}),
+    "ngs_passing": (nfl.import_ngs_data, {"stat_type": "passing", "years": years}),
+    "ngs_receiving": (
+        nfl.import_ngs_data,
+        {"stat_type": "receiving", "years": years},
+    ),
+    "ngs_rushing": (nfl.import_ngs_data, {"stat_type": "rushing", "years": years}),
+    "depth_charts": (nfl.import_depth_charts, {"years": years}),
+    "injuries": (nfl.import_injuries, {"years": years}),
+    "qbr_data": (
+        nfl.import_qbr,
+        {"years": years, "level": "nfl", "frequency": "season"},
+    ),
+    "pfr_seasonal_passing": (
+        nfl.import_seasonal_pfr,
+        {"s_type": "pass", "years": years},
+    ),
+    "pfr_seasonal_rushing": (
+        nfl.import_seasonal_pfr,
+        {"s_type": "rush", "years": years},
+    ),
+    "pfr_seasonal_receiving": (
+        nfl.import_seasonal_pfr,
+        {"s_type": "rec", "years": years},
+    ),
+    "pfr_weekly_passing": (nfl.import_weekly_pfr, {"s_type": "pass", "years": years}),
+    "pfr_weekly_rushing": (nfl.import_weekly_pfr, {"s_type": "rush", "years": years}),
+    "pfr_weekly_receiving": (nfl.import_weekly_pfr, {"s_type": "rec", "years": years}),
+    "snap_counts": (nfl.import_snap_counts, {"years": years}),
+    "ftn_data": (nfl.import_ftn_data, {"years": years}),
+    # Red-zone / goal-line usage, air yards and EPA per player and week,
+    # reduced from play-by-play in bounded batches (raw plays are not kept)
+    "pbp_player_stats": (import_pbp_player_stats, {"years": years}),
+}
+
+# How long each dataset may be served before it is refetched in the
+# background; game-day datasets expire hourly, reference data rarely
+freshness_policies = {
+    "injuries": FreshnessPolicy(ttl=HOUR),
+    "depth_charts": FreshnessPolicy(ttl=HOUR),
+    "weekly_data": FreshnessPolicy(ttl=6 * HOUR),
+    "weekly_rosters": FreshnessPolicy(ttl=6 * HOUR),
+    "snap_counts": FreshnessPolicy(ttl=6 * HOUR),
+    "ftn_data": FreshnessPolicy(ttl=6 * HOUR),
+    "pbp_player_stats": FreshnessPolicy(ttl=6 * HOUR),
+    "pfr_weekly_passing": FreshnessPolicy(ttl=6 * HOUR),
+    "pfr_weekly_rushing": FreshnessPolicy(ttl=6 * HOUR),
+    "pfr_weekly_receiving": FreshnessPolicy(ttl=6 * HOUR),
+    "schedules": FreshnessPolicy(ttl=12 * HOUR),
+    "sc_lines": FreshnessPolicy(ttl=12 * HOUR),
+    "draft_values": FreshnessPolicy(ttl=30 * DAY),
+    "team_desc": FreshnessPolicy(ttl=30 * DAY),
+    "draft_picks": FreshnessPolicy(ttl=7 * DAY),
+    "combine_data": FreshnessPolicy(ttl=7 * DAY),
+}
+
+
+# Nothing is fetched at import time; each dataset is loaded (from the dataset
+# cache or nfl_data_py) the first time it is accessed
+registry = DatasetRegistry(
+    datasets,
+    cache=dataset_cache,
+    policies=freshness_policies,
+    default_policy=FreshnessPolicy(ttl=DAY),
+    # Categoricals and downcast numerics; NFL_DATA_COMPACT=0 keeps raw dtypes
+    compact=os.getenv("NFL_DATA_COMPACT", "1") == "1",
+    seasons=seasons,
+    max_partition_bytes=int(os.getenv("NFL_DATA_PARTITION_MB", "512")) * 1024 * 1024,
+)
+
+# Optionally warm every dataset in the background (bounded, concurrent)
+if os.getenv("NFL_DATA_PREFETCH", "0") == "1":
+    registry.prefetch(
+        max_workers=int(os.getenv("NFL_DATA_WORKERS", "8")),
+        timeout=float(os.getenv("NFL_DATA_TIMEOUT", "0")) or None,
+    )
+
+# Datasets that change week to week during the season
+WEEKLY_DATASETS = [
+    "weekly_data",
+    "snap_counts",
+    "injuries",
+    "depth_charts",
+    "weekly_rosters",
+    "pbp_player_stats",
 ]
 
-# Initialize an empty dictionary to store the results
-results = {}
-
-# Iterate over tasks with a progress bar
-for func, kwargs in tqdm(tasks, desc="Fetching NFL data"):
-    cached_func = memory.cache(func)
-    result_key = func.__name__
-    results[result_key] = cached_func(**kwargs)
-
-# Access the results using the keys
-weekly_data = results["import_weekly_data"]
-seasonal_data = results["import_seasonal_data"]
-seasonal_rosters = results["import_seasonal_rosters"]
-weekly_rosters = results["import_weekly_rosters"]
-win_totals = results["import_win_totals"]
-sc_lines = results["import_sc_lines"]
-officials = results["import_officials"]
-draft_picks = results["import_draft_picks"]
-draft_values = results["import_draft_values"]
-team_desc = results["import_team_desc"]
-schedules = results["import_schedules"]
-combine_data = results["import_combine_data"]
-ids = results["import_ids"]
-ngs_passing = results["import_ngs_data"]
-ngs_receiving = results["import_ngs_data"]
-ngs_rushing = results["import_ngs_data"]
-depth_charts = results["import_depth_charts"]
-injuries = results["import_injuries"]
-qbr_data = results["import_qbr"]
-pfr_seasonal_passing = results["import_seasonal_pfr"]
-pfr_seasonal_rushing = results["import_seasonal_pfr"]
-pfr_seasonal_receiving = results["import_seasonal_pfr"]
-pfr_weekly_passing = results["import_weekly_pfr"]
-pfr_weekly_rushing = results["import_weekly_pfr"]
-pfr_weekly_receiving = results["import_weekly_pfr"]
-snap_counts = results["import_snap_counts"]
-ftn_data = results["import_ftn_data"]
-
-# Include any other data frames as needed
+
+def refresh_weekly(season=None):
+    """Append the newest weeks of every weekly dataset; returns the number of
+    new rows per dataset."""
+    refreshed = {}
+    for name in WEEKLY_DATASETS:
+        try:
+            refreshed[name] = len(registry.refresh(name, season))
+        except Exception as e:
+            logger.error(f"Error refreshing {name}: {str(e)}")
+    return refreshed
+
+
+def __getattr__(name):
+    # Keep `from data.stats_dataframes import weekly_data` working; the frame
+    # is loaded on first access
+    if name in registry:
+        return registry[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,409 @@
+import json
+import logging
+import mmap
+import os
+import shutil
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import fastparquet
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# fastparquet filter expressions, e.g. [("team", "==", "KC"), ("week", ">", 3)]
+Filters = Sequence[Tuple[str, str, Any]]
+
+ROW_GROUP_SIZE = 50_000
+UNPARTITIONED = "data"
+
+
+# Object columns of these kinds are stored as strings and converted back on
+# read; columns mixing kinds stay strings
+_LITERALS = {"True": True, "False": False}
+_CASTS = {
+    "boolean": _LITERALS.__getitem__,
+    "integer": int,
+    "floating": float,
+    "mixed-integer-float": float,
+}
+
+
+def _mmap_open(path: str, *_):
+    # fastparquet passes a mode; files are only ever read
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _object_kinds(frame: pd.DataFrame) -> Dict[str, str]:
+    """Kind of values (``infer_dtype``) of each object column that is not
+    plain strings."""
+    kinds = {}
+    for col in frame.columns:
+        if frame[col].dtype != object:
+            continue
+        kind = pd.api.types.infer_dtype(frame[col], skipna=True)
+        if kind not in ("string", "empty", "bytes"):
+            kinds[col] = kind
+    return kinds
+
+
+def _prepare_for_parquet(frame: pd.DataFrame) -> pd.DataFrame:
+    # nfl_data_py frames carry object columns that mix strings with numbers or
+    # bools; Parquet needs one physical type per column
+    fixes = {
+        col: frame[col].where(frame[col].isna(), frame[col].astype(str))
+        for col in _object_kinds(frame)
+    }
+    if fixes:
+        frame = frame.assign(**fixes)
+    return frame.reset_index(drop=True)
+
+
+def _converter(cast):
+    def convert(value):
+        try:
+            return cast(value)
+        except (KeyError, TypeError, ValueError):
+            return value
+
+    return convert
+
+
+def _restore_types(frame: pd.DataFrame, kinds: Dict[str, str]) -> pd.DataFrame:
+    """Undo ``_prepare_for_parquet`` for object columns of bools, ints or
+    floats, so stored frames read back with the source's values."""
+    fixes = {
+        col: frame[col].map(_converter(_CASTS[kind]), na_action="ignore").astype(object)
+        for col, kind in kinds.items()
+        if kind in _CASTS and col in frame.columns
+    }
+    return frame.assign(**fixes) if fixes else frame
+
+
+def coerce_filters(
+    filters: Optional[Filters], dtypes: Dict[str, str]
+) -> List[Tuple[str, str, Any]]:
+    """Drop filters on unknown columns and cast string values for numeric
+    columns (query text arrives as strings)."""
+    coerced = []
+    for column, op, value in filters or []:
+        if column not in dtypes:
+            continue
+        if dtypes[column].startswith(("int", "float")):
+            try:
+                if isinstance(value, str):
+                    value = float(value)
+                elif isinstance(value, (list, tuple, set)):
+                    value = [float(v) if isinstance(v, str) else v for v in value]
+            except ValueError:
+                pass
+        coerced.append((column, op, value))
+    return coerced
+
+
+_OPS = {
+    "==": lambda s, v: s == v,
+    "=": lambda s, v: s == v,
+    "!=": lambda s, v: s != v,
+    "<": lambda s, v: s < v,
+    "<=": lambda s, v: s <= v,
+    ">": lambda s, v: s > v,
+    ">=": lambda s, v: s >= v,
+    "in": lambda s, v: s.isin(list(v)),
+    "not in": lambda s, v: ~s.isin(list(v)),
+}
+
+
+def filter_frame(
+    frame: pd.DataFrame,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Filters] = None,
+) -> pd.DataFrame:
+    """In-memory equivalent of ``ParquetStore.read`` projection/filtering."""
+    dtypes = {c: str(t) for c, t in frame.dtypes.items()}
+    mask = None
+    for column, op, value in coerce_filters(filters, dtypes):
+        condition = _OPS[op](frame[column], value)
+        mask = condition if mask is None else mask & condition
+    if mask is not None:
+        frame = frame[mask]
+    if columns is not None:
+        frame = frame[[c for c in columns if c in frame.columns]]
+    return frame
+
+
+class ParquetStore:
+    """Columnar dataset store with one Parquet file per season partition.
+
+    Layout: ``<root>/<dataset>/<variant digest>/season=<year>.parquet`` plus a
+    ``manifest.json``; frames without a ``season`` column are kept in a single
+    ``data.parquet``. Reads support column projection, row filters pushed down
+    to the row-group statistics, and memory-mapped file access.
+    """
+
+    def __init__(self, root: str, memory_map: bool = True):
+        self.root = root
+        self.memory_map = memory_map
+        os.makedirs(root, exist_ok=True)
+        self._lock = threading.RLock()
+
+    def _dir(self, key) -> str:
+        return os.path.join(self.root, key.dataset, key.digest)
+
+    def _file(self, key, partition: str) -> str:
+        return os.path.join(self._dir(key), f"{partition}.parquet")
+
+    def manifest(self, key) -> Optional[Dict[str, Any]]:
+        path = os.path.join(self._dir(key), "manifest.json")
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def _write_manifest(self, key, manifest: Dict[str, Any]) -> None:
+        path = os.path.join(self._dir(key), "manifest.json")
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, path)
+
+    def seasons(self, key) -> List[int]:
+        manifest = self.manifest(key)
+        if not manifest or not manifest["partitioned"]:
+            return []
+        return sorted(int(s) for s in manifest["partitions"])
+
+    def write(
+        self,
+        key,
+        frame: pd.DataFrame,
+        partition_on: Optional[str] = "season",
+        seasons: Optional[Iterable[int]] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Write ``frame``, replacing only the season partitions it contains.
+
+        ``seasons`` lists every season the fetch covered, so seasons that
+        came back empty are recorded and not fetched again.
+        """
+        kinds = _object_kinds(frame)
+        frame = _prepare_for_parquet(frame)
+        partitioned = partition_on is not None and partition_on in frame.columns
+        with self._lock:
+            os.makedirs(self._dir(key), exist_ok=True)
+            manifest = self.manifest(key)
+            if manifest is None or manifest["partitioned"] != partitioned:
+                manifest = {
+                    "dataset": key.dataset,
+                    "variant": key.variant,
+                    "partitioned": partitioned,
+                    "partitions": {},
+                }
+            if partitioned:
+                groups = frame.groupby(partition_on, sort=True)
+                parts = [(str(int(season)), part) for season, part in groups]
+            else:
+                manifest["partitions"] = {}
+                parts = [(UNPARTITIONED, frame)]
+            for name, part in parts:
+                path = self._file(key, self._partition_name(name, partitioned))
+                self._write_file(path, part)
+                manifest["partitions"][name] = {
+                    "rows": len(part),
+                    "stored_at": time.time(),
+                }
+            if partitioned:
+                for season in seasons or []:
+                    name = str(int(season))
+                    if name not in manifest["partitions"]:
+                        manifest["partitions"][name] = {
+                            "rows": 0,
+                            "stored_at": time.time(),
+                        }
+            manifest["columns"] = list(frame.columns)
+            manifest["dtypes"] = {c: str(t) for c, t in frame.dtypes.items()}
+            manifest["object_kinds"] = {**manifest.get("object_kinds", {}), **kinds}
+            manifest.update(extra or {})
+            self._write_manifest(key, manifest)
+        logger.info(
+            f"Stored {key.dataset} {key.variant} partitions {[n for n, _ in parts]}"
+        )
+
+    def append(
+        self,
+        key,
+        frame: pd.DataFrame,
+        season: int,
+        extra: Optional[Dict[str, Any]] = None,
+        replace_week: Optional[int] = None,
+    ) -> None:
+        """Append rows to one season partition as new row groups; the other
+        partitions (and files) are left untouched.
+
+        With ``replace_week`` the stored rows of that week are dropped first,
+        for weeks republished with revisions; this rewrites the partition.
+        """
+        kinds = _object_kinds(frame)
+        frame = _prepare_for_parquet(frame)
+        name = str(int(season))
+        with self._lock:
+            manifest = self.manifest(key)
+            if manifest is None or not manifest["partitioned"]:
+                raise KeyError(f"{key.dataset} {key.variant} has no season partitions")
+            path = self._file(key, self._partition_name(name, True))
+            previous = manifest["partitions"].get(name, {}).get("rows", 0)
+            if previous and os.path.exists(path) and replace_week is not None:
+                stored = self._read_file(path, None, [])
+                stored = stored[stored["week"] != replace_week]
+                merged = pd.concat([stored, frame], ignore_index=True)
+                self._write_file(path, _prepare_for_parquet(merged))
+                previous = len(stored)
+            elif previous and os.path.exists(path):
+                self._append_file(path, frame)
+            else:
+                self._write_file(path, frame)
+                previous = 0
+            manifest["partitions"][name] = {
+                "rows": previous + len(frame),
+                "stored_at": time.time(),
+            }
+            manifest["object_kinds"] = {**manifest.get("object_kinds", {}), **kinds}
+            manifest.update(extra or {})
+            self._write_manifest(key, manifest)
+        logger.info(f"Appended {len(frame)} rows to {key.dataset} season {name}")
+
+    def _append_file(self, path: str, frame: pd.DataFrame) -> None:
+        # Append to a copy and swap it in, so readers never see a partial file
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        shutil.copyfile(path, tmp_path)
+        try:
+            existing = fastparquet.ParquetFile(tmp_path).columns
+            frame = frame.reindex(columns=existing)
+            fastparquet.write(
+                tmp_path,
+                frame,
+                row_group_offsets=ROW_GROUP_SIZE,
+                write_index=False,
+                object_encoding="infer",
+                compression="SNAPPY",
+                append=True,
+            )
+        except (ValueError, TypeError):
+            # Schema drift (e.g. a column that was all-null before): rewrite
+            # the partition with the new rows
+            os.remove(tmp_path)
+            merged = pd.concat(
+                [self._read_file(path, None, []), frame], ignore_index=True
+            )
+            self._write_file(path, _prepare_for_parquet(merged))
+            return
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _partition_name(name: str, partitioned: bool) -> str:
+        return f"season={name}" if partitioned else name
+
+    @staticmethod
+    def _write_file(path: str, frame: pd.DataFrame) -> None:
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        fastparquet.write(
+            tmp_path,
+            frame,
+            row_group_offsets=ROW_GROUP_SIZE,
+            write_index=False,
+            object_encoding="infer",
+            compression="SNAPPY",
+        )
+        os.replace(tmp_path, path)
+
+    def read(
+        self,
+        key,
+        seasons: Optional[Iterable[int]] = None,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[Filters] = None,
+    ) -> pd.DataFrame:
+        """Read the requested seasons, projecting ``columns`` and applying
+        ``filters``; only the matching partition files are opened."""
+        manifest = self.manifest(key)
+        if manifest is None:
+            raise KeyError(f"{key.dataset} {key.variant} is not in the store")
+        if manifest["partitioned"]:
+            available = manifest["partitions"]
+            wanted = available if seasons is None else [str(int(s)) for s in seasons]
+            names = [
+                self._partition_name(s, True)
+                for s in wanted
+                if s in available and available[s]["rows"] > 0
+            ]
+        else:
+            names = [UNPARTITIONED]
+
+        if columns is not None:
+            known = set(manifest.get("columns", []))
+            columns = [c for c in columns if c in known]
+        filters = coerce_filters(filters, manifest.get("dtypes", {}))
+
+        frames = [
+            self._read_file(self._file(key, name), columns, filters) for name in names
+        ]
+        if not frames:
+            return pd.DataFrame(columns=columns or manifest.get("columns", []))
+        frame = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        return _restore_types(frame, manifest.get("object_kinds", {}))
+
+    def _read_file(
+        self, path: str, columns: Optional[Sequence[str]], filters: Filters
+    ) -> pd.DataFrame:
+        # Maps are closed once fastparquet has copied the columns out
+        maps: List[mmap.mmap] = []
+
+        def open_mapped(path: str, *_):
+            maps.append(_mmap_open(path))
+            return maps[-1]
+
+        open_with = open_mapped if self.memory_map else fastparquet.util.default_open
+        try:
+            parquet_file = fastparquet.ParquetFile(path, open_with=open_with)
+            return parquet_file.to_pandas(
+                columns=list(columns) if columns is not None else None,
+                filters=list(filters) if filters else [],
+                row_filter=bool(filters),
+            )
+        finally:
+            for mapped in maps:
+                mapped.close()
+
+    def delete(self, key, seasons: Optional[Iterable[int]] = None) -> bool:
+        with self._lock:
+            manifest = self.manifest(key)
+            if manifest is None:
+                return False
+            if seasons is None or not manifest["partitioned"]:
+                shutil.rmtree(self._dir(key), ignore_errors=True)
+                return True
+            removed = False
+            for season in seasons:
+                name = str(int(season))
+                if manifest["partitions"].pop(name, None) is not None:
+                    path = self._file(key, self._partition_name(name, True))
+                    if os.path.exists(path):
+                        os.remove(path)
+                    removed = True
+            self._write_manifest(key, manifest)
+            return removed
+
+    def manifests(self) -> List[Dict[str, Any]]:
+        found = []
+        for dataset in sorted(os.listdir(self.root)):
+            directory = os.path.join(self.root, dataset)
+            if not os.path.isdir(directory):
+                continue
+            for digest in sorted(os.listdir(directory)):
+                path = os.path.join(directory, digest, "manifest.json")
+                if os.path.exists(path):
+                    with open(path) as f:
+                        found.append(json.load(f))
+        return found
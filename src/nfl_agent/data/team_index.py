@@ -0,0 +1,177 @@
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Same precedence StatsRetriever.get_team_stats has always used
+TEAM_COLUMNS = ["team", ("away_team", "home_team"), "club_code", "abbr"]
+
+# Historical, PFR-style and nickname spellings -> nflverse abbreviation
+TEAM_ALIASES = {
+    "JAC": "JAX",
+    "WSH": "WAS",
+    "LAR": "LA",
+    "STL": "LA",
+    "SD": "LAC",
+    "OAK": "LV",
+    "ARZ": "ARI",
+    "BLT": "BAL",
+    "CLV": "CLE",
+    "HST": "HOU",
+    "GNB": "GB",
+    "KAN": "KC",
+    "NWE": "NE",
+    "NOR": "NO",
+    "SFO": "SF",
+    "TAM": "TB",
+    "LVR": "LV",
+    "CARDINALS": "ARI",
+    "FALCONS": "ATL",
+    "RAVENS": "BAL",
+    "BILLS": "BUF",
+    "PANTHERS": "CAR",
+    "BEARS": "CHI",
+    "BENGALS": "CIN",
+    "BROWNS": "CLE",
+    "COWBOYS": "DAL",
+    "BRONCOS": "DEN",
+    "LIONS": "DET",
+    "PACKERS": "GB",
+    "TEXANS": "HOU",
+    "COLTS": "IND",
+    "JAGUARS": "JAX",
+    "CHIEFS": "KC",
+    "RAIDERS": "LV",
+    "CHARGERS": "LAC",
+    "RAMS": "LA",
+    "DOLPHINS": "MIA",
+    "VIKINGS": "MIN",
+    "PATRIOTS": "NE",
+    "SAINTS": "NO",
+    "GIANTS": "NYG",
+    "JETS": "NYJ",
+    "EAGLES": "PHI",
+    "STEELERS": "PIT",
+    "49ERS": "SF",
+    "NINERS": "SF",
+    "SEAHAWKS": "SEA",
+    "BUCCANEERS": "TB",
+    "BUCS": "TB",
+    "TITANS": "TEN",
+    "COMMANDERS": "WAS",
+}
+
+
+def normalize_team(team: Optional[str]) -> Optional[str]:
+    """``"kc"``, ``" KAN "`` and ``"chiefs"`` all become ``"KC"``."""
+    if team is None or (not isinstance(team, str) and pd.isna(team)):
+        return None
+    key = str(team).strip().upper()
+    return TEAM_ALIASES.get(key, key)
+
+
+def team_spellings(team: str) -> List[str]:
+    """Every spelling that normalizes to ``team``, e.g. LV -> LV, OAK, ..."""
+    team = normalize_team(team)
+    return [team] + sorted(k for k, v in TEAM_ALIASES.items() if v == team)
+
+
+def team_mask(frame: pd.DataFrame, team: str, columns) -> np.ndarray:
+    """Rows where any of ``columns`` (one name or a home/away pair) holds
+    ``team``, for frames that are not in the index."""
+    team = normalize_team(team)
+    mask = np.zeros(len(frame), dtype=bool)
+    for column in (columns,) if isinstance(columns, str) else columns:
+        codes, uniques = pd.factorize(frame[column])
+        hits = [i for i, u in enumerate(uniques) if normalize_team(u) == team]
+        mask |= np.isin(codes, hits)
+    return mask
+
+
+class _TeamPartitions:
+    """One frame grouped by team: a team-sorted copy plus row ranges, so each
+    team's rows are a contiguous slice (a view) of that copy."""
+
+    def __init__(self, frame: pd.DataFrame, teams: pd.Series):
+        # Normalize each distinct value once (also works for categoricals)
+        raw_codes, raw = pd.factorize(teams)
+        normalized, uniques = pd.factorize(
+            pd.Series([normalize_team(t) for t in raw], dtype=object)
+        )
+        # Missing values (code -1) pick the trailing -1
+        codes = np.append(normalized, -1)[raw_codes]
+        valid = codes >= 0
+        order = np.flatnonzero(valid)[np.argsort(codes[valid], kind="stable")]
+        self.sorted_frame = frame.take(order)
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        self.ranges: Dict[str, Tuple[int, int]] = {
+            team: (int(bounds[i]), int(bounds[i + 1])) for i, team in enumerate(uniques)
+        }
+
+    def get(self, team: str) -> Optional[pd.DataFrame]:
+        span = self.ranges.get(team)
+        if span is None:
+            return None
+        return self.sorted_frame.iloc[span[0] : span[1]]
+
+
+class TeamIndex:
+    """Frames partitioned by normalized team abbreviation at load time."""
+
+    def __init__(self):
+        self._partitions: Dict[str, _TeamPartitions] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def team_column(frame: pd.DataFrame):
+        for column in TEAM_COLUMNS:
+            if isinstance(column, tuple):
+                if all(c in frame.columns for c in column):
+                    return column
+            elif column in frame.columns:
+                return column
+        return None
+
+    def add_frame(self, name: str, frame: Optional[pd.DataFrame]) -> None:
+        column = self.team_column(frame) if frame is not None else None
+        if column is None:
+            with self._lock:
+                self._partitions.pop(name, None)
+            return
+        if isinstance(column, tuple):
+            # Games appear once under the away team and once under the home
+            # team; stack both sides so each team's schedule is one slice
+            away, home = column
+            stacked = pd.concat([frame, frame], ignore_index=True)
+            teams = pd.concat([frame[away], frame[home]], ignore_index=True)
+            order = np.argsort(
+                np.concatenate([np.arange(len(frame)), np.arange(len(frame))]),
+                kind="stable",
+            )
+            partitions = _TeamPartitions(
+                stacked.take(order).reset_index(drop=True),
+                teams.take(order).reset_index(drop=True),
+            )
+        else:
+            partitions = _TeamPartitions(frame, frame[column])
+        with self._lock:
+            self._partitions[name] = partitions
+
+    def frames(self) -> List[str]:
+        return list(self._partitions)
+
+    def teams(self) -> List[str]:
+        teams = set()
+        for partitions in list(self._partitions.values()):
+            teams.update(partitions.ranges)
+        return sorted(teams)
+
+    def lookup(self, team: str) -> Dict[str, pd.DataFrame]:
+        team = normalize_team(team)
+        found = {}
+        for name, partitions in list(self._partitions.items()):
+            rows = partitions.get(team)
+            if rows is not None and not rows.empty:
+                found[name] = rows
+        return found
@@ -5,6 +5,8 @@ import os
 import uuid
 
 from agent.fantasy_agent import FantasyFootballAgent
+from agent.streaming import render_stream
+from data.stats_dataframes import refresh_weekly, registry
 from dotenv import find_dotenv, load_dotenv
 
 # Load environment variables from .env file
@@ -21,7 +23,8 @@ logger = logging.getLogger(__name__)
 
 def main():
     agent = FantasyFootballAgent()
-    thread_id = uuid.uuid4().hex  # Generate a unique session ID
+    # Conversations are checkpointed, so a previous session can be resumed
+    thread_id = os.getenv("NFL_AGENT_THREAD_ID") or uuid.uuid4().hex
 
     logger.info(f"Starting new session with thread_id: {thread_id}")
 
@@ -42,6 +45,7 @@ def main():
                 print("\nAvailable commands:")
                 print("- 'exit' or 'quit': End the session")
                 print("- 'reset': Start a new conversation")
+                print("- 'refresh': Pull the newest week of weekly datasets")
                 print("- 'help': Show this help message")
                 print(
                     "You can ask about player stats, news, trade evaluations, or waiver wire recommendations.\n"
@@ -54,12 +58,20 @@ def main():
                 print("\nStarting a new conversation.\n")
                 continue
 
+            elif user_input == "refresh":
+                refreshed = refresh_weekly()
+                logger.info(f"Weekly refresh: {refreshed}")
+                print(f"\nNew rows per dataset: {refreshed}\n")
+                continue
+
             try:
                 logger.info(f"User input: {user_input}")
-                response = agent.run(
-                    user_input, thread_id=thread_id, user_info="user123"
+                print("\nAssistant: ", end="", flush=True)
+                # Tokens are printed as the agent generates them
+                response = render_stream(
+                    agent.stream(user_input, thread_id=thread_id, user_info="user123")
                 )
-                print(f"\nAssistant: {response}\n")
+                print("\n")
                 logger.info(f"Assistant response: {response}")
             except Exception as e:
                 logger.error(f"Error processing user input: {str(e)}")
@@ -75,6 +87,13 @@ def main():
             "\nAn unexpected error occurred. The session has been terminated. We apologize for the inconvenience."
         )
     finally:
+        logger.info(f"Datasets touched this session: {sorted(registry.touched)}")
+        for report in registry.compaction_report().values():
+            logger.info(f"Compaction: {report.summary()}")
+        logger.info(f"Response cache: {agent.cache.stats()}")
+        logger.info(f"Intent routing: {agent.router.stats()}")
+        logger.info(f"Turns: {agent.turns.summary()}")
+        logger.info(f"Tool output tokens: {agent.context_packer.stats()}")
         logger.info(f"Ending session with thread_id: {thread_id}")
 
 
@@ -1,219 +1,439 @@
-from typing import Any, Dict, List, Optional
-
-from data.stats_dataframes import (
-    combine_data,
-    depth_charts,
-    draft_picks,
-    draft_values,
-    ftn_data,
-    ids,
-    injuries,
-    ngs_passing,
-    ngs_receiving,
-    ngs_rushing,
-    officials,
-    pfr_seasonal_passing,
-    pfr_seasonal_receiving,
-    pfr_seasonal_rushing,
-    pfr_weekly_passing,
-    pfr_weekly_receiving,
-    pfr_weekly_rushing,
-    qbr_data,
-    sc_lines,
-    schedules,
-    seasonal_data,
-    seasonal_rosters,
-    snap_counts,
-    team_desc,
-    weekly_data,
-    weekly_rosters,
-    win_totals,
-)
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+import pandas as pd
+from data.aggregation import WeeklyAggregates
+from data.name_search import NameSearch
+from data.player_ids import PlayerIdCrosswalk, player_identities
+from data.player_index import PlayerIndex, benchmark_player_lookup, normalize_name
+from data.query import QueryPlanner, QuerySpec, parse_query
+from data.results import DEFAULT_LIMIT, ResultSet
+from data.stats_dataframes import registry
+from data.store import filter_frame
+from data.team_index import TeamIndex, normalize_team
+
+RESULT_OPTIONS = ("columns", "limit", "cursor")
 
 
 class StatsRetriever:
-    def __init__(self):
-        self.data_frames = {
-            "weekly_data": weekly_data,
-            "seasonal_data": seasonal_data,
-            "seasonal_rosters": seasonal_rosters,
-            "weekly_rosters": weekly_rosters,
-            "win_totals": win_totals,
-            "sc_lines": sc_lines,
-            "officials": officials,
-            "draft_picks": draft_picks,
-            "draft_values": draft_values,
-            "team_desc": team_desc,
-            "schedules": schedules,
-            "combine_data": combine_data,
-            "ids": ids,
-            "ngs_passing": ngs_passing,
-            "ngs_receiving": ngs_receiving,
-            "ngs_rushing": ngs_rushing,
-            "depth_charts": depth_charts,
-            "injuries": injuries,
-            "qbr_data": qbr_data,
-            "pfr_seasonal_passing": pfr_seasonal_passing,
-            "pfr_seasonal_rushing": pfr_seasonal_rushing,
-            "pfr_seasonal_receiving": pfr_seasonal_receiving,
-            "pfr_weekly_passing": pfr_weekly_passing,
-            "pfr_weekly_rushing": pfr_weekly_rushing,
-            "pfr_weekly_receiving": pfr_weekly_receiving,
-            "snap_counts": snap_counts,
-            "ftn_data": ftn_data,
-        }
-        self.load_data_frames()
-
-    def load_data_frames(self):
-        for name, df in self.data_frames.items():
-            setattr(self, name, df)
-
-    def get_player_stats(self, player_name: str) -> Dict[str, List[Dict[str, Any]]]:
-        stats = {}
-        for df_name, df in self.data_frames.items():
-            if "player_name" in df.columns:
-                player_data = df[df["player_name"] == player_name]
-            elif "player" in df.columns:
-                player_data = df[df["player"] == player_name]
-            elif "full_name" in df.columns:
-                player_data = df[df["full_name"] == player_name]
-            elif "name_display" in df.columns:
-                player_data = df[df["name_display"] == player_name]
-            elif "player_display_name" in df.columns:
-                player_data = df[df["player_display_name"] == player_name]
-            else:
-                continue
-
-            if not player_data.empty:
-                stats[df_name] = player_data.to_dict("records")
+    def __init__(self, data_frames: Optional[Mapping[str, Any]] = None):
+        # Frames are looked up lazily through the registry, so only the
+        # datasets a query actually needs are ever fetched
+        self.data_frames = registry if data_frames is None else data_frames
+
+        # Player rows are indexed once per loaded frame instead of scanned
+        # on every lookup
+        self.player_index = PlayerIndex()
+        self.team_index = TeamIndex()
+        self._player_ids: Optional[PlayerIdCrosswalk] = None
+        self._name_search: Optional[NameSearch] = None
+        self._aggregates: Optional[WeeklyAggregates] = None
+        self.planner = QueryPlanner(self)
+        if hasattr(self.data_frames, "add_listener"):
+            self.data_frames.add_listener(
+                self._on_frame_loaded, on_append=self._on_rows_appended
+            )
+            for name in self.data_frames:
+                if self.data_frames.is_loaded(name):
+                    self._on_frame_loaded(name, self.data_frames[name])
+        else:
+            for name, df in self.data_frames.items():
+                self._on_frame_loaded(name, df)
+
+    def _on_frame_loaded(self, name: str, frame: Optional[pd.DataFrame]):
+        self.player_index.add_frame(name, frame)
+        self.team_index.add_frame(name, frame)
+        self._name_search = None  # names changed; rebuilt on next search
+        if name == "ids":
+            self._player_ids = None  # rebuilt from the new frame on next use
+        if name == "weekly_data":
+            self._aggregates = None
+
+    def _on_rows_appended(self, name: str, frame: pd.DataFrame, new_rows: pd.DataFrame):
+        # An incremental refresh only touches what depends on this frame:
+        # its own index partitions, the name search if new players showed
+        # up, and the aggregates of the refreshed seasons
+        known = set(self.player_index.names())
+        self.player_index.add_frame(name, frame)
+        if name in self.team_index.frames():
+            self.team_index.add_frame(name, frame)
+        if not set(self.player_index.names()) <= known:
+            self._name_search = None
+        if name == "weekly_data" and self._aggregates is not None:
+            seasons = new_rows["season"].unique() if "season" in new_rows else None
+            self._aggregates.update(frame, seasons)
+
+    def __getattr__(self, name: str):
+        # Expose each dataset as an attribute (self.weekly_data, ...)
+        if name != "data_frames" and name in self.data_frames:
+            return self.data_frames[name]
+        raise AttributeError(name)
+
+    def _ensure_frames_loaded(self, names: Optional[List[str]] = None):
+        # Loading a frame through the registry indexes it via the listener
+        if not hasattr(self.data_frames, "is_loaded"):
+            return
+        names = list(self.data_frames) if names is None else names
+        missing = [n for n in names if not self.data_frames.is_loaded(n)]
+        if len(missing) > 1:
+            # Fetched concurrently rather than one after another
+            self.data_frames.prefetch(missing, background=False)
+        for name in missing:
+            self.data_frames[name]
+
+    @property
+    def player_ids(self) -> Optional[PlayerIdCrosswalk]:
+        if self._player_ids is None and "ids" in self.data_frames:
+            ids = self.data_frames["ids"]
+            if not ids.empty:
+                self._player_ids = PlayerIdCrosswalk(ids)
+        return self._player_ids
+
+    @property
+    def name_search(self) -> NameSearch:
+        if self._name_search is None:
+            names = self.player_index.names()
+            entries = self._search_entries(names)
+            # Rank by season activity: games logged in the weekly data, over
+            # every alias of the player
+            activity: Dict[str, float] = defaultdict(float)
+            for key, rows in self.player_index.row_counts("weekly_data").items():
+                activity[entries.get(key, key)] += rows
+            self._name_search = NameSearch(names, activity, aliases=entries)
+        return self._name_search
 
+    def _search_entries(self, names: Mapping[str, str]) -> Dict[str, str]:
+        """Name key -> key its player is listed under in name searches: the
+        crosswalk's name for the player if indexed, else its most active
+        alias."""
+        crosswalk = self.player_ids
+        identities = player_identities(names, self.player_index.name_ids(), crosswalk)
+        aliases: Dict[Any, List[str]] = defaultdict(list)
+        for key, identity in identities.items():
+            aliases[identity].append(key)
+        codes = [i for i in aliases if isinstance(i, int)]
+        canonical = {}
+        if codes and crosswalk is not None and "name" in crosswalk.id_types:
+            canonical = dict(zip(codes, crosswalk.from_canonical(codes, "name")))
+        weekly = self.player_index.row_counts("weekly_data")
+        entries = {}
+        for identity, keys in aliases.items():
+            name = canonical.get(identity)
+            preferred = normalize_name(name) if isinstance(name, str) else None
+            entry = max(keys, key=lambda k: (k == preferred, weekly.get(k, 0), len(k)))
+            entries.update(dict.fromkeys(keys, entry))
+        return entries
+
+    @property
+    def aggregates(self) -> WeeklyAggregates:
+        if self._aggregates is None:
+            self._aggregates = WeeklyAggregates(self.data_frames["weekly_data"])
+        return self._aggregates
+
+    def response_meta(self, name: str) -> Dict[str, Any]:
+        """Metadata attached to every response built from ``name``: how old
+        the served copy is and whether a refresh is underway."""
+        freshness = None
+        if hasattr(self.data_frames, "freshness"):
+            freshness = self.data_frames.freshness(name)
+        return {"freshness": freshness} if freshness else {}
+
+    def search_players(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        # Active players come from the weekly data; other loaded frames add
+        # their names too
+        self._ensure_frames_loaded(["weekly_data"])
+        return [match._asdict() for match in self.name_search.search(query, limit)]
+
+    def join_players(
+        self,
+        left: str,
+        right: str,
+        left_on: str,
+        right_on: str,
+        on: Optional[List[str]] = None,
+        how: str = "left",
+    ) -> pd.DataFrame:
+        """Join two datasets on player identity via the ID crosswalk, e.g.
+        ``join_players("weekly_data", "snap_counts", "player_id",
+        "pfr_player_id", on=["season", "week"])``."""
+        return self.player_ids.join(
+            self.data_frames[left],
+            self.data_frames[right],
+            left_on,
+            right_on,
+            on=on,
+            how=how,
+        )
+
+    def get_player_stats(
+        self,
+        player_name: str,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = DEFAULT_LIMIT,
+        summary: bool = False,
+    ) -> Dict[str, Any]:
+        rows, matched = self.player_rows(player_name)
+        stats = {
+            df_name: ResultSet(
+                player_data,
+                columns,
+                limit,
+                meta=self.response_meta(df_name),
+                name=df_name,
+            ).to_dict(summary)
+            for df_name, player_data in rows.items()
+            if self._has_columns(player_data, columns)
+        }
         if not stats:
-            return {"error": f"No stats found for player {player_name}."}
+            return self._player_not_found(player_name)
+        if matched is not None:
+            stats["matched_player"] = [matched]
         return stats
 
-    def get_team_stats(self, team_abbr: str) -> Dict[str, List[Dict[str, Any]]]:
-        stats = {}
-        for df_name, df in self.data_frames.items():
-            if "team" in df.columns:
-                team_data = df[df["team"] == team_abbr]
-            elif "away_team" in df.columns and "home_team" in df.columns:
-                team_data = df[
-                    (df["away_team"] == team_abbr) | (df["home_team"] == team_abbr)
-                ]
-            elif "club_code" in df.columns:
-                team_data = df[df["club_code"] == team_abbr]
-            elif "abbr" in df.columns:
-                team_data = df[df["abbr"] == team_abbr]
-            else:
-                continue
-
-            if not team_data.empty:
-                stats[df_name] = team_data.to_dict("records")
+    def get_recent_stats(
+        self, player_name: str, weeks: int = 4, season: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """A player's totals over the last ``weeks`` weeks of the season."""
+        rows, matched = self.player_rows(player_name, ["weekly_data"])
+        weekly = rows.get("weekly_data")
+        if weekly is None or "player_id" not in weekly.columns:
+            return self._player_not_found(player_name)
+        totals = self.aggregates.last_n(weekly["player_id"].iloc[0], weeks, season)
+        if totals is None:
+            return self._player_not_found(player_name)
+        stats = {"player": weekly.iloc[0].get("player_display_name", player_name)}
+        stats.update(totals)
+        if matched is not None:
+            stats["matched_player"] = [matched]
+        stats.update(self.response_meta("weekly_data"))
+        return stats
+
+    def player_rows(
+        self, player_name: str, datasets: Optional[List[str]] = None
+    ) -> Tuple[Dict[str, pd.DataFrame], Optional[Dict[str, Any]]]:
+        """Index lookup of a player's rows per frame, plus the fuzzy match
+        used when the name itself is not indexed."""
+        self._ensure_frames_loaded(datasets)
+        matched = None
+        rows = self._indexed_player_rows(player_name)
+        if not rows:
+            # Typos, nicknames or partial names resolve through the name search
+            match = self.name_search.best(player_name)
+            if match is not None:
+                rows = self._indexed_player_rows(match.name)
+                if rows:
+                    matched = {"query": player_name, **match._asdict()}
+        if datasets is not None:
+            rows = {name: rows[name] for name in datasets if name in rows}
+        return rows, matched
+
+    def resolve_player(
+        self, player_name: str
+    ) -> Tuple[str, List[str], Optional[Dict[str, Any]]]:
+        """The indexed name a query refers to, its other identifiers and the
+        fuzzy match used to find it (for scanning unindexed partitions)."""
+        self._ensure_frames_loaded(["weekly_data"])
+        matched = None
+        aliases = self.player_ids.resolve(player_name) if self.player_ids else {}
+        # Players who retired before the seasons in memory are still known
+        # to the ID crosswalk; only unknown names go through the name search
+        if not aliases and not self._indexed_player_rows(player_name):
+            match = self.name_search.best(player_name)
+            if match is not None:
+                matched = {"query": player_name, **match._asdict()}
+                player_name = match.name
+                aliases = (
+                    self.player_ids.resolve(player_name) if self.player_ids else {}
+                )
+        return player_name, [str(a) for a in aliases.values()], matched
+
+    def _indexed_player_rows(self, player_name: str) -> Dict[str, pd.DataFrame]:
+        # Other identifiers of the player match frames keyed by ID only
+        aliases = (
+            self.player_ids.resolve(player_name).values() if self.player_ids else ()
+        )
+        return self.player_index.lookup(player_name, aliases)
+
+    def _player_not_found(self, player_name: str) -> Dict[str, Any]:
+        suggestions = self.name_search.search(player_name, limit=5)
+        error = {"error": f"No stats found for player {player_name}."}
+        if suggestions:
+            error["suggestions"] = [m.display_name for m in suggestions]
+        return error
+
+    @staticmethod
+    def _has_columns(frame: pd.DataFrame, columns: Optional[List[str]]) -> bool:
+        # Frames holding none of the projected columns are left out
+        return not columns or any(c in frame.columns for c in columns)
+
+    def benchmark_player_lookup(
+        self, player_names: List[str], repeat: int = 3
+    ) -> Dict[str, float]:
+        """Time the indexed player lookup against the original full scan."""
+        self._ensure_frames_loaded()
+        frames = {name: self.data_frames[name] for name in self.player_index.frames()}
+        return benchmark_player_lookup(
+            frames, player_names, index=self.player_index, repeat=repeat
+        )
+
+    def get_team_stats(
+        self,
+        team_abbr: str,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = DEFAULT_LIMIT,
+        summary: bool = False,
+    ) -> Dict[str, Any]:
+        team_abbr = normalize_team(team_abbr)
+        stats = {
+            df_name: ResultSet(
+                team_data,
+                columns,
+                limit,
+                meta=self.response_meta(df_name),
+                name=df_name,
+            ).to_dict(summary)
+            for df_name, team_data in self.team_rows(team_abbr).items()
+            if self._has_columns(team_data, columns)
+        }
 
         if not stats:
             return {"error": f"No stats found for team {team_abbr}."}
         return stats
 
-    def get_draft_picks(self, season: Optional[int] = None) -> List[Dict[str, Any]]:
-        if season:
-            draft_picks = self.draft_picks[self.draft_picks["season"] == season]
-        else:
-            draft_picks = self.draft_picks
-        return draft_picks.to_dict("records")
+    def team_rows(
+        self, team_abbr: str, datasets: Optional[List[str]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        self._ensure_frames_loaded(datasets)
+        rows = self.team_index.lookup(team_abbr)
+        if datasets is not None:
+            rows = {name: rows[name] for name in datasets if name in rows}
+        return rows
 
-    def get_draft_values(self) -> List[Dict[str, Any]]:
-        return self.draft_values.to_dict("records")
+    def dataset_columns(self, name: str) -> List[str]:
+        if hasattr(self.data_frames, "columns"):
+            return self.data_frames.columns(name)
+        return list(self.data_frames[name].columns)
 
-    def get_team_description(self, team_abbr: str) -> List[Dict[str, Any]]:
-        team_info = self.team_desc[self.team_desc["team_abbr"] == team_abbr]
-        return team_info.to_dict("records")
+    def read(
+        self,
+        name: str,
+        columns: Optional[List[str]] = None,
+        seasons: Optional[List[int]] = None,
+        filters: Optional[List[Tuple[str, str, Any]]] = None,
+    ) -> pd.DataFrame:
+        # Push projection and filters down to the store when the frames come
+        # from the registry; plain dicts of frames are filtered in memory
+        if hasattr(self.data_frames, "read"):
+            return self.data_frames.read(
+                name, columns=columns, seasons=seasons, filters=filters
+            )
+        filters = list(filters or [])
+        if seasons is not None:
+            filters.append(("season", "in", seasons))
+        return filter_frame(self.data_frames[name], columns=columns, filters=filters)
 
-    def get_officials(self, game_id: Optional[str] = None) -> List[Dict[str, Any]]:
-        if game_id:
-            officials = self.officials[self.officials["game_id"] == game_id]
-        else:
-            officials = self.officials
-        return officials.to_dict("records")
-
-    def get_ftn_data(self, **filters) -> List[Dict[str, Any]]:
-        ftn_data = self.ftn_data
-        for key, value in filters.items():
-            if key in ftn_data.columns:
-                ftn_data = ftn_data[ftn_data[key] == value]
-        return ftn_data.to_dict("records")
-
-    def get_schedules(self, season: Optional[int] = None) -> List[Dict[str, Any]]:
-        if season:
-            schedules = self.schedules[self.schedules["season"] == season]
-        else:
-            schedules = self.schedules
-        return schedules.to_dict("records")
+    def memory_seasons(self, name: str) -> Optional[List[int]]:
+        if hasattr(self.data_frames, "memory_seasons"):
+            return self.data_frames.memory_seasons(name)
+        return None  # plain dicts of frames hold everything in memory
 
-    def get_injuries(self, team: Optional[str] = None) -> List[Dict[str, Any]]:
-        if team:
-            injuries = self.injuries[self.injuries["team"] == team]
-        else:
-            injuries = self.injuries
-        return injuries.to_dict("records")
+    def partition_stats(self) -> Optional[Dict[str, int]]:
+        """Usage of the cache holding seasons outside memory, if any."""
+        if hasattr(self.data_frames, "partition_stats"):
+            return self.data_frames.partition_stats()
+        return None
 
-    def get_snap_counts(self, season: Optional[int] = None) -> List[Dict[str, Any]]:
-        if season:
-            snap_counts = self.snap_counts[self.snap_counts["season"] == season]
-        else:
-            snap_counts = self.snap_counts
-        return snap_counts.to_dict("records")
+    def iter_seasons(
+        self,
+        name: str,
+        seasons: Optional[List[int]] = None,
+        filters: Optional[List[Tuple[str, str, Any]]] = None,
+    ) -> Iterator[Tuple[int, pd.DataFrame]]:
+        if hasattr(self.data_frames, "iter_seasons"):
+            yield from self.data_frames.iter_seasons(name, seasons, filters=filters)
+            return
+        frame = filter_frame(self.data_frames[name], filters=filters)
+        for season, rows in frame.groupby("season", sort=True):
+            if seasons is None or season in seasons:
+                yield int(season), rows
+
+    def get_draft_picks(self, season: Optional[int] = None, **options) -> ResultSet:
+        seasons = [season] if season else None
+        return self._result("draft_picks", seasons=seasons, **options)
+
+    def get_draft_values(self, **options) -> ResultSet:
+        return self._result("draft_values", **options)
+
+    def get_team_description(self, team_abbr: str, **options) -> ResultSet:
+        filters = [("team_abbr", "==", normalize_team(team_abbr))]
+        return self._result("team_desc", filters=filters, **options)
+
+    def get_officials(self, game_id: Optional[str] = None, **options) -> ResultSet:
+        filters = [("game_id", "==", game_id)] if game_id else None
+        return self._result("officials", filters=filters, **options)
+
+    def get_ftn_data(self, **filters) -> ResultSet:
+        options = {key: filters.pop(key) for key in RESULT_OPTIONS if key in filters}
+        filters = [(key, "==", value) for key, value in filters.items()]
+        return self._result("ftn_data", filters=filters, **options)
+
+    def get_schedules(self, season: Optional[int] = None, **options) -> ResultSet:
+        seasons = [season] if season else None
+        return self._result("schedules", seasons=seasons, **options)
+
+    def get_injuries(self, team: Optional[str] = None, **options) -> ResultSet:
+        filters = [("team", "==", normalize_team(team))] if team else None
+        return self._result("injuries", filters=filters, **options)
+
+    def get_snap_counts(self, season: Optional[int] = None, **options) -> ResultSet:
+        seasons = [season] if season else None
+        return self._result("snap_counts", seasons=seasons, **options)
+
+    def _result(
+        self,
+        name: str,
+        seasons: Optional[List[int]] = None,
+        filters: Optional[List[Tuple[str, str, Any]]] = None,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+    ) -> ResultSet:
+        # Only the projected columns are read; rows stay in a DataFrame until
+        # a page is requested or the result is iterated
+        frame = self.read(name, columns=columns, seasons=seasons, filters=filters)
+        return ResultSet(
+            frame,
+            columns=columns,
+            limit=limit,
+            cursor=cursor,
+            meta=self.response_meta(name),
+            name=name,
+        )
+
+    def query(self, spec: QuerySpec):
+        """Run a structured query: a ``ResultSet`` for a single dataset, or
+        a payload keyed by frame for player/team queries across datasets."""
+        return self.planner.execute(spec)
 
     def get_stats(self, query: str) -> Dict[str, Any]:
-        query_parts = query.lower().split()
-        if "player" in query_parts:
-            player_name = " ".join(query_parts[query_parts.index("player") + 1 :])
-            return self.get_player_stats(player_name)
-        elif "team" in query_parts:
-            team_abbr = query_parts[query_parts.index("team") + 1]
-            if "description" in query_parts:
-                return self.get_team_description(team_abbr)
-            return self.get_team_stats(team_abbr)
-        elif "draft" in query_parts:
-            if "picks" in query_parts and "season" in query_parts:
-                season = int(query_parts[query_parts.index("season") + 1])
-                return self.get_draft_picks(season)
-            elif "values" in query_parts:
-                return self.get_draft_values()
-        elif "officials" in query_parts:
-            if "game" in query_parts:
-                game_id = query_parts[query_parts.index("game") + 1]
-                return self.get_officials(game_id)
-            else:
-                return self.get_officials()
-        elif "schedules" in query_parts:
-            if "season" in query_parts:
-                season = int(query_parts[query_parts.index("season") + 1])
-                return self.get_schedules(season)
-            else:
-                return self.get_schedules()
-        elif "injuries" in query_parts:
-            if "team" in query_parts:
-                team = query_parts[query_parts.index("team") + 1]
-                return self.get_injuries(team)
-            else:
-                return self.get_injuries()
-        elif "snap" in query_parts and "counts" in query_parts:
-            if "season" in query_parts:
-                season = int(query_parts[query_parts.index("season") + 1])
-                return self.get_snap_counts(season)
-            else:
-                return self.get_snap_counts()
-        elif "ftn" in query_parts:
-            filters = {}
-            for part in query_parts:
-                if "=" in part:
-                    key, value = part.split("=")
-                    filters[key] = value
-            return self.get_ftn_data(**filters)
-        else:
+        spec = parse_query(query)
+        if spec.dataset is None and spec.player is None and spec.team is None:
             return {
                 "error": "Invalid query. Please specify player, team, or other specific stats you're looking for."
             }
+        if spec.dataset is not None and spec.dataset not in self.data_frames:
+            return {"error": f"Dataset {spec.dataset} is not available."}
+
+        result = self.query(spec)
+        if isinstance(result, ResultSet):
+            if not result and spec.player is not None:
+                return self._player_not_found(spec.player)
+            return result.to_dict(spec.summary)
+        if not result:
+            if spec.player is not None:
+                return self._player_not_found(spec.player)
+            return {"error": f"No stats found for team {spec.team}."}
+        return result
 
 
 # Example usage
@@ -228,3 +448,4 @@ if __name__ == "__main__":
     print(retriever.get_stats("snap counts season 2022"))
     print(retriever.get_stats("team description NE"))
     print(retriever.get_stats("ftn position=QB"))
+    print(retriever.get_stats("player Travis Kelce, weeks 3-8, receiving columns only"))
@@ -1,3 +1,6 @@
+from typing import Optional
+
+import httpx
 import requests
 
 
@@ -10,43 +13,109 @@ class TeamManager:
         self.base_url = (
             "https://internationalfantasyfootballleag.football.cbssports.com/"
         )
+        # Separate login for the async client, made on its first use
+        self._async_client = None
 
         self.authenticate()
 
-    def authenticate(self):
-        # Authenticate with CBS Sports API
-        auth_url = f"{self.base_url}/login"
-        payload = {
+    def _auth_payload(self):
+        return {
             "userid": self.username,
             "password": self.password,
             # "api_token": self.api_key,
         }
-        response = self.session.post(auth_url, data=payload)
+
+    def authenticate(self):
+        # Authenticate with CBS Sports API
+        auth_url = f"{self.base_url}/login"
+        response = self.session.post(auth_url, data=self._auth_payload())
         if response.status_code != 200:
             raise Exception("Authentication failed with CBS Sports API.")
 
-    def manage_team(self, action, **kwargs):
+    async def aauthenticate(self):
+        client = httpx.AsyncClient()
+        response = await client.post(
+            f"{self.base_url}/login", data=self._auth_payload()
+        )
+        if response.status_code != 200:
+            await client.aclose()
+            raise Exception("Authentication failed with CBS Sports API.")
+        return client
+
+    async def _client(self):
+        if self._async_client is None:
+            client = await self.aauthenticate()
+            # Another task may have logged in while this one was waiting
+            if self._async_client is None:
+                self._async_client = client
+            else:
+                await client.aclose()
+        return self._async_client
+
+    async def aclose(self):
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def manage_team(
+        self,
+        action: str,
+        player_id: Optional[str] = None,
+        action_type: Optional[str] = None,
+    ):
+        """``action`` is "get_roster" or "update_roster" (with the player and
+        an ``action_type`` such as "add" or "drop")."""
         if action == "get_roster":
             return self.get_roster()
         elif action == "update_roster":
-            return self.update_roster(
-                kwargs.get("player_id"), kwargs.get("action_type")
-            )
+            return self.update_roster(player_id, action_type)
+        else:
+            return "Invalid team management action."
+
+    async def amanage_team(
+        self,
+        action: str,
+        player_id: Optional[str] = None,
+        action_type: Optional[str] = None,
+    ):
+        if action == "get_roster":
+            return await self.aget_roster()
+        elif action == "update_roster":
+            return await self.aupdate_roster(player_id, action_type)
         else:
             return "Invalid team management action."
 
     def get_roster(self):
         roster_url = f"{self.base_url}/roster"
         response = self.session.get(roster_url)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            return f"Error fetching roster: {response.status_code}"
+        return self._roster(response)
+
+    async def aget_roster(self):
+        client = await self._client()
+        response = await client.get(f"{self.base_url}/roster")
+        return self._roster(response)
 
     def update_roster(self, player_id, action_type):
         update_url = f"{self.base_url}/roster/update"
         payload = {"player_id": player_id, "action_type": action_type}
         response = self.session.post(update_url, data=payload)
+        return self._updated(response)
+
+    async def aupdate_roster(self, player_id, action_type):
+        client = await self._client()
+        payload = {"player_id": player_id, "action_type": action_type}
+        response = await client.post(f"{self.base_url}/roster/update", data=payload)
+        return self._updated(response)
+
+    @staticmethod
+    def _roster(response):
+        if response.status_code == 200:
+            return response.json()
+        else:
+            return f"Error fetching roster: {response.status_code}"
+
+    @staticmethod
+    def _updated(response):
         if response.status_code == 200:
             return "Roster updated successfully."
         else:
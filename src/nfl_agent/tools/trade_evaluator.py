@@ -1,9 +1,12 @@
+from typing import List
+
+
 class TradeEvaluator:
     def __init__(self):
         # Initialize with any necessary data or models
         pass
 
-    def evaluate_trade(self, players_offered, players_requested):
+    def evaluate_trade(self, players_offered: List[str], players_requested: List[str]):
         # Simplified trade evaluation logic
         offered_value = sum([self.get_player_value(p) for p in players_offered])
         requested_value = sum([self.get_player_value(p) for p in players_requested])
@@ -1,3 +1,4 @@
+import httpx
 import requests
 
 
@@ -6,10 +7,21 @@ class WebSearch:
         self.api_key = api_key
         self.search_url = "https://api.perplexity.ai/search"
 
-    def search(self, query):
+    def search(self, query: str):
         headers = {"Authorization": f"Bearer {self.api_key}"}
         params = {"q": query}
         response = requests.get(self.search_url, headers=headers, params=params)
+        return self._results(response)
+
+    async def asearch(self, query: str):
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        params = {"q": query}
+        async with httpx.AsyncClient() as client:
+            response = await client.get(self.search_url, headers=headers, params=params)
+        return self._results(response)
+
+    @staticmethod
+    def _results(response):
         if response.status_code == 200:
             results = response.json()
             return results.get("results", [])
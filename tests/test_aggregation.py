@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from data.aggregation import WeeklyAggregates
+from tools.stats_retriever import StatsRetriever
+
+
+class TestWeeklyAggregates(unittest.TestCase):
+
+    def setUp(self):
+        # Player B skips week 3 (bye); target_share is averaged, not summed
+        self.weekly = pd.DataFrame(
+            {
+                "player_id": ["A"] * 5 + ["B"] * 4,
+                "player_display_name": ["Player A"] * 5 + ["Player B"] * 4,
+                "season": 2024,
+                "week": [1, 2, 3, 4, 5, 1, 2, 4, 5],
+                "receptions": [1, 2, 3, 4, 5, 10, 20, 40, 50],
+                "target_share": [0.1, 0.2, 0.3, 0.4, np.nan, 0.5, 0.5, 0.5, 0.5],
+            }
+        )
+        self.aggregates = WeeklyAggregates(self.weekly)
+
+    def test_window_matches_groupby(self):
+        window = self.aggregates.window("A", 2, 4)
+        self.assertEqual(window["receptions"], 9)
+        self.assertAlmostEqual(window["target_share"], 0.3)
+        self.assertEqual(window["games"], 3)
+
+    def test_last_n_and_missing_weeks(self):
+        last = self.aggregates.last_n("B", 3)
+        self.assertEqual((last["first_week"], last["last_week"]), (3, 5))
+        self.assertEqual(last["receptions"], 90)
+        self.assertEqual(last["games"], 2)
+        self.assertIsNone(self.aggregates.window("nobody", 1, 5))
+
+    def test_rolling_and_season_totals(self):
+        rolling = self.aggregates.rolling("A", 2)
+        self.assertEqual(rolling["receptions"].tolist(), [1, 3, 5, 7, 9])
+        totals = self.aggregates.totals().set_index("player_id")
+        expected = self.weekly.groupby("player_id")["receptions"].sum()
+        self.assertEqual(
+            totals["receptions"].to_dict(), expected.astype(float).to_dict()
+        )
+        self.assertEqual(totals.loc["B", "games"], 4)
+
+    def test_retriever_last_n_weeks_query(self):
+        retriever = StatsRetriever({"weekly_data": self.weekly})
+        stats = retriever.get_stats("player Player A last 2 weeks")
+        self.assertEqual(stats["player"], "Player A")
+        self.assertEqual(stats["receptions"], 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from tools.team_manager import TeamManager
+from tools.web_search import WebSearch
+
+
+def _response(status_code, payload=None):
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    return response
+
+
+class TestWebSearchAsync(unittest.IsolatedAsyncioTestCase):
+
+    @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_asearch_success(self, mock_get):
+        mock_get.return_value = _response(200, {"results": ["Kelce questionable"]})
+        results = await WebSearch(api_key="fake").asearch("Kelce")
+        self.assertEqual(results, ["Kelce questionable"])
+        self.assertEqual(mock_get.call_args.kwargs["params"], {"q": "Kelce"})
+
+    @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_asearch_failure(self, mock_get):
+        mock_get.return_value = _response(500)
+        results = await WebSearch(api_key="fake").asearch("Kelce")
+        self.assertEqual(results, "Error fetching search results: 500")
+
+
+class TestTeamManagerAsync(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        with patch("requests.Session.post", return_value=_response(200)):
+            self.manager = TeamManager("fake_api_key", "fake_user", "fake_pass")
+
+    async def asyncTearDown(self):
+        await self.manager.aclose()
+
+    @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_logs_in_once_then_reuses_the_client(self, mock_post, mock_get):
+        mock_post.return_value = _response(200)
+        mock_get.return_value = _response(200, {"roster": "data"})
+        self.assertEqual(await self.manager.aget_roster(), {"roster": "data"})
+        self.assertEqual(
+            await self.manager.amanage_team("get_roster"), {"roster": "data"}
+        )
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_authentication_failure(self, mock_post):
+        mock_post.return_value = _response(401)
+        with self.assertRaises(Exception) as context:
+            await self.manager.aget_roster()
+        self.assertIn("Authentication failed", str(context.exception))
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_update_roster(self, mock_post):
+        mock_post.side_effect = [_response(200), _response(400)]
+        result = await self.manager.aupdate_roster(player_id="123", action_type="add")
+        self.assertEqual(result, "Error updating roster: 400")
+
+
+if __name__ == "__main__":
+    unittest.main()
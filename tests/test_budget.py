@@ -0,0 +1,77 @@
+import unittest
+from typing import Annotated
+
+from agent.budget import LLMBudgetExceeded, TurnBudget, TurnMetrics, TurnStats
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import AnyMessage, add_messages
+from typing_extensions import TypedDict
+
+
+class _State(TypedDict):
+    messages: Annotated[list[AnyMessage], add_messages]
+
+
+def _graph(llm):
+    def assistant(state):
+        try:
+            return {"messages": [llm.invoke(state["messages"])]}
+        except LLMBudgetExceeded:
+            return {"messages": [AIMessage(content="over budget")]}
+
+    graph = StateGraph(_State)
+    graph.add_node("router", assistant)
+    graph.add_node("stats_assistant", assistant)
+    graph.add_edge(START, "router")
+    graph.add_edge("router", "stats_assistant")
+    graph.add_edge("stats_assistant", END)
+    return graph.compile()
+
+
+class TestTurnBudget(unittest.TestCase):
+
+    def setUp(self):
+        self.llm = GenericFakeChatModel(
+            messages=iter([AIMessage(content="a"), AIMessage(content="b")])
+        )
+
+    def _run(self, budget):
+        return _graph(self.llm).invoke(
+            {"messages": [HumanMessage(content="Kelce stats")]},
+            {"callbacks": [budget]},
+        )
+
+    def test_counts_steps_nodes_and_llm_calls(self):
+        budget = TurnBudget(max_llm_calls=2)
+        self._run(budget)
+        metrics = budget.metrics()
+        self.assertEqual(metrics.steps, 2)
+        self.assertEqual(metrics.nodes, ["router", "stats_assistant"])
+        self.assertEqual(metrics.llm_calls, 2)
+        self.assertFalse(metrics.budget_exceeded)
+
+    def test_llm_calls_beyond_the_budget_fail(self):
+        budget = TurnBudget(max_llm_calls=1)
+        state = self._run(budget)
+        self.assertEqual(state["messages"][-1].content, "over budget")
+        self.assertEqual(budget.llm_calls, 1)
+        self.assertTrue(budget.metrics().budget_exceeded)
+
+
+class TestTurnStats(unittest.TestCase):
+
+    def test_summary(self):
+        stats = TurnStats(max_turns=2)
+        self.assertEqual(stats.summary(), {"turns": 0})
+        for steps in (9, 2, 4):
+            stats.record(TurnMetrics(steps, [], steps - 1, 0.5, complete=steps > 2))
+        summary = stats.summary()
+        self.assertEqual(summary["turns"], 2)
+        self.assertEqual(summary["mean_steps"], 3)
+        self.assertEqual(summary["max_llm_calls"], 3)
+        self.assertEqual(summary["incomplete"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from data.compaction import compact_frame
+from data.registry import DatasetRegistry
+from data.team_index import TeamIndex
+
+
+class TestCompaction(unittest.TestCase):
+
+    def setUp(self):
+        rows = 1000
+        self.frame = pd.DataFrame(
+            {
+                "player_id": [f"00-{i % 50}" for i in range(rows)],
+                "team": ["KC", "BUF", "jac", None] * (rows // 4),
+                "headline": [f"note {i}" for i in range(rows)],
+                "week": np.arange(rows) % 18 + 1,
+                "receiving_yards": (np.arange(rows) % 120).astype(float),
+                "epa": np.linspace(-3, 3, rows),
+                "espn_id": [4241479.0, np.nan] * (rows // 2),
+            }
+        )
+
+    def test_dtypes_and_report(self):
+        compacted, report = compact_frame(self.frame, name="weekly_data")
+        self.assertEqual(compacted["player_id"].dtype, "category")
+        self.assertEqual(compacted["team"].dtype, "category")
+        self.assertEqual(compacted["headline"].dtype, object)
+        self.assertEqual(compacted["week"].dtype, np.int32)
+        self.assertEqual(compacted["receiving_yards"].dtype, np.int32)
+        self.assertEqual(compacted["epa"].dtype, np.float32)
+        self.assertGreater(report.bytes_saved, 0)
+        self.assertEqual(report.columns["week"], ("int64", "int32"))
+
+    def test_values_survive(self):
+        compacted, _ = compact_frame(self.frame, schema={"player_id": "keep"})
+        self.assertEqual(compacted["player_id"].dtype, object)
+        # Float-typed IDs round-trip exactly
+        self.assertEqual(compacted["espn_id"].iloc[0], 4241479)
+        np.testing.assert_allclose(compacted["epa"], self.frame["epa"], rtol=1e-6)
+        self.assertEqual(
+            compacted["receiving_yards"].sum(), self.frame["receiving_yards"].sum()
+        )
+        index = TeamIndex()
+        index.add_frame("weekly_data", compacted)
+        self.assertEqual(len(index.lookup("JAX")["weekly_data"]), 250)
+
+    def test_registry_compacts_on_load(self):
+        registry = DatasetRegistry(
+            {"weekly_data": (lambda: self.frame, {})}, compact=True
+        )
+        self.assertEqual(registry["weekly_data"]["player_id"].dtype, "category")
+        usage = registry.usage_report()["weekly_data"]
+        self.assertEqual(
+            usage["bytes_saved"],
+            registry.compaction_report()["weekly_data"].bytes_saved,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
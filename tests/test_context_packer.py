@@ -0,0 +1,79 @@
+import json
+import unittest
+
+from agent.context_packer import ContextPacker, estimate_tokens
+
+
+def _page(weeks, columns=30, total=None):
+    records = [
+        {
+            "player_display_name": "Travis Kelce",
+            "position": "TE",
+            "season": 2024,
+            "week": week,
+            **{f"stat_{i}": week * 10.0 + i for i in range(columns)},
+        }
+        for week in weeks
+    ]
+    return {
+        "records": records,
+        "total": total or len(records),
+        "offset": 0,
+        "next_cursor": "bzo0MA",
+    }
+
+
+class TestContextPacker(unittest.TestCase):
+
+    def test_small_output_is_passed_through(self):
+        packer = ContextPacker(budget=100)
+        packed = packer.pack({"team": "KC"})
+        self.assertEqual(packed.text, json.dumps({"team": "KC"}))
+        self.assertEqual(packed.saved, 0)
+        self.assertEqual(packer.pack("plain text").text, "plain text")
+
+    def test_pages_are_packed_into_tables(self):
+        packer = ContextPacker(budget=600, top_rows=3)
+        output = {
+            "weekly": _page(range(1, 18), total=40),
+            "matched_player": [{"query": "kelce"}],
+        }
+        packed = packer.pack(output, name="GetStats")
+        self.assertLessEqual(packed.tokens, 600)
+        self.assertGreater(packed.saved, 0)
+        self.assertEqual(packed.tokens, estimate_tokens(packed.text))
+        lines = packed.text.splitlines()
+        self.assertEqual(lines[0], json.dumps({"matched_player": [{"query": "kelce"}]}))
+        self.assertIn("## weekly: 17 of 40 rows", lines)
+        self.assertIn(
+            "same in every row: player_display_name=Travis Kelce, "
+            "position=TE, season=2024",
+            lines,
+        )
+        header = lines.index("week," + ",".join(f"stat_{i}" for i in range(11)))
+        # Newest week first
+        self.assertEqual(lines[header + 1].split(",")[0], "17")
+        self.assertIn("... 14 more rows", lines)
+        self.assertIn("week: 9/1/17/153", lines)
+        self.assertIn('next_cursor: "bzo0MA"', lines)
+
+    def test_other_output_is_truncated(self):
+        packer = ContextPacker(budget=50)
+        packed = packer.pack(["news " * 500], name="SearchNews")
+        self.assertTrue(packed.text.endswith("[truncated]"))
+        self.assertLessEqual(packed.tokens, 50)
+
+    def test_stats_add_up_calls(self):
+        packer = ContextPacker(budget=100)
+        packer.pack("x" * 4000)
+        packer.pack("short")
+        stats = packer.stats()
+        self.assertEqual(stats["calls"], 2)
+        self.assertEqual(stats["raw_tokens"], 1002)
+        self.assertEqual(
+            stats["saved_tokens"], stats["raw_tokens"] - stats["packed_tokens"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+import tempfile
+import threading
+import unittest
+
+import pandas as pd
+from data.dataset_cache import DatasetCache, dataset_key
+from data.freshness import FreshnessPolicy
+from data.registry import DatasetRegistry
+
+
+def import_ngs_data(stat_type, years):
+    import_ngs_data.calls += 1
+    return pd.DataFrame({"stat_type": [stat_type] * len(years), "season": years})
+
+
+class TestDatasetKey(unittest.TestCase):
+
+    def test_variants_get_distinct_keys(self):
+        passing = dataset_key(
+            import_ngs_data, {"stat_type": "passing", "years": [2024]}
+        )
+        rushing = dataset_key(
+            import_ngs_data, {"stat_type": "rushing", "years": [2024]}
+        )
+        self.assertEqual(passing.dataset, "ngs_data")
+        self.assertNotEqual(passing, rushing)
+
+    def test_argument_order_is_canonicalized(self):
+        a = dataset_key(
+            import_ngs_data, {"years": [2024, 2023], "stat_type": "passing"}
+        )
+        b = dataset_key(
+            import_ngs_data, {"stat_type": "passing", "years": (2023, 2024)}
+        )
+        self.assertEqual(a, b)
+
+
+class TestDatasetCache(unittest.TestCase):
+
+    def setUp(self):
+        import_ngs_data.calls = 0
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = DatasetCache(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_each_variant_is_stored_separately(self):
+        passing = self.cache.get(
+            import_ngs_data, {"stat_type": "passing", "years": [2024]}
+        )
+        rushing = self.cache.get(
+            import_ngs_data, {"stat_type": "rushing", "years": [2024]}
+        )
+        self.assertEqual(passing["stat_type"][0], "passing")
+        self.assertEqual(rushing["stat_type"][0], "rushing")
+        self.assertEqual(len(self.cache.keys()), 2)
+
+        self.cache.get(import_ngs_data, {"stat_type": "passing", "years": [2024]})
+        self.assertEqual(import_ngs_data.calls, 2)
+
+    def test_invalidate_only_drops_one_variant(self):
+        passing = {"stat_type": "passing", "years": [2024]}
+        rushing = {"stat_type": "rushing", "years": [2024]}
+        self.cache.get(import_ngs_data, passing)
+        self.cache.get(import_ngs_data, rushing)
+
+        self.assertTrue(self.cache.invalidate(import_ngs_data, passing))
+        self.assertFalse(self.cache.contains(dataset_key(import_ngs_data, passing)))
+        self.assertTrue(self.cache.contains(dataset_key(import_ngs_data, rushing)))
+
+
+def import_weekly_data(years):
+    # Simulates a feed that has published ``import_weekly_data.weeks`` weeks,
+    # the latest of them in its ``import_weekly_data.revision``
+    last = import_weekly_data.weeks
+    weeks = range(1, last + 1)
+    revision = import_weekly_data.revision
+    return pd.DataFrame(
+        [
+            (y, w, f"{y}-{w}{revision if w == last else ''}")
+            for y in years
+            for w in weeks
+        ],
+        columns=["season", "week", "row"],
+    )
+
+
+class TestIncrementalRefresh(unittest.TestCase):
+
+    def setUp(self):
+        import_weekly_data.weeks = 3
+        import_weekly_data.revision = ""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = DatasetCache(self.tmp.name)
+        self.kwargs = {"years": [2024]}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_update_stores_weeks_from_the_high_water_mark(self):
+        self.cache.get(import_weekly_data, self.kwargs)
+        self.assertEqual(
+            self.cache.high_water(import_weekly_data, self.kwargs),
+            {"season": 2024, "week": 3},
+        )
+        import_weekly_data.weeks = 5
+        new_rows = self.cache.update(import_weekly_data, self.kwargs, 2024)
+        self.assertEqual(new_rows["week"].tolist(), [3, 4, 5])
+        new_rows = self.cache.update(import_weekly_data, self.kwargs, 2024)
+        self.assertEqual(new_rows["week"].tolist(), [5])
+        stored = self.cache.get(import_weekly_data, self.kwargs)
+        self.assertEqual(stored["week"].tolist(), [1, 2, 3, 4, 5])
+
+    def test_update_replaces_a_revised_high_water_week(self):
+        self.cache.get(import_weekly_data, self.kwargs)
+        import_weekly_data.revision = "b"
+        new_rows = self.cache.update(import_weekly_data, self.kwargs, 2024)
+        self.assertEqual(new_rows["row"].tolist(), ["2024-3b"])
+        stored = self.cache.get(import_weekly_data, self.kwargs)
+        self.assertEqual(stored["row"].tolist(), ["2024-1", "2024-2", "2024-3b"])
+
+    def test_registry_refresh_notifies_append_listeners(self):
+        registry = DatasetRegistry(
+            {"weekly_data": (import_weekly_data, self.kwargs)}, cache=self.cache
+        )
+        loaded, appended = [], []
+        registry.add_listener(
+            lambda name, frame: loaded.append(name),
+            on_append=lambda name, frame, rows: appended.append(len(rows)),
+        )
+        self.assertEqual(len(registry["weekly_data"]), 3)
+        import_weekly_data.weeks = 4
+        import_weekly_data.revision = "b"
+        registry.refresh("weekly_data")
+        frame = registry["weekly_data"]
+        self.assertEqual(
+            frame["row"].tolist(), ["2024-1", "2024-2", "2024-3", "2024-4b"]
+        )
+        self.assertEqual((loaded, appended), (["weekly_data"], [2]))
+        registry.refresh("weekly_data")
+        frame = registry["weekly_data"]
+        self.assertEqual(frame["week"].tolist(), [1, 2, 3, 4])
+
+    def test_store_writes_change_the_data_version(self):
+        spec = {"weekly_data": (import_weekly_data, self.kwargs)}
+        registry = DatasetRegistry(spec, cache=self.cache)
+        # Read from the store, never loaded into memory
+        registry.read("weekly_data", seasons=[2024])
+        self.assertFalse(registry.is_loaded("weekly_data"))
+        import_weekly_data.weeks = 4
+        registry.refresh("weekly_data")
+        self.assertEqual(registry.data_version(), "1")
+
+        expired = FreshnessPolicy(ttl=-1, stale_while_revalidate=False)
+        registry = DatasetRegistry(
+            spec, cache=self.cache, policies={"weekly_data": expired}
+        )
+        registry.read("weekly_data", seasons=[2024])
+        self.assertFalse(registry.is_loaded("weekly_data"))
+        self.assertEqual(registry.data_version(), "1")
+
+    def test_stored_seasons_are_read_during_a_refetch(self):
+        self.cache.get(import_weekly_data, self.kwargs)
+        started, release = threading.Event(), threading.Event()
+
+        def slow_import(years):
+            started.set()
+            release.wait(5)
+            return import_weekly_data(years)
+
+        # Same dataset key as import_weekly_data
+        slow_import.__name__ = import_weekly_data.__name__
+        refetch = threading.Thread(
+            target=self.cache.refetch, args=(slow_import, self.kwargs)
+        )
+        refetch.start()
+        started.wait(5)
+        frame = self.cache.get(import_weekly_data, self.kwargs)
+        self.assertTrue(refetch.is_alive())
+        self.assertEqual(len(frame), 3)
+        release.set()
+        refetch.join(5)
+
+
+if __name__ == "__main__":
+    unittest.main()
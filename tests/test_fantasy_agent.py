@@ -0,0 +1,201 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from agent.budget import TurnBudget
+from agent.response_cache import ResponseCache
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_openai.chat_models.base import _convert_message_to_dict
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+# The team manager logs in when the module is imported
+with patch("requests.Session.post", return_value=Mock(status_code=200)):
+    from agent import fantasy_agent
+
+
+class _FakeChat(GenericFakeChatModel):
+    """Records the OpenAI payload of every call and calls the tool once."""
+
+    payloads: list = []
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.payloads.append([_convert_message_to_dict(m) for m in messages])
+        return super()._generate(messages, stop, run_manager, **kwargs)
+
+
+def _fake_chat():
+    return _FakeChat(
+        messages=iter(
+            [
+                AIMessage(
+                    content="",
+                    tool_calls=[
+                        {"name": "GetStats", "args": {"query": "Kelce"}, "id": "c1"}
+                    ],
+                ),
+                AIMessage(content="Kelce had 8 catches"),
+            ]
+        )
+    )
+
+
+class TestAssistant(unittest.TestCase):
+
+    def test_message_names_are_not_sent_to_the_model(self):
+        llm = _fake_chat()
+        state = {
+            "messages": [HumanMessage(content="Kelce stats")],
+            "dialog_state": [],
+            "summary": "",
+        }
+        with (
+            patch.object(fantasy_agent, "llm", llm),
+            patch.object(
+                fantasy_agent.stats_assistant,
+                "use_tool",
+                return_value={"receptions": 8},
+            ),
+        ):
+            messages = fantasy_agent.stats_assistant(state)["messages"]
+
+        self.assertEqual(messages[-1].content, "Kelce had 8 catches")
+        # Display names are kept in the state for merging branches
+        self.assertEqual(messages[-1].name, fantasy_agent.stats_assistant.name)
+        self.assertEqual(len(llm.payloads), 2)
+        answer_call = llm.payloads[-1]
+        self.assertEqual(
+            [m["role"] for m in answer_call], ["system", "user", "assistant", "tool"]
+        )
+        for message in answer_call:
+            self.assertNotIn("name", message)
+
+
+class TestResponseCaching(unittest.TestCase):
+
+    def _finish(self, user_input, intents):
+        agent = fantasy_agent.FantasyFootballAgent(
+            cache=ResponseCache(), checkpointer=MemorySaver()
+        )
+        state = {
+            "messages": [
+                HumanMessage(content=user_input),
+                AIMessage(content="Done", name="Team Management Assistant"),
+            ],
+            "intents": intents,
+            "turn_complete": True,
+            "dialog_state": [],
+        }
+        self.assertEqual(agent._finish(user_input, "", TurnBudget(), state), "Done")
+        return agent.cache.stats()["entries"]
+
+    def test_only_stats_answers_are_cached(self):
+        self.assertEqual(self._finish("Kelce receiving stats", ["stats"]), 1)
+        self.assertEqual(self._finish("drop player 123", ["team"]), 0)
+        self.assertEqual(self._finish("Kelce stats and news", ["stats", "news"]), 0)
+        self.assertEqual(self._finish("hello", []), 0)
+
+    def test_cached_answers_are_recorded_by_sync_and_async_turns(self):
+        agent = fantasy_agent.FantasyFootballAgent(
+            cache=ResponseCache(), checkpointer=MemorySaver()
+        )
+        context, cached = agent._cached_turn("Kelce stats", {})
+        self.assertIsNone(cached)
+        agent.cache.put("Kelce stats", "Kelce had 8 catches", context)
+
+        answers = [
+            agent.run("Kelce stats", thread_id="sync"),
+            asyncio.run(agent.arun("Kelce stats", thread_id="async")),
+        ]
+        self.assertEqual(answers, ["Kelce had 8 catches"] * 2)
+        for thread_id in ("sync", "async"):
+            config = {"configurable": {"thread_id": thread_id}}
+            messages = agent.app.get_state(config).values["messages"]
+            self.assertEqual(
+                [m.content for m in messages], ["Kelce stats", "Kelce had 8 catches"]
+            )
+
+
+class TestThreadCheckpoints(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "sessions.sqlite")
+        self.connections = []
+
+    def tearDown(self):
+        for connection in self.connections:
+            connection.close()
+        self.tmp.cleanup()
+
+    def _agent(self):
+        # A new saver on the same file, as after a restart
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connections.append(connection)
+        return fantasy_agent.FantasyFootballAgent(
+            cache=ResponseCache(), checkpointer=SqliteSaver(connection)
+        )
+
+    def test_thread_resumes_with_a_new_saver(self):
+        replies = ["Hi, ask me about your team.", "You're welcome.", "Hi again."]
+        llm = _FakeChat(messages=iter([AIMessage(content=r) for r in replies]))
+        with patch.object(fantasy_agent, "llm", llm):
+            agent = self._agent()
+            self.assertEqual(agent.run("hello", thread_id="t1"), replies[0])
+            self.assertEqual(agent.run("thanks", thread_id="t1"), replies[1])
+
+            agent = self._agent()
+            config = {"configurable": {"thread_id": "t1"}}
+            messages = agent.app.get_state(config).values["messages"]
+            self.assertEqual(
+                [m.content for m in messages],
+                ["hello", replies[0], "thanks", replies[1]],
+            )
+            self.assertEqual(agent.run("hello again", thread_id="t1"), replies[2])
+
+        # The resumed turn was asked with the earlier turns as context
+        contents = [m["content"] for m in llm.payloads[-1]]
+        self.assertEqual(
+            contents[1:], ["hello", replies[0], "thanks", replies[1], "hello again"]
+        )
+        messages = agent.app.get_state(config).values["messages"]
+        self.assertEqual(len(messages), 6)
+
+    def test_async_turns_share_one_saver_on_the_same_file(self):
+        replies = ["Hi.", "Sure.", "Bye."]
+        llm = _FakeChat(messages=iter([AIMessage(content=r) for r in replies]))
+        agent = self._agent()
+
+        async def turns():
+            app = agent._async_app()
+            answers = [
+                await agent.arun("hello again", thread_id="t1"),
+                await agent.arun("bye", thread_id="t1"),
+            ]
+            self.assertIs(agent._async_app(), app)
+            await agent.aclose()
+            return answers
+
+        with patch.object(fantasy_agent, "llm", llm):
+            self.assertEqual(agent.run("hello", thread_id="t1"), replies[0])
+            self.assertEqual(asyncio.run(turns()), replies[1:])
+
+        # Sync and async turns were written to the same thread
+        config = {"configurable": {"thread_id": "t1"}}
+        messages = agent.app.get_state(config).values["messages"]
+        self.assertEqual(
+            [m.content for m in messages],
+            ["hello", replies[0], "hello again", replies[1], "bye", replies[2]],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
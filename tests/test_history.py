@@ -0,0 +1,75 @@
+import unittest
+
+from agent.history import (
+    context_messages,
+    expired,
+    fallback_summary,
+    fingerprint,
+    removals,
+    split_turns,
+)
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+
+def _turn(i):
+    return [
+        HumanMessage(content=f"question {i}", id=f"h{i}"),
+        AIMessage(content="", tool_calls=[], name="Stats Assistant", id=f"c{i}"),
+        ToolMessage(content="rows", tool_call_id="1", id=f"t{i}"),
+        AIMessage(content=f"answer {i}", name="Stats Assistant", id=f"a{i}"),
+    ]
+
+
+def _conversation(turns):
+    messages = [m for i in range(turns) for m in _turn(i)]
+    return messages + [HumanMessage(content="latest", id="latest")]
+
+
+class TestHistory(unittest.TestCase):
+
+    def test_split_turns(self):
+        turns = split_turns(_conversation(2))
+        self.assertEqual([len(t) for t in turns], [4, 4, 1])
+
+    def test_context_is_the_window_of_questions_and_answers(self):
+        context = context_messages(_conversation(3), summary="Kelce talk", turns=2)
+        self.assertIsInstance(context[0], SystemMessage)
+        self.assertIn("Kelce talk", context[0].content)
+        self.assertEqual(
+            [m.content for m in context[1:]],
+            ["question 1", "answer 1", "question 2", "answer 2"],
+        )
+
+    def test_merged_answer_replaces_branch_answers(self):
+        messages = [
+            HumanMessage(content="stats and news"),
+            AIMessage(content="8 catches", name="Stats Assistant"),
+            AIMessage(content="questionable", name="News Assistant"),
+            AIMessage(content="both", name="merged"),
+            HumanMessage(content="latest"),
+        ]
+        self.assertEqual(context_messages(messages)[-1].content, "both")
+
+    def test_turns_expire_in_batches(self):
+        self.assertEqual(expired(_conversation(3), turns=2), [])
+        old = expired(_conversation(4), turns=2)
+        self.assertEqual(
+            {m.id for m in old}, {"h0", "c0", "t0", "a0", "h1", "c1", "t1", "a1"}
+        )
+        self.assertEqual(len(removals(old)), 8)
+
+    def test_fallback_summary_keeps_the_questions(self):
+        old = expired(_conversation(4), turns=2)
+        self.assertEqual(
+            fallback_summary("earlier", old), "earlier; question 0; question 1"
+        )
+
+    def test_fingerprint(self):
+        self.assertEqual(fingerprint([]), "")
+        messages = [m for i in range(2) for m in _turn(i)]
+        self.assertEqual(fingerprint(messages), fingerprint(list(messages)))
+        self.assertNotEqual(fingerprint(messages), fingerprint(messages, "summary"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from agent.intent_classifier import IntentClassifier, default_classifier
+
+
+class TestIntentClassifier(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.classifier = default_classifier()
+
+    def assertRoutes(self, text, intents):
+        prediction = self.classifier.predict(text)
+        self.assertTrue(prediction.confident, prediction.probabilities)
+        self.assertEqual(prediction.intents, intents)
+
+    def test_unseen_phrasings_are_routed_locally(self):
+        self.assertRoutes("How many yards did Kelce have in week 3?", ["stats"])
+        self.assertRoutes("Is Deebo playing this week?", ["news"])
+        self.assertRoutes("Trade Jefferson for Chase?", ["trade"])
+        self.assertRoutes("any good waiver adds at WR", ["waiver"])
+        self.assertRoutes("show my roster", ["team"])
+
+    def test_compound_question_has_every_intent(self):
+        self.assertRoutes("stats and latest news on Kelce", ["stats", "news"])
+
+    def test_small_talk_falls_back_to_the_llm(self):
+        for text in ["hello", "what about them?"]:
+            self.assertFalse(self.classifier.predict(text).confident, text)
+
+    def test_close_call_is_not_confident(self):
+        examples = [("kelce stats", ["stats"]), ("kelce news", ["news"])]
+        classifier = IntentClassifier().fit(examples)
+        self.assertTrue(classifier.predict("stats").confident)
+        self.assertFalse(classifier.predict("kelce").confident)
+
+    def test_predict_requires_fit(self):
+        with self.assertRaises(ValueError):
+            IntentClassifier().predict("kelce stats")
+
+
+if __name__ == "__main__":
+    unittest.main()
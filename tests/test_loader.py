@@ -0,0 +1,48 @@
+import time
+import unittest
+
+from data.loader import load_concurrently
+
+
+def _sleep_and_return(seconds, value):
+    time.sleep(seconds)
+    return value
+
+
+def _fail():
+    raise ValueError("boom")
+
+
+class TestLoadConcurrently(unittest.TestCase):
+
+    def test_results_keep_task_order(self):
+        tasks = [
+            (_sleep_and_return, {"seconds": 0.2, "value": "slow"}),
+            (_sleep_and_return, {"seconds": 0.0, "value": "fast"}),
+        ]
+        results, report = load_concurrently(tasks, names=["a", "b"], progress=False)
+        self.assertEqual(results, ["slow", "fast"])
+        self.assertEqual(report.failed, [])
+        self.assertEqual(report.slowest.name, "a")
+        self.assertIn(", slowest a 0.2", report.summary().splitlines()[0])
+
+    def test_wall_time_close_to_slowest_task(self):
+        tasks = [(_sleep_and_return, {"seconds": 0.2, "value": i}) for i in range(5)]
+        _, report = load_concurrently(tasks, max_workers=5, progress=False)
+        self.assertLess(report.wall_seconds, 0.6)
+
+    def test_errors_and_timeouts_are_reported(self):
+        tasks = [
+            (_fail, {}),
+            (_sleep_and_return, {"seconds": 1.0, "value": "late"}),
+        ]
+        results, report = load_concurrently(
+            tasks, names=["fail", "late"], timeout=0.2, progress=False
+        )
+        self.assertEqual(results, [None, None])
+        statuses = {t.name: t.status for t in report.timings}
+        self.assertEqual(statuses, {"fail": "error", "late": "timeout"})
+
+
+if __name__ == "__main__":
+    unittest.main()
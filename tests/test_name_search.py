@@ -0,0 +1,49 @@
+import unittest
+
+from data.name_search import NameSearch
+
+
+class TestNameSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.search = NameSearch(
+            {
+                "patrick mahomes": "Patrick Mahomes",
+                "travis kelce": "Travis Kelce",
+                "jason kelce": "Jason Kelce",
+                "tom brady": "Tom Brady",
+            },
+            activity={"travis kelce": 17, "jason kelce": 0, "patrick mahomes": 17},
+        )
+
+    def test_exact_match_is_case_insensitive(self):
+        self.assertEqual(self.search.best("Tom BRADY").display_name, "Tom Brady")
+
+    def test_typos_are_tolerated(self):
+        self.assertEqual(self.search.best("Patrik Mahomse").name, "patrick mahomes")
+
+    def test_partial_name_prefers_active_player(self):
+        matches = self.search.search("kelce")
+        self.assertEqual([m.name for m in matches][:2], ["travis kelce", "jason kelce"])
+
+    def test_aliases_are_reported_as_one_player(self):
+        search = NameSearch(
+            {
+                "tkelce": "T.Kelce",
+                "travis kelce": "Travis Kelce",
+                "jason kelce": "Jason Kelce",
+            },
+            activity={"travis kelce": 17},
+            aliases={"tkelce": "travis kelce"},
+        )
+        matches = search.search("kelce")
+        self.assertEqual([m.name for m in matches], ["travis kelce", "jason kelce"])
+        self.assertEqual(matches[0].activity, 17)
+        self.assertEqual(search.best("T.Kelce").display_name, "Travis Kelce")
+
+    def test_unrelated_query_has_no_match(self):
+        self.assertIsNone(self.search.best("xyzzy"))
+
+
+if __name__ == "__main__":
+    unittest.main()
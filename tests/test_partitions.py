@@ -0,0 +1,127 @@
+import unittest
+
+import pandas as pd
+from data.partitions import SeasonPartitions, parse_seasons
+from data.query import QuerySpec
+from data.registry import DatasetRegistry
+from tools.stats_retriever import StatsRetriever
+
+
+def _weekly(years):
+    rows = []
+    for season in years:
+        for week in range(1, 4):
+            rows.append(
+                {
+                    "player_display_name": "Travis Kelce",
+                    "player_id": "00-1",
+                    "season": season,
+                    "week": week,
+                    "recent_team": "KC",
+                    "receptions": season - 2020,
+                }
+            )
+            rows.append(
+                {
+                    "player_display_name": "Derek Carr",
+                    "player_id": "00-2",
+                    "season": season,
+                    "week": week,
+                    "recent_team": "OAK" if season < 2020 else "NO",
+                    "receptions": 0,
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+class TestParseSeasons(unittest.TestCase):
+
+    def test_ranges_and_lists(self):
+        self.assertEqual(parse_seasons("2022-2024"), [2022, 2023, 2024])
+        self.assertEqual(parse_seasons("2024, 2020-2021,2020"), [2020, 2021, 2024])
+
+
+class TestSeasonPartitions(unittest.TestCase):
+
+    def test_least_recently_used_season_is_evicted(self):
+        loads = []
+
+        def load(name, season):
+            loads.append(season)
+            return pd.DataFrame({"value": range(1000)})
+
+        size = int(load("weekly_data", 0).memory_usage(deep=True).sum())
+        partitions = SeasonPartitions(load, max_bytes=2 * size)
+        partitions.get("weekly_data", 2022)
+        partitions.get("weekly_data", 2023)
+        partitions.get("weekly_data", 2022)  # 2023 is now least recently used
+        partitions.get("weekly_data", 2024)
+        self.assertEqual(
+            partitions.keys(), [("weekly_data", 2022), ("weekly_data", 2024)]
+        )
+        self.assertLessEqual(partitions.bytes, partitions.max_bytes)
+        stats = partitions.stats()
+        self.assertEqual(
+            (stats["hits"], stats["misses"], stats["evictions"]), (1, 3, 1)
+        )
+        partitions.evict("weekly_data")
+        self.assertEqual(partitions.keys(), [])
+
+
+class TestMultiSeasonQueries(unittest.TestCase):
+
+    def setUp(self):
+        self.fetched = []
+
+        def fetch(func, kwargs):
+            self.fetched.append(tuple(kwargs["years"]))
+            return func(**kwargs)
+
+        self.registry = DatasetRegistry(
+            {"weekly_data": (_weekly, {"years": [2024]})},
+            fetch=fetch,
+            seasons=range(2018, 2025),
+        )
+        self.retriever = StatsRetriever(self.registry)
+
+    def test_iter_seasons_loads_one_partition_at_a_time(self):
+        self.registry["weekly_data"]
+        seasons = [
+            s for s, _ in self.registry.iter_seasons("weekly_data", [2019, 2024])
+        ]
+        self.assertEqual(seasons, [2019, 2024])
+        # 2024 is served from the frame in memory
+        self.assertEqual(self.fetched, [(2024,), (2019,)])
+
+    def test_read_reaches_seasons_outside_memory(self):
+        rows = self.registry.read("weekly_data", seasons=[2022, 2023, 2024])
+        self.assertEqual(sorted(rows["season"].unique()), [2022, 2023, 2024])
+        self.assertEqual(len(rows), 18)
+
+    def test_player_query_streams_across_seasons(self):
+        spec = QuerySpec(
+            player="travis kelce",
+            dataset="weekly_data",
+            seasons=[2021, 2022, 2024],
+            aggregations={"receptions": "mean"},
+            group_by=["season"],
+            explain=True,
+        )
+        result = self.retriever.query(spec)
+        records = result.to_dict()["records"]
+        self.assertEqual([r["season"] for r in records], [2021, 2022, 2024])
+        self.assertEqual([r["receptions"] for r in records], [1, 2, 4])
+        self.assertIn("access via stream", result.meta["plan"])
+        # Seasons outside memory were served through the partition cache
+        self.assertEqual(result.meta["partitions"]["misses"], 2)
+
+    def test_team_query_matches_historical_abbreviations(self):
+        spec = QuerySpec(
+            team="LV", dataset="weekly_data", seasons=[2018, 2019, 2024], limit=None
+        )
+        rows = self.retriever.query(spec).to_dict()["records"]
+        self.assertEqual({r["season"] for r in rows}, {2018, 2019})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+
+import fastparquet
+import numpy as np
+import pandas as pd
+from data.pbp import PlayerStatsAccumulator, derive_player_stats, iter_pbp_batches
+from data.query import parse_query
+
+
+def _plays(rows=200):
+    rng = np.random.default_rng(7)
+    pass_play = rng.random(rows) < 0.6
+    receivers = rng.choice(["00-1", "00-2"], rows)
+    return pd.DataFrame(
+        {
+            "season": 2024,
+            "week": rng.integers(1, 4, rows),
+            "play_type": np.where(pass_play, "pass", "run"),
+            "posteam": "KC",
+            "yardline_100": rng.integers(1, 100, rows).astype(float),
+            "air_yards": np.where(pass_play, rng.integers(-5, 40, rows), np.nan),
+            "epa": rng.normal(0, 1, rows),
+            "passer_player_id": np.where(pass_play, "00-9", None),
+            "passer_player_name": np.where(pass_play, "P.Mahomes", None),
+            "receiver_player_id": np.where(pass_play, receivers, None),
+            "receiver_player_name": np.where(
+                pass_play, np.where(receivers == "00-1", "T.Kelce", "X.Worthy"), None
+            ),
+            "rusher_player_id": np.where(pass_play, None, "00-3"),
+            "rusher_player_name": np.where(pass_play, None, "I.Pacheco"),
+            "desc": "not read",
+        }
+    )
+
+
+class TestPbpPlayerStats(unittest.TestCase):
+
+    def setUp(self):
+        self.plays = _plays()
+
+    def test_derived_metrics(self):
+        stats = derive_player_stats(self.plays)
+        kelce = stats[stats["player_id"] == "00-1"]
+        targets = self.plays[self.plays["receiver_player_id"] == "00-1"]
+        self.assertEqual(kelce["targets"].sum(), len(targets))
+        self.assertEqual(
+            kelce["red_zone_targets"].sum(), (targets["yardline_100"] <= 20).sum()
+        )
+        self.assertAlmostEqual(kelce["air_yards"].sum(), targets["air_yards"].sum())
+        runs = self.plays[self.plays["play_type"] == "run"]
+        pacheco = stats[stats["player_id"] == "00-3"]
+        self.assertEqual(
+            pacheco["goal_line_carries"].sum(), (runs["yardline_100"] <= 5).sum()
+        )
+        self.assertEqual(stats[stats["player_id"] == "00-9"]["targets"].sum(), 0)
+
+    def test_batched_stream_matches_single_pass(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "pbp.parquet")
+            fastparquet.write(path, self.plays, row_group_offsets=64)
+            batches = list(iter_pbp_batches(path, batch_rows=25))
+            self.assertTrue(all(len(b) <= 25 for b in batches))
+            self.assertNotIn("desc", batches[0].columns)
+            accumulator = PlayerStatsAccumulator(fold_every=3)
+            for batch in batches:
+                accumulator.add(batch)
+        self.assertEqual(accumulator.plays, len(self.plays))
+        pd.testing.assert_frame_equal(
+            accumulator.result(),
+            derive_player_stats(self.plays),
+            check_dtype=False,
+            atol=1e-4,
+        )
+
+    def test_row_groups_larger_than_a_batch_are_logged(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "pbp.parquet")
+            fastparquet.write(path, self.plays)
+            with self.assertLogs("data.pbp", level="INFO") as logs:
+                batches = list(iter_pbp_batches(path, batch_rows=50))
+        self.assertEqual([len(b) for b in batches], [50, 50, 50, 50])
+        self.assertIn("row groups of up to 200 plays", logs.output[0])
+        self.assertIn("of 13 columns", logs.output[0])
+
+    def test_query_phrases(self):
+        spec = parse_query("pbp player Travis Kelce redzone columns only")
+        self.assertEqual(spec.dataset, "pbp_player_stats")
+        self.assertEqual(spec.player, "Travis Kelce")
+        self.assertIn("red_zone_targets", spec.columns)
+        # Everything the GetStats prompt promises for the group
+        self.assertTrue(
+            {"air_yards", "receiving_epa", "rushing_epa"} <= set(spec.columns)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from data.player_ids import PlayerIdCrosswalk
+from tools.stats_retriever import StatsRetriever
+
+
+class TestPlayerIdCrosswalk(unittest.TestCase):
+
+    def setUp(self):
+        self.crosswalk = PlayerIdCrosswalk(
+            pd.DataFrame(
+                {
+                    "gsis_id": ["00-1", "00-2", None],
+                    "pfr_id": ["MahoPa00", "KelcTr00", "RiceRa00"],
+                    "espn_id": [3139477.0, 15847.0, None],
+                    "name": ["Patrick Mahomes", "Travis Kelce", "Rashee Rice"],
+                }
+            )
+        )
+        self.weekly = pd.DataFrame(
+            {
+                "player_id": ["00-1", "00-2", "00-9"],
+                "week": [1, 1, 1],
+                "yards": [300, 80, 5],
+            }
+        )
+        self.snaps = pd.DataFrame(
+            {
+                "pfr_player_id": ["KelcTr00", "MahoPa00"],
+                "week": [1, 1],
+                "offense_snaps": [50, 60],
+            }
+        )
+
+    def test_to_canonical_is_vectorized_int32(self):
+        codes = self.crosswalk.to_canonical(["KelcTr00", "nope", None], "pfr_id")
+        self.assertEqual(codes.dtype, np.int32)
+        self.assertEqual(codes.tolist(), [1, -1, -1])
+        self.assertEqual(self.crosswalk.to_canonical([15847], "espn_id").tolist(), [1])
+
+    def test_resolve_by_name_or_id(self):
+        self.assertEqual(
+            self.crosswalk.resolve("patrick mahomes")["pfr_id"], "MahoPa00"
+        )
+        self.assertEqual(self.crosswalk.resolve("KelcTr00")["gsis_id"], "00-2")
+        self.assertEqual(self.crosswalk.resolve("Nobody"), {})
+
+    def test_abbreviated_names_resolve_through_the_display_name(self):
+        weekly = self.weekly.assign(
+            player_name=["P.Mahomes", "T.Kelce", "R.Rice"],
+            player_display_name=["Patrick Mahomes", "Travis Kelce", "Rashee Rice"],
+        )
+        codes = self.crosswalk.canonical_for_column(weekly, "player_name")
+        self.assertEqual(codes.tolist(), [0, 1, 2])
+
+    def test_join_across_identifier_types(self):
+        one_to_one = self.crosswalk.join(
+            self.weekly, self.snaps, "player_id", "pfr_player_id"
+        )
+        by_week = self.crosswalk.join(
+            self.weekly, self.snaps, "player_id", "pfr_player_id", on=["week"]
+        )
+        for joined in (one_to_one, by_week):
+            self.assertEqual(joined["offense_snaps"].tolist()[:2], [60, 50])
+            self.assertTrue(np.isnan(joined["offense_snaps"].iloc[2]))
+
+
+class TestPlayerSearchEntries(unittest.TestCase):
+
+    def test_aliases_of_a_player_are_one_search_entry(self):
+        ids = pd.DataFrame(
+            {
+                "gsis_id": ["00-2", "00-3"],
+                "name": ["Travis Kelce", "Jason Kelce"],
+            }
+        )
+        weekly = pd.DataFrame(
+            {
+                "player_id": ["00-2"] * 3,
+                "player_name": ["T.Kelce"] * 3,
+                "player_display_name": ["Travis Kelce"] * 3,
+                "week": [1, 2, 3],
+            }
+        )
+        pbp = pd.DataFrame(
+            {"player_id": ["00-2", "00-3"], "player_name": ["T.Kelce", "J.Kelce"]}
+        )
+        retriever = StatsRetriever(
+            {"ids": ids, "weekly_data": weekly, "pbp_player_stats": pbp}
+        )
+        matches = retriever.search_players("kelce")
+        self.assertEqual(
+            [(m["display_name"], m["activity"]) for m in matches],
+            [("Travis Kelce", 3.0), ("J.Kelce", 0.0)],
+        )
+        self.assertEqual(retriever.search_players("T.Kelce")[0]["name"], "travis kelce")
+
+
+if __name__ == "__main__":
+    unittest.main()
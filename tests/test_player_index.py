@@ -0,0 +1,76 @@
+import unittest
+
+import pandas as pd
+from data.player_index import (
+    PlayerIndex,
+    benchmark_player_lookup,
+    normalize_name,
+    scan_player_rows,
+)
+
+
+class TestPlayerIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.frames = {
+            "weekly_data": pd.DataFrame(
+                {
+                    "player_id": ["00-1", "00-2", "00-1"],
+                    "player_name": ["P.Mahomes", "T.Kelce", "P.Mahomes"],
+                    "player_display_name": [
+                        "Patrick Mahomes",
+                        "Travis Kelce",
+                        "Patrick Mahomes",
+                    ],
+                    "week": [1, 1, 2],
+                }
+            ),
+            "injuries": pd.DataFrame(
+                {
+                    "full_name": ["Travis Kelce", None],
+                    "report_status": ["Questionable", "Out"],
+                }
+            ),
+            "team_desc": pd.DataFrame({"team_abbr": ["KC"]}),
+        }
+        self.index = PlayerIndex()
+        for name, frame in self.frames.items():
+            self.index.add_frame(name, frame)
+
+    def test_normalize_name(self):
+        self.assertEqual(normalize_name("  Patrick  Mahomes II "), "patrick mahomes")
+        self.assertEqual(normalize_name("Ja'Marr Chase"), "jamarr chase")
+
+    def test_lookup_matches_scan(self):
+        indexed = self.index.lookup("Travis Kelce")
+        scanned = scan_player_rows(self.frames, "Travis Kelce")
+        self.assertEqual(indexed.keys(), scanned.keys())
+        for name in scanned:
+            pd.testing.assert_frame_equal(indexed[name], scanned[name])
+
+    def test_lookup_by_id_and_case_insensitive_name(self):
+        self.assertEqual(
+            self.index.lookup("00-1")["weekly_data"]["week"].tolist(), [1, 2]
+        )
+        self.assertIn("weekly_data", self.index.lookup("patrick mahomes"))
+
+    def test_weekly_rows_are_indexed_by_full_name(self):
+        self.assertEqual(
+            self.index.lookup("Patrick Mahomes")["weekly_data"]["week"].tolist(),
+            [1, 2],
+        )
+        self.assertNotIn("pmahomes", self.index.names())
+        self.assertEqual(self.index.row_counts("weekly_data")["patrick mahomes"], 2)
+
+    def test_removed_frame_is_not_searched(self):
+        self.index.add_frame("injuries", None)
+        self.assertNotIn("injuries", self.index.lookup("Travis Kelce"))
+
+    def test_benchmark_reports_both_paths(self):
+        result = benchmark_player_lookup(self.frames, ["Travis Kelce"], repeat=1)
+        self.assertEqual(result["lookups"], 1)
+        self.assertGreater(result["scan_seconds"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
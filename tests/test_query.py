@@ -0,0 +1,147 @@
+import unittest
+
+import pandas as pd
+from data.query import COLUMN_GROUPS, QueryPlanner, QuerySpec, parse_query
+from tools.stats_retriever import StatsRetriever
+
+
+class TestParseQuery(unittest.TestCase):
+
+    def test_player_weeks_and_column_group(self):
+        spec = parse_query("player Travis Kelce, weeks 3-8, receiving columns only")
+        self.assertEqual(spec.player, "Travis Kelce")
+        self.assertEqual(spec.weeks, (3, 8))
+        self.assertIn("receptions", spec.columns)
+        self.assertNotIn("passing_yards", spec.columns)
+        self.assertEqual(spec.all_filters(), [("week", ">=", 3), ("week", "<=", 8)])
+
+    def test_dataset_keywords_take_precedence_over_team(self):
+        spec = parse_query("injuries team ne limit 10")
+        self.assertEqual((spec.dataset, spec.team, spec.limit), ("injuries", "NE", 10))
+        spec = parse_query("team description NE")
+        self.assertEqual((spec.dataset, spec.team), ("team_desc", "NE"))
+
+    def test_filters_keep_their_case(self):
+        spec = parse_query("ftn position=QB")
+        self.assertEqual(spec.filters, [("position", "==", "QB")])
+
+    def test_group_by_and_aggregation(self):
+        spec = parse_query("weekly season 2023-2024 sum receptions group by week")
+        self.assertEqual(spec.seasons, [2023, 2024])
+        self.assertEqual(spec.aggregations, {"receptions": "sum"})
+        self.assertEqual(spec.group_by, ["week"])
+
+    def test_aggregation_words_can_start_a_player_name(self):
+        spec = parse_query("player Max Duggan passing yards")
+        self.assertEqual(spec.player, "Max Duggan")
+        spec = parse_query("player Travis Kelce max receiving_yards")
+        self.assertEqual(spec.player, "Travis Kelce")
+        self.assertEqual(spec.aggregations, {"receiving_yards": "max"})
+
+
+class TestQueryPlanner(unittest.TestCase):
+
+    def setUp(self):
+        weeks = list(range(1, 11))
+        weekly = pd.DataFrame(
+            {
+                "player_display_name": ["Travis Kelce"] * 10 + ["Patrick Mahomes"] * 10,
+                "player_id": ["00-1"] * 10 + ["00-2"] * 10,
+                "season": [2024] * 20,
+                "week": weeks * 2,
+                "recent_team": ["KC"] * 20,
+                "receptions": weeks + [0] * 10,
+                "passing_yards": [0] * 10 + [250] * 10,
+            }
+        )
+        injuries = pd.DataFrame(
+            {"team": ["NE", "KC", "NE"], "full_name": ["A", "B", "C"], "season": 2024}
+        )
+        schedules = pd.DataFrame(
+            {
+                "game_id": ["g1", "g2"],
+                "away_team": ["NE", "KC"],
+                "home_team": ["KC", "BUF"],
+            }
+        )
+        self.retriever = StatsRetriever(
+            {"weekly_data": weekly, "injuries": injuries, "schedules": schedules}
+        )
+        self.planner = QueryPlanner(self.retriever)
+
+    def test_access_paths(self):
+        plan = self.planner.plan(QuerySpec(player="Travis Kelce", weeks=(3, 8)))
+        self.assertEqual(plan.access, "player_index")
+        plan = self.planner.plan(QuerySpec(dataset="injuries", team="NE"))
+        self.assertEqual(plan.access, "store")
+        self.assertIn(("team", "in", ["NE", "NWE", "PATRIOTS"]), plan.pushdown_filters)
+        # Home/away schedules are only reachable through the team index
+        plan = self.planner.plan(QuerySpec(dataset="schedules", team="NE"))
+        self.assertEqual(plan.access, "team_index")
+
+    def test_player_week_range_projection(self):
+        result = self.retriever.get_stats(
+            "player Travis Kelce, weeks 3-8, receiving columns only"
+        )
+        records = result["weekly_data"]["records"]
+        self.assertEqual([r["week"] for r in records], [3, 4, 5, 6, 7, 8])
+        self.assertNotIn("passing_yards", records[0])
+        self.assertIn("receptions", COLUMN_GROUPS["receiving"])
+
+    def test_dataset_team_filter_and_aggregation(self):
+        result = self.retriever.get_stats("injuries team NE")
+        self.assertEqual([r["full_name"] for r in result["records"]], ["A", "C"])
+        result = self.retriever.get_stats("player Travis Kelce sum receptions")
+        self.assertEqual(result["weekly_data"]["records"], [{"receptions": 55}])
+
+    def test_grouping_without_numeric_columns_counts_rows(self):
+        injuries = pd.DataFrame(
+            {
+                "team": ["KC", "KC", "KC"],
+                "full_name": ["A", "B", "C"],
+                "report_status": ["Out", "Questionable", "Questionable"],
+            }
+        )
+        retriever = StatsRetriever({"injuries": injuries})
+        result = retriever.get_stats("injuries team KC group by report_status")
+        self.assertEqual(
+            result["records"],
+            [
+                {"report_status": "Out", "rows": 1},
+                {"report_status": "Questionable", "rows": 2},
+            ],
+        )
+        result = retriever.get_stats("team KC group by week")
+        self.assertEqual(result["injuries"]["records"], [{"rows": 3}])
+
+    def test_cursor_pages_only_its_dataset(self):
+        weeks = list(range(1, 11))
+        snaps = pd.DataFrame(
+            {
+                "player": ["Travis Kelce"] * 10,
+                "season": [2024] * 10,
+                "week": weeks,
+                "team": ["KC"] * 10,
+                "offense_snaps": weeks,
+            }
+        )
+        retriever = StatsRetriever(
+            {"weekly_data": self.retriever.weekly_data, "snap_counts": snaps}
+        )
+        first = retriever.get_stats("player Travis Kelce limit 3")
+        cursor = first["weekly_data"]["next_cursor"]
+        result = retriever.get_stats(f"player Travis Kelce limit 3 cursor {cursor}")
+        self.assertEqual(
+            [r["week"] for r in result["weekly_data"]["records"]], [4, 5, 6]
+        )
+        self.assertEqual(
+            [r["week"] for r in result["snap_counts"]["records"]], [1, 2, 3]
+        )
+
+    def test_invalid_and_unknown(self):
+        self.assertIn("error", self.retriever.get_stats("hello"))
+        self.assertIn("error", self.retriever.get_stats("player Nobody Atall"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+import queue
+import threading
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+from data.freshness import FreshnessPolicy
+from data.registry import DatasetRegistry
+from tools.stats_retriever import StatsRetriever
+
+
+def _frame(value):
+    return pd.DataFrame({"value": [value]})
+
+
+class TestDatasetRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+
+        def fetch(func, kwargs):
+            self.calls.append(kwargs["value"])
+            return func(**kwargs)
+
+        self.registry = DatasetRegistry(
+            {
+                "injuries": (_frame, {"value": "injuries"}),
+                "weekly_data": (_frame, {"value": "weekly"}),
+            },
+            fetch=fetch,
+        )
+
+    def test_nothing_loaded_until_accessed(self):
+        self.assertEqual(self.calls, [])
+        self.assertEqual(self.registry.injuries["value"][0], "injuries")
+        self.assertEqual(self.registry["injuries"]["value"][0], "injuries")
+        self.assertEqual(self.calls, ["injuries"])
+        self.assertEqual(self.registry.touched, {"injuries"})
+        self.assertFalse(self.registry.is_loaded("weekly_data"))
+
+    def test_prefetch_does_not_mark_touched(self):
+        report = self.registry.prefetch(background=False)
+        self.assertEqual(report.failed, [])
+        self.assertTrue(self.registry.is_loaded("weekly_data"))
+        self.assertEqual(self.registry.touched, set())
+        usage = self.registry.usage_report()
+        self.assertTrue(usage["weekly_data"]["loaded"])
+        self.assertFalse(usage["weekly_data"]["touched"])
+
+    def test_failed_load_returns_empty_frame_and_retries(self):
+        registry = DatasetRegistry({"broken": (_frame, {})})
+        self.assertTrue(registry["broken"].empty)
+        self.assertFalse(registry.is_loaded("broken"))
+
+    def test_data_version_changes_when_served_data_changes(self):
+        self.registry["injuries"], self.registry["weekly_data"]
+        self.assertEqual(self.registry.data_version(), "0")
+        self.registry.invalidate("injuries")
+        self.registry["injuries"]
+        self.assertEqual(self.registry.data_version(), "2")
+
+
+class TestFreshness(unittest.TestCase):
+
+    def setUp(self):
+        self.version = 0
+        self.release = threading.Event()
+
+        def injuries(block):
+            if self.version and block:
+                self.release.wait(5)
+            return _frame(self.version)
+
+        self.injuries = injuries
+
+    def test_stale_copy_served_while_revalidating(self):
+        registry = DatasetRegistry(
+            {"injuries": (self.injuries, {"block": True})},
+            policies={"injuries": FreshnessPolicy(ttl=-1)},
+        )
+        loaded = queue.Queue()
+        registry.add_listener(lambda name, frame: loaded.put(frame["value"][0]))
+        self.assertEqual(registry["injuries"]["value"][0], 0)
+        # Already expired (ttl < 0): the load is followed by a revalidation
+        self.assertEqual([loaded.get(timeout=5), loaded.get(timeout=5)], [0, 0])
+
+        self.version = 1
+        # The refetch is blocked, yet the stale copy is returned immediately
+        self.assertEqual(registry["injuries"]["value"][0], 0)
+        self.assertTrue(registry.freshness("injuries")["revalidating"])
+        self.release.set()
+        self.assertEqual(loaded.get(timeout=5), 1)
+        self.assertEqual(registry["injuries"]["value"][0], 1)
+
+    def test_blocking_policy_and_fresh_data(self):
+        registry = DatasetRegistry(
+            {
+                "injuries": (self.injuries, {"block": False}),
+                "team_desc": (self.injuries, {"block": False}),
+            },
+            policies={
+                "injuries": FreshnessPolicy(ttl=-1, stale_while_revalidate=False),
+                "team_desc": FreshnessPolicy(ttl=3600),
+            },
+        )
+        registry["injuries"], registry["team_desc"]
+        self.version = 1
+        self.assertEqual(registry["injuries"]["value"][0], 1)
+        self.assertEqual(registry["team_desc"]["value"][0], 0)
+        freshness = registry.freshness("team_desc")
+        self.assertFalse(freshness["stale"])
+        self.assertEqual(freshness["ttl_seconds"], 3600)
+
+    def test_revalidation_without_cache_goes_through_fetch(self):
+        fetched = []
+
+        def fetch(func, kwargs):
+            fetched.append(kwargs)
+            return func(**kwargs)
+
+        registry = DatasetRegistry(
+            {"injuries": (self.injuries, {"block": False})},
+            fetch=fetch,
+            policies={
+                "injuries": FreshnessPolicy(ttl=-1, stale_while_revalidate=False)
+            },
+            compact=True,
+        )
+        registry["injuries"]
+        self.version = 1
+        self.assertEqual(registry["injuries"]["value"][0], 1)
+        self.assertGreaterEqual(len(fetched), 2)
+        self.assertIn("injuries", registry.compaction_report())
+
+
+class TestRetrieverLoading(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+
+        def fetch(func, kwargs):
+            self.calls.append(kwargs["value"])
+            return func(**kwargs)
+
+        frames = {
+            "weekly_data": pd.DataFrame(
+                {"player_display_name": ["Travis Kelce"], "team": ["KC"]}
+            ),
+            "injuries": pd.DataFrame({"full_name": ["Travis Kelce"], "team": ["KC"]}),
+            "schedules": pd.DataFrame({"away_team": ["KC"], "home_team": ["BAL"]}),
+        }
+        self.registry = DatasetRegistry(
+            {name: (lambda value: frames[value], {"value": name}) for name in frames},
+            fetch=fetch,
+        )
+        self.retriever = StatsRetriever(self.registry)
+
+    def test_search_loads_only_the_weekly_data(self):
+        matches = self.retriever.search_players("kelce")
+        self.assertEqual(matches[0]["display_name"], "Travis Kelce")
+        self.assertEqual(self.calls, ["weekly_data"])
+
+    def test_queries_across_datasets_load_them_concurrently(self):
+        self.registry["weekly_data"]
+        with patch.object(
+            self.registry, "prefetch", wraps=self.registry.prefetch
+        ) as prefetch:
+            stats = self.retriever.get_team_stats("KC")
+        prefetch.assert_called_once_with(["injuries", "schedules"], background=False)
+        self.assertEqual(set(stats), {"weekly_data", "injuries", "schedules"})
+        self.assertEqual(sorted(self.calls), ["injuries", "schedules", "weekly_data"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+
+from agent.response_cache import ResponseCache, embed_text, normalize_prompt
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestNormalizePrompt(unittest.TestCase):
+
+    def test_drops_case_punctuation_and_filler(self):
+        self.assertEqual(
+            normalize_prompt("Can you show me the stats for Travis Kelce?"),
+            "stats travis kelce",
+        )
+        self.assertEqual(normalize_prompt("What is it?"), "it")
+
+    def test_embedding_is_unit_length(self):
+        self.assertAlmostEqual(float((embed_text("kelce stats") ** 2).sum()), 1.0, 5)
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = _Clock()
+        self.version = "0"
+        self.cache = ResponseCache(
+            ttl=60, max_entries=2, version=lambda: self.version, clock=self.clock
+        )
+
+    def test_rephrased_prompt_hits(self):
+        self.cache.put("Show me Travis Kelce's receiving stats", "8 catches")
+        self.assertEqual(self.cache.get("travis kelces receiving stats?"), "8 catches")
+        self.assertEqual(self.cache.get("Travis Kelce receiving stats"), "8 catches")
+        self.assertEqual(self.cache.semantic_hits, 1)
+
+    def test_different_question_misses(self):
+        self.cache.put("Travis Kelce stats", "8 catches")
+        self.assertIsNone(self.cache.get("Travis Etienne stats"))
+        self.assertIsNone(self.cache.get("Travis Kelce news"))
+
+    def test_different_week_misses(self):
+        self.cache.put("Mahomes stats week 3", "300 yards")
+        self.assertIsNone(self.cache.get("Mahomes stats week 4"))
+
+    def test_conversation_context_is_part_of_the_key(self):
+        self.cache.put("What about him?", "He is questionable", context="kelce")
+        self.assertIsNone(self.cache.get("What about him?"))
+        self.assertIsNone(self.cache.get("What about him?", context="mahomes"))
+        self.assertEqual(
+            self.cache.get("what about him", context="kelce"), "He is questionable"
+        )
+
+    def test_data_version_change_misses(self):
+        self.cache.put("Kelce stats", "8 catches")
+        self.version = "1"
+        self.assertIsNone(self.cache.get("Kelce stats"))
+
+    def test_entries_expire(self):
+        self.cache.put("Kelce stats", "8 catches")
+        self.clock.now = 61
+        self.assertIsNone(self.cache.get("Kelce stats"))
+        self.assertEqual(self.cache.stats()["expirations"], 1)
+
+    def test_least_recently_used_is_evicted(self):
+        self.cache.put("Kelce stats", "a")
+        self.cache.put("Mahomes stats", "b")
+        self.cache.get("Kelce stats")
+        self.cache.put("Jefferson stats", "c")
+        self.assertIsNone(self.cache.get("Mahomes stats"))
+        self.assertEqual(self.cache.get("Kelce stats"), "a")
+        stats = self.cache.stats()
+        self.assertEqual(
+            (stats["evictions"], stats["hits"], stats["misses"]), (1, 2, 1)
+        )
+        self.assertAlmostEqual(stats["hit_rate"], 2 / 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
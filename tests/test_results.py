@@ -0,0 +1,62 @@
+import unittest
+
+import pandas as pd
+from data.results import ResultSet, decode_cursor, encode_cursor
+
+
+class TestResultSet(unittest.TestCase):
+
+    def setUp(self):
+        self.frame = pd.DataFrame(
+            {
+                "team": ["KC", "NE", "KC", "BUF", "KC"],
+                "yards": [10, 20, 30, 40, 50],
+                "week": [1, 2, 3, 4, 5],
+            }
+        )
+
+    def test_page_is_bounded_and_projected(self):
+        page = ResultSet(self.frame, columns=["yards"], limit=2).page()
+        self.assertEqual(page["records"], [{"yards": 10}, {"yards": 20}])
+        self.assertEqual(page["total"], 5)
+        self.assertIsNotNone(page["next_cursor"])
+
+    def test_cursor_walks_every_row_once(self):
+        result = ResultSet(self.frame, limit=2)
+        seen, cursor = [], None
+        while True:
+            page = result.page(cursor=cursor)
+            seen.extend(r["week"] for r in page["records"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        self.assertEqual(seen, [1, 2, 3, 4, 5])
+        self.assertEqual(decode_cursor(encode_cursor(3)), 3)
+        self.assertEqual(decode_cursor("not-a-cursor"), 0)
+
+    def test_cursor_only_pages_its_own_dataset(self):
+        weekly = ResultSet(self.frame, limit=2, name="weekly_data")
+        cursor = weekly.page()["next_cursor"]
+        self.assertEqual(weekly.page(cursor=cursor)["offset"], 2)
+        snaps = ResultSet(self.frame, limit=2, cursor=cursor, name="snap_counts")
+        self.assertEqual(snaps.page()["offset"], 0)
+        self.assertEqual(decode_cursor(encode_cursor(3, "weekly_data")), 0)
+        self.assertEqual(
+            decode_cursor(encode_cursor(3, "weekly_data"), "weekly_data"), 3
+        )
+
+    def test_iteration_is_lazy_and_unbounded(self):
+        records = iter(ResultSet(self.frame, limit=1))
+        self.assertEqual(next(records)["week"], 1)
+        self.assertEqual(len(list(records)), 4)
+
+    def test_summary_aggregates_instead_of_listing(self):
+        summary = ResultSet(self.frame).summary()
+        self.assertEqual(summary["total"], 5)
+        self.assertEqual(summary["numeric"]["yards"]["sum"], 150)
+        self.assertEqual(summary["top_values"]["team"]["KC"], 3)
+        self.assertNotIn("records", summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import time
+import unittest
+from typing import Annotated
+
+from agent.routing import (
+    INTENT_NODES,
+    MERGE_NODE,
+    ROUTER_NAME,
+    branch_answers,
+    detect_intents,
+    merge_results,
+    named_intents,
+)
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import AnyMessage, add_messages
+from typing_extensions import TypedDict
+
+
+class _State(TypedDict):
+    messages: Annotated[list[AnyMessage], add_messages]
+
+
+def _slow_assistant(name, seconds=0.3):
+    def node(state):
+        time.sleep(seconds)
+        return {"messages": [AIMessage(content=f"{name} answer", name=name)]}
+
+    return node
+
+
+class TestDetectIntents(unittest.TestCase):
+
+    def test_compound_question_has_every_intent(self):
+        self.assertEqual(
+            detect_intents("Stats and latest news on Travis Kelce"), ["stats", "news"]
+        )
+        self.assertEqual(detect_intents("should I trade for him?"), ["trade"])
+        self.assertEqual(detect_intents("hello"), [])
+
+    def test_generic_keywords_do_not_add_a_branch(self):
+        self.assertEqual(detect_intents("team stats for KC"), ["stats"])
+        self.assertEqual(detect_intents("set my lineup for my team"), ["team"])
+
+    def test_intents_named_in_a_routing_reply(self):
+        self.assertEqual(
+            named_intents("I'll hand this to the News Assistant and Stats Assistant"),
+            ["stats", "news"],
+        )
+
+
+class TestParallelBranches(unittest.TestCase):
+
+    def test_branches_run_concurrently_and_merge(self):
+        graph = StateGraph(_State)
+        graph.add_node("stats_assistant", _slow_assistant("Stats Assistant"))
+        graph.add_node("news_assistant", _slow_assistant("News Assistant"))
+        graph.add_node(MERGE_NODE, merge_results)
+        graph.add_conditional_edges(
+            START,
+            lambda state: [
+                INTENT_NODES[i] for i in detect_intents(state["messages"][-1].content)
+            ],
+            ["stats_assistant", "news_assistant"],
+        )
+        graph.add_edge("stats_assistant", MERGE_NODE)
+        graph.add_edge("news_assistant", MERGE_NODE)
+        graph.add_edge(MERGE_NODE, END)
+
+        start = time.perf_counter()
+        state = graph.compile().invoke(
+            {"messages": [HumanMessage(content="stats and news on Kelce")]}
+        )
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.55)
+        merged = state["messages"][-1]
+        self.assertEqual(merged.name, "merged")
+        self.assertIn("Stats Assistant:\nStats Assistant answer", merged.content)
+        self.assertIn("News Assistant:\nNews Assistant answer", merged.content)
+
+    def test_single_branch_is_not_merged(self):
+        messages = [
+            HumanMessage(content="stats on Kelce"),
+            AIMessage(content="Routing to Stats Assistant", name=ROUTER_NAME),
+            AIMessage(content="Kelce had 8 catches", name="Stats Assistant"),
+        ]
+        self.assertEqual(
+            branch_answers(messages), {"Stats Assistant": "Kelce had 8 catches"}
+        )
+        self.assertEqual(merge_results({"messages": messages}), {"messages": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
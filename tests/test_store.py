@@ -0,0 +1,94 @@
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+from data import store
+from data.dataset_cache import DatasetCache, dataset_key
+from data.store import ParquetStore
+
+
+def import_weekly_data(years):
+    import_weekly_data.calls.append(list(years))
+    return pd.DataFrame(
+        {
+            "season": [y for y in years for _ in range(3)],
+            "week": [w for _ in years for w in (1, 2, 3)],
+            "team": [t for _ in years for t in ("KC", "NE", "KC")],
+            "yards": [10.0 * i for i in range(3 * len(years))],
+            "mixed": [v for _ in years for v in ("a", 1, None)],
+        }
+    )
+
+
+class TestParquetStore(unittest.TestCase):
+
+    def setUp(self):
+        import_weekly_data.calls = []
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ParquetStore(self.tmp.name)
+        self.key = dataset_key(import_weekly_data, {"years": [2023, 2024]})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_partitions_by_season_and_reads_projection(self):
+        self.store.write(self.key, import_weekly_data([2023, 2024]))
+        self.assertEqual(self.store.seasons(self.key), [2023, 2024])
+
+        frame = self.store.read(
+            self.key,
+            seasons=[2024],
+            columns=["week", "yards"],
+            filters=[("team", "==", "KC")],
+        )
+        self.assertEqual(list(frame.columns), ["week", "yards"])
+        self.assertEqual(frame["week"].tolist(), [1, 3])
+
+    def test_object_columns_read_back_with_their_types(self):
+        frame = pd.DataFrame(
+            {
+                "season": [2023, 2023, 2024],
+                "flag": [True, None, False],
+                "count": [1, 2, None],
+                "mixed": ["a", 1, None],
+            }
+        ).astype({"count": object})
+        self.store.write(self.key, frame)
+        self.store.append(self.key, frame.tail(1), 2024)
+
+        read = self.store.read(self.key)
+        self.assertEqual(read["flag"].tolist(), [True, None, False, False])
+        self.assertEqual(read["count"].tolist()[:2], [1, 2])
+        self.assertTrue(read["count"].iloc[2:].isna().all())
+        # Mixed columns have no single type to restore
+        self.assertEqual(read["mixed"].tolist()[:2], ["a", "1"])
+
+    def test_memory_maps_are_closed_after_reading(self):
+        self.store.write(self.key, import_weekly_data([2023, 2024]))
+        maps, original = [], store._mmap_open
+
+        def mmap_open(path, *args):
+            maps.append(original(path, *args))
+            return maps[-1]
+
+        with patch.object(store, "_mmap_open", mmap_open):
+            frame = self.store.read(self.key, columns=["week", "yards"])
+        self.assertEqual(len(frame), 6)
+        self.assertTrue(maps)
+        self.assertTrue(all(m.closed for m in maps))
+
+    def test_cache_only_fetches_missing_seasons(self):
+        cache = DatasetCache(self.tmp.name)
+        cache.get(import_weekly_data, {"years": [2023]})
+        frame = cache.get(import_weekly_data, {"years": [2023, 2024]})
+        self.assertEqual(import_weekly_data.calls, [[2023], [2024]])
+        self.assertEqual(sorted(frame["season"].unique()), [2023, 2024])
+
+        cache.invalidate(import_weekly_data, {"years": [2024]}, seasons=[2024])
+        cache.get(import_weekly_data, {"years": [2023, 2024]})
+        self.assertEqual(import_weekly_data.calls[-1], [2024])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import io
+import unittest
+from typing import Annotated
+
+from agent import streaming
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import AnyMessage, add_messages
+from typing_extensions import TypedDict
+
+
+class _State(TypedDict):
+    messages: Annotated[list[AnyMessage], add_messages]
+
+
+def _token(node, content):
+    return {"event": streaming.TOKEN, "node": node, "content": content}
+
+
+def _node(node):
+    return {"event": streaming.NODE, "node": node}
+
+
+class TestGraphEvents(unittest.TestCase):
+
+    def test_tokens_arrive_before_the_node_finishes(self):
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content="Kelce had 8")]))
+
+        def assistant(state):
+            return {"messages": [llm.invoke(state["messages"])]}
+
+        graph = StateGraph(_State)
+        graph.add_node("stats_assistant", assistant)
+        graph.add_edge(START, "stats_assistant")
+        graph.add_edge("stats_assistant", END)
+        chunks = graph.compile().stream(
+            {"messages": [HumanMessage(content="Kelce stats")]},
+            stream_mode=streaming.STREAM_MODES,
+        )
+
+        events = list(
+            streaming.graph_events(chunks, lambda state: state["messages"][-1].content)
+        )
+
+        self.assertEqual(
+            events,
+            [
+                _token("stats_assistant", "Kelce"),
+                _token("stats_assistant", " "),
+                _token("stats_assistant", "had"),
+                _token("stats_assistant", " "),
+                _token("stats_assistant", "8"),
+                _node("stats_assistant"),
+                {"event": streaming.RESPONSE, "content": "Kelce had 8"},
+            ],
+        )
+
+
+class TestRenderStream(unittest.TestCase):
+
+    def test_parallel_branches_are_not_interleaved(self):
+        out = io.StringIO()
+        events = [
+            _token("main_assistant", "Routing"),
+            _node("main_assistant"),
+            _token("stats_assistant", "8 "),
+            _token("news_assistant", "Questionable "),
+            _token("stats_assistant", "catches"),
+            _token("news_assistant", "for Sunday"),
+            _node("news_assistant"),
+            _node("stats_assistant"),
+            {"event": streaming.RESPONSE, "content": "merged"},
+        ]
+        self.assertEqual(streaming.render_stream(events, out), "merged")
+        self.assertEqual(
+            out.getvalue(), "Routing\n\n8 catches\n\nQuestionable for Sunday"
+        )
+
+    def test_cached_response_is_written_whole(self):
+        out = io.StringIO()
+        streaming.render_stream(
+            [{"event": streaming.RESPONSE, "content": "8 catches"}], out
+        )
+        self.assertEqual(out.getvalue(), "8 catches")
+
+
+if __name__ == "__main__":
+    unittest.main()
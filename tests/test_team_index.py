@@ -0,0 +1,47 @@
+import unittest
+
+import pandas as pd
+from data.team_index import TeamIndex, normalize_team
+
+
+class TestTeamIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = TeamIndex()
+        self.index.add_frame(
+            "injuries",
+            pd.DataFrame({"team": ["KC", "NE", "KC"], "full_name": ["A", "B", "C"]}),
+        )
+        self.index.add_frame(
+            "schedules",
+            pd.DataFrame(
+                {
+                    "game_id": ["g1", "g2", "g3"],
+                    "away_team": ["KC", "BUF", "NE"],
+                    "home_team": ["BAL", "KC", "KC"],
+                }
+            ),
+        )
+        self.index.add_frame("draft_values", pd.DataFrame({"pick": [1, 2]}))
+
+    def test_normalize_team(self):
+        self.assertEqual(normalize_team(" kc "), "KC")
+        self.assertEqual(normalize_team("jac"), "JAX")
+        self.assertEqual(normalize_team("Chiefs"), "KC")
+
+    def test_lowercase_lookup_returns_team_rows(self):
+        found = self.index.lookup("kc")
+        self.assertEqual(found["injuries"]["full_name"].tolist(), ["A", "C"])
+        self.assertNotIn("draft_values", found)
+
+    def test_schedule_includes_home_and_away_games_in_order(self):
+        self.assertEqual(
+            self.index.lookup("KC")["schedules"]["game_id"].tolist(), ["g1", "g2", "g3"]
+        )
+        self.assertEqual(
+            self.index.lookup("BAL")["schedules"]["game_id"].tolist(), ["g1"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()